@@ -61,6 +61,11 @@ config.register('cpp-dump-files', False, env_variable='LOKI_CPP_DUMP_FILES',
 config.register('omni-dump-xml', False, env_variable='LOKI_OMNI_DUMP_XML',
                 preprocess=lambda i: bool(i) if isinstance(i, int) else i)
 
+# Causes OMNI frontend to convert XML output incrementally for each program unit,
+# without storing the full XML tree as the AST of the source file
+config.register('omni-stream-xml', False, env_variable='LOKI_OMNI_STREAM_XML',
+                preprocess=lambda i: bool(i) if isinstance(i, int) else i)
+
 # Enable strict frontend behaviour (fail on unknown/unsupported language features)
 config.register('frontend-strict-mode', False, env_variable='LOKI_FRONTEND_STRICT_MODE',
                 preprocess=lambda i: bool(i) if isinstance(i, int) else i)
@@ -70,10 +75,22 @@ config.register('frontend-strict-mode', False, env_variable='LOKI_FRONTEND_STRIC
 config.register('disk-cache', False, env_variable='LOKI_DISK_CACHE',
                 preprocess=lambda i: bool(i) if isinstance(i, int) else i)
 
+# Directory for a content-addressed cache of parsed and C-preprocessed source
+# files, which allows re-using the IR of unchanged files (disabled if not set)
+config.register('parse-cache-dir', None, env_variable='LOKI_PARSE_CACHE_DIR')
+
+# Maximum size of the parse cache in MB, evicting least recently used entries first
+config.register('parse-cache-size', 2048, env_variable='LOKI_PARSE_CACHE_SIZE', preprocess=int)
+
 # Force symbol comparison and object equality to be case sensitive
 config.register('case-sensitive', False, env_variable='LOKI_CASE_SENSITIVE',
                 preprocess=lambda i: bool(i) if isinstance(i, int) else i)
 
+# Validate the constructor arguments of IR nodes, which can be disabled
+# to speed up the construction and rebuilding of large control flow trees
+config.register('ir-validation', True, env_variable='LOKI_IR_VALIDATION',
+                callback=set_ir_validation, preprocess=lambda i: bool(int(i)) if isinstance(i, str) else bool(i))
+
 # Specify a timeout for the REGEX frontend to catch catastrophic backtracking
 config.register('regex-frontend-timeout', 30, env_variable='LOKI_REGEX_FRONTEND_TIMEOUT', preprocess=int)
 
@@ -8,3 +8,5 @@
 from loki.bulk.scheduler import * # noqa
 from loki.bulk.item import * # noqa
 from loki.bulk.configure import * # noqa
+from loki.bulk.discovery import * # noqa
+from loki.bulk.manifest import * # noqa
@@ -0,0 +1,133 @@
+# (C) Copyright 2018- ECMWF.
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+"""
+Persistent on-disk index of the results of the :any:`Scheduler`'s initial
+source scan, to avoid re-scanning unchanged files between invocations.
+"""
+
+import os
+import pickle
+from pathlib import Path
+
+from loki.frontend import read_file
+from loki.logging import debug, warning
+from loki.tools import filehash
+
+
+__all__ = ['DiscoveryIndex']
+
+
+class DiscoveryIndex:
+    """
+    Persistent index that maps source file paths to the light-weight
+    :any:`Sourcefile` objects created by the :any:`REGEX` frontend during
+    the :any:`Scheduler`'s source discovery.
+
+    Each entry is keyed by the file path and stores the file's modification
+    time, size and a hash of its content. An entry is re-used if either
+    modification time and size are unchanged, or the content hash is identical.
+
+    The index is stored as a single pickle file. The :data:`signature`
+    captures all options that affect the result of the scan (e.g.,
+    preprocessing settings). If it does not match the signature of the
+    stored index, all entries are discarded. Note that changes to header
+    files that are included during preprocessing are not tracked.
+
+    Parameters
+    ----------
+    path : str or :any:`pathlib.Path`
+        The file path of the index
+    signature : tuple, optional
+        Hashable description of the options used for the source scan
+    """
+
+    _version = 1
+
+    def __init__(self, path, signature=None):
+        self.path = Path(path)
+        self.signature = (self._version, signature)
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        """
+        Load the index from disk, discarding it if it is unreadable or
+        has been created with a different :attr:`signature`
+        """
+        self.entries = {}
+        if not self.path.exists():
+            return
+
+        try:
+            with self.path.open('rb') as f:
+                signature, entries = pickle.load(f)
+        except Exception as e:  # pylint: disable=broad-except
+            warning(f'[Loki::Scheduler] Discarding unreadable discovery index {self.path}: {e}')
+            return
+
+        if signature != self.signature:
+            debug(f'[Loki::Scheduler] Discarding outdated discovery index {self.path}')
+            return
+        self.entries = entries
+
+    def write(self):
+        """
+        Write the index to disk
+
+        The index is written to a temporary file first, which then replaces
+        the existing index to avoid corruption from concurrent or aborted runs.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+        with tmp_path.open('wb') as f:
+            pickle.dump((self.signature, self.entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+
+    def lookup(self, filepath):
+        """
+        Return the indexed :any:`Sourcefile` for :data:`filepath` if the file is unchanged
+
+        Parameters
+        ----------
+        filepath : :any:`pathlib.Path`
+            The path of the source file
+
+        Returns
+        -------
+        :any:`Sourcefile` or `None`
+            The indexed object or `None` if the file is not indexed or has changed
+        """
+        entry = self.entries.get(str(filepath))
+        if entry is None:
+            return None
+
+        mtime, size, content_hash, obj = entry
+        stat = filepath.stat()
+        if (stat.st_mtime_ns, stat.st_size) == (mtime, size):
+            return obj
+
+        # Only the time stamp changed (e.g. after a checkout): compare the content
+        if filehash(read_file(filepath)) == content_hash:
+            self.entries[str(filepath)] = (stat.st_mtime_ns, stat.st_size, content_hash, obj)
+            return obj
+        return None
+
+    def update(self, filepath, obj):
+        """
+        Store the :any:`Sourcefile` :data:`obj` as the scan result for :data:`filepath`
+        """
+        stat = filepath.stat()
+        content_hash = filehash(read_file(filepath))
+        self.entries[str(filepath)] = (stat.st_mtime_ns, stat.st_size, content_hash, obj)
+
+    def prune(self, filepaths):
+        """
+        Remove all entries for files that are not in :data:`filepaths`
+        """
+        keep = {str(p) for p in filepaths}
+        self.entries = {k: v for k, v in self.entries.items() if k in keep}
@@ -6,6 +6,7 @@
 # nor does it submit to any jurisdiction.
 
 from abc import abstractmethod
+from collections.abc import Set
 from fnmatch import fnmatch
 try:
     from functools import cached_property
@@ -360,7 +361,8 @@ class Item:
             A list of local or fully-qualified names to process
         available_names: list of str, optional
             A list of all available fully-qualified names, to be provided, e.g.,
-            by the :any:`Scheduler`
+            by the :any:`Scheduler`. Set-like objects, such as the keys view of
+            a dictionary, are used as-is to avoid copying.
 
         Returns
         -------
@@ -417,7 +419,8 @@ class Item:
         if available_names is None:
             return as_tuple(qualified_names)
 
-        available_names = set(available_names)
+        if not isinstance(available_names, Set):
+            available_names = set(available_names)
         def map_to_available_name(candidates):
             # Resolve a tuple of candidate names by picking the matching name
             # from available_names
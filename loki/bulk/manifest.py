@@ -0,0 +1,152 @@
+# (C) Copyright 2018- ECMWF.
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+"""
+Persistent record of the inputs and transformations of a previous
+:any:`Scheduler` run, to enable incremental re-processing.
+"""
+
+import os
+import pickle
+from hashlib import md5
+from pathlib import Path
+
+from loki.logging import debug, warning
+
+
+__all__ = ['ProcessingManifest']
+
+
+class ProcessingManifest:
+    """
+    Persistent manifest that records a fingerprint for every item
+    processed by a :any:`Scheduler` and the chain of transformations
+    that have been applied to them.
+
+    The fingerprint of an item consists of an input fingerprint, which is
+    derived from its source file and configuration, and the digests of the
+    ``trafo_data`` the item has received from other items before each
+    traversal of the graph. In addition, the manifest stores the received
+    and resulting ``trafo_data`` of each item in every traversal.
+
+    If a manifest is given to the :any:`Scheduler`, items whose input
+    fingerprint is unchanged since the previous run, and which do not depend
+    on items with changed input fingerprints, are skipped in
+    :meth:`Scheduler.process` for as long as they receive the same
+    ``trafo_data`` as in the previous run. Their resulting ``trafo_data`` is
+    restored from the manifest and the output files of these items from the
+    previous run are re-used.
+
+    The :data:`signature` captures all configuration options that affect the
+    result of the transformations (e.g., command line options of a script and
+    the content of the scheduler config file). If it does not match the
+    signature of the stored manifest, all entries are discarded and all items
+    are processed.
+
+    Parameters
+    ----------
+    path : str or :any:`pathlib.Path`
+        The file path of the manifest
+    signature : str or tuple, optional
+        Hashable description of the configuration of the transformation pipeline
+    """
+
+    _version = 2
+
+    def __init__(self, path, signature=None):
+        self.path = Path(path)
+        self.signature = (self._version, signature)
+        self.fingerprints = {}
+        self.trafo_data = {}
+        self.chain = ()
+        self.load()
+
+    def load(self):
+        """
+        Load the manifest from disk, discarding it if it is unreadable or
+        has been created with a different :attr:`signature`
+        """
+        self.fingerprints = {}
+        self.trafo_data = {}
+        self.chain = ()
+        if not self.path.exists():
+            return
+
+        try:
+            with self.path.open('rb') as f:
+                signature, fingerprints, trafo_data, chain = pickle.load(f)
+        except Exception as e:  # pylint: disable=broad-except
+            warning(f'[Loki::Scheduler] Discarding unreadable processing manifest {self.path}: {e}')
+            return
+
+        if signature != self.signature:
+            debug(f'[Loki::Scheduler] Discarding outdated processing manifest {self.path}')
+            return
+        self.fingerprints = fingerprints
+        self.trafo_data = trafo_data
+        self.chain = chain
+
+    def write(self):
+        """
+        Write the manifest to disk
+
+        The manifest is written to a temporary file first, which then replaces
+        the existing manifest to avoid corruption from concurrent or aborted runs.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+        with tmp_path.open('wb') as f:
+            pickle.dump(
+                (self.signature, self.fingerprints, self.trafo_data, self.chain), f,
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(tmp_path, self.path)
+
+    def discard(self):
+        """
+        Remove all entries and delete the manifest file, which enforces
+        a full processing run in the next invocation
+        """
+        self.fingerprints = {}
+        self.trafo_data = {}
+        self.chain = ()
+        if self.path.exists():
+            self.path.unlink()
+
+    @staticmethod
+    def transformation_fingerprint(transformation):
+        """
+        Return the fingerprint of a :any:`Transformation` in the chain
+
+        This identifies the transformation class and its traversal properties.
+        Options passed to the transformation's constructor are not included
+        and need to be captured in the manifest's :attr:`signature`.
+        """
+        cls = type(transformation)
+        return (
+            f'{cls.__module__}.{cls.__qualname__}', transformation.reverse_traversal,
+            transformation.traverse_file_graph, transformation.process_ignored_items
+        )
+
+    @staticmethod
+    def trafo_data_state(trafo_data):
+        """
+        Return the serialized state of the ``trafo_data`` of an item, or `None`
+        if it cannot be serialized
+        """
+        try:
+            return pickle.dumps(trafo_data, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+    @staticmethod
+    def trafo_data_digest(state):
+        """
+        Return the digest of a serialized ``trafo_data`` state, as stored
+        in the fingerprint of an item
+        """
+        return None if state is None else md5(state).hexdigest()
@@ -5,25 +5,104 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+import pickle
 from os.path import commonpath
 from pathlib import Path
 from collections import deque, defaultdict
+from concurrent.futures import wait, FIRST_COMPLETED
 import networkx as nx
 from codetiming import Timer
 
-from loki.bulk.item import ProcedureBindingItem, SubroutineItem, GlobalVarImportItem, GenericImportItem
+from loki.bulk.item import (
+    Item, ProcedureBindingItem, SubroutineItem, GlobalVarImportItem, GenericImportItem
+)
 from loki.bulk.configure import SchedulerConfig
-from loki.frontend import FP, REGEX, RegexParserClass
+from loki.bulk.discovery import DiscoveryIndex
+from loki.bulk.manifest import ProcessingManifest
+from loki.build.workqueue import workqueue
+from loki.frontend import FP, OMNI, REGEX, RegexParserClass, read_file
 from loki.sourcefile import Sourcefile
-from loki.tools import as_tuple, CaseInsensitiveDict, flatten
+from loki.tools import as_tuple, CaseInsensitiveDict, flatten, filehash
 from loki.logging import info, perf, warning, debug
 from loki.subroutine import Subroutine
 from loki.module import Module
+from loki.program_unit import EnrichmentContext
 
 
 __all__ = ['Scheduler']
 
 
+def _make_complete(sources, xmod_sources=None, **frontend_args):
+    """
+    Trigger a full parse of each of the given :any:`Sourcefile` objects and
+    return them
+
+    This is used as a task for worker processes in :meth:`Scheduler._parse_items`.
+    Definitions from files parsed earlier in the list are made available to
+    subsequent files. Before that, the ``.xmod`` files for the modules in
+    :data:`xmod_sources`, given as tuples of file path and source string,
+    are generated with the :any:`OMNI` frontend, using the same preprocessing
+    as :meth:`Sourcefile.from_omni`.
+    """
+    for path, string in as_tuple(xmod_sources):
+        Sourcefile.generate_omni_xmods(
+            string, filepath=path, includes=frontend_args.get('includes'),
+            defines=frontend_args.get('defines'), xmods=frontend_args.get('xmods'),
+            omni_includes=frontend_args.get('omni_includes')
+        )
+
+    definitions = as_tuple(frontend_args.pop('definitions', None))
+    for source in sources:
+        source.make_complete(definitions=definitions, **frontend_args)
+        definitions += source.definitions
+    return sources
+
+
+def _xmods_up_to_date(source, xmods):
+    """
+    Check whether ``.xmod`` files for all modules in the given :any:`Sourcefile`
+    exist in one of the :data:`xmods` directories and are newer than the source file
+    """
+    mtime = source.path.stat().st_mtime_ns
+    for module in source.modules:
+        xmod_files = [Path(path)/f'{module.name.lower()}.xmod' for path in as_tuple(xmods)]
+        if not any(f.exists() and f.stat().st_mtime_ns >= mtime for f in xmod_files):
+            return False
+    return True
+
+
+def _imported_module_names(source):
+    """
+    Return the lower-case names of all modules imported in the given
+    :any:`Sourcefile`, including imports in contained program units
+    """
+    names = set()
+    units = list(source.definitions)
+    while units:
+        unit = units.pop()
+        names |= {imprt.module.lower() for imprt in unit.imports}
+        units += list(unit.subroutines)
+    return names
+
+
+def _apply_transformations(transformations, items, successors, depths):
+    """
+    Apply :data:`transformations` in turn to each of the given items and return
+    their updated :any:`Sourcefile` and ``trafo_data``
+
+    This is used as a task for worker processes in :meth:`Scheduler._process_parallel`.
+    All items belong to the same source file.
+    """
+    for item, item_successors in zip(items, successors):
+        for transformation in transformations:
+            source = item.routine if isinstance(item, SubroutineItem) else item.scope
+            transformation.apply(
+                source, role=item.role, mode=item.mode, item=item, targets=item.targets,
+                successors=item_successors, depths=depths
+            )
+    return items[0].source, [item.trafo_data for item in items]
+
+
 class Scheduler:
     """
     Work queue manager to enqueue and process individual `Item`
@@ -64,6 +143,23 @@ class Scheduler:
         By default a full parse is executed, use this flag to suppress.
     frontend : :any:`Frontend`, optional
         Frontend to use when parsing source files (default :any:`FP`).
+    num_workers : int, optional
+        Number of worker processes to use for the initial source scan with
+        the :any:`REGEX` frontend, the full parse of source files and the
+        application of :any:`Transformation.item_local` transformations.
+        By default, all files and items are processed serially. With the
+        :any:`OMNI` frontend and :data:`xmods`, the parallel parse also
+        generates missing or outdated ``.xmod`` files for imported modules
+        that are not part of the item graph.
+    discovery_index : str or :any:`pathlib.Path`, optional
+        Path to a persistent :any:`DiscoveryIndex` file (e.g., in the build
+        directory) that stores the results of the initial source scan. If given,
+        only new or modified files are re-scanned in subsequent invocations.
+    manifest : :any:`ProcessingManifest`, optional
+        Manifest of a previous run for incremental re-processing. If given,
+        :meth:`process` skips all items that are unaffected by changes
+        since the previous run and receive the same ``trafo_data``, and
+        :meth:`write_manifest` records the current run.
 
     Attributes
     ----------
@@ -76,7 +172,8 @@ class Scheduler:
 
     def __init__(self, paths, config=None, seed_routines=None, preprocess=False,
                  includes=None, defines=None, definitions=None, xmods=None,
-                 omni_includes=None, full_parse=True, frontend=FP):
+                 omni_includes=None, full_parse=True, frontend=FP, num_workers=None,
+                 discovery_index=None, manifest=None):
         # Derive config from file or dict
         if isinstance(config, SchedulerConfig):
             self.config = config
@@ -86,6 +183,19 @@ class Scheduler:
             self.config = SchedulerConfig.from_dict(config)
 
         self.full_parse = full_parse
+        self.num_workers = num_workers
+        self.discovery_index = discovery_index
+        self.manifest = manifest
+
+        # Item fingerprints, applied transformations and recorded trafo_data
+        # for incremental processing
+        self._fingerprints = None
+        self._chain = []
+        self._groups = []
+        self._skipped_items = set()
+        self._applied_groups = {}
+        self._trafo_data_records = {}
+        self._incremental_graph = None
 
         # Build-related arguments to pass to the sources
         self.paths = [Path(p) for p in as_tuple(paths)]
@@ -105,6 +215,9 @@ class Scheduler:
         self.item_graph = nx.DiGraph()
         self.item_map = {}
 
+        # Derived views of the callgraph, computed on demand
+        self._graph_cache = {}
+
         self._discover()
 
         if not seed_routines:
@@ -119,12 +232,6 @@ class Scheduler:
             # Attach interprocedural call-tree information
             self._enrich()
 
-        topological_generations = list(nx.topological_generations(self.item_graph))
-        self.depths = {}
-        for i_gen, gen in enumerate(topological_generations):
-            for item in gen:
-                self.depths[item] = i_gen
-
     @Timer(logger=info, text='[Loki::Scheduler] Performed initial source scan in {:.2f}s')
     def _discover(self):
         # Scan all source paths and create light-weight `Sourcefile` objects for each file.
@@ -138,10 +245,35 @@ class Scheduler:
 
         # Create a list of initial files to scan with the fast REGEX frontend
         path_list = [path.glob(f'**/*{ext}') for path in self.paths for ext in self.source_suffixes]
-        path_list = list(set(flatten(path_list)))  # Filter duplicates and flatten
-
-        # Perform the full initial scan of the search space with the REGEX frontend
-        obj_list = [Sourcefile.from_file(filename=f, **frontend_args) for f in path_list]
+        path_list = sorted(set(flatten(path_list)))  # Filter duplicates and flatten
+
+        # Re-use the scan results for unchanged files from a persistent index
+        index = None
+        obj_cache = {}
+        if self.discovery_index:
+            signature = tuple((k, str(v)) for k, v in frontend_args.items())
+            index = DiscoveryIndex(self.discovery_index, signature=signature)
+            obj_cache = {f: index.lookup(f) for f in path_list}
+            obj_cache = {f: obj for f, obj in obj_cache.items() if obj is not None}
+            info(f'[Loki::Scheduler] Re-using {len(obj_cache)} of {len(path_list)} files from discovery index')
+
+        # Perform the full initial scan of the search space with the REGEX frontend,
+        # optionally distributing files across a pool of worker processes. Results are
+        # collected in the order of `path_list` to keep the `obj_map` deterministic
+        scan_list = [f for f in path_list if f not in obj_cache]
+        workers = self.num_workers if self.num_workers and self.num_workers > 1 else None
+        with workqueue(workers=workers) as q:
+            scanned = [q.call(Sourcefile.from_file, filename=f, **frontend_args) for f in scan_list]
+            if workers:
+                scanned = [task.result() for task in scanned]
+        obj_cache.update(zip(scan_list, scanned))
+        obj_list = [obj_cache[f] for f in path_list]
+
+        if index is not None:
+            for f, obj in zip(scan_list, scanned):
+                index.update(f, obj)
+            index.prune(path_list)
+            index.write()
 
         debug(f'Total number of lines parsed: {sum(obj.source.lines[1] for obj in obj_list)}')
 
@@ -160,6 +292,11 @@ class Scheduler:
             for r in module.interfaces if r.spec
         )
 
+        # Index the fully-qualified names in obj_map by their local name for fast lookup
+        self._obj_map_candidates = defaultdict(list)
+        for name in self.obj_map:
+            self._obj_map_candidates[name[name.index('#')+1:].lower()] += [name]
+
     @property
     def routines(self):
         return as_tuple(item.routine for item in self.item_graph.nodes if item.routine is not None)
@@ -195,15 +332,52 @@ class Scheduler:
             for definition in item.source.definitions
         )
 
+    def _invalidate_graph_cache(self):
+        """
+        Discard the cached derived views of the item graph, i.e., :attr:`file_graph`,
+        :attr:`depths` and the results of :meth:`item_successors`
+
+        This must be called whenever the item graph is modified.
+        """
+        self._graph_cache = {}
+
+    @property
+    def depths(self):
+        """
+        Depth of each item according to the topological generations
+        (stratified item graph)
+
+        Returns
+        -------
+        dict
+        """
+        if 'depths' not in self._graph_cache:
+            self._graph_cache['depths'] = {
+                item: i_gen
+                for i_gen, gen in enumerate(nx.topological_generations(self.item_graph))
+                for item in gen
+            }
+        return self._graph_cache['depths']
+
     @property
     def file_graph(self):
         """
         Alternative dependency graph based on relations between source files
 
+        The graph is computed once and cached until the item graph is modified.
+
         Returns
         -------
         nx.DiGraph
         """
+        if 'file_graph' not in self._graph_cache:
+            self._graph_cache['file_graph'] = self._build_file_graph()
+        return self._graph_cache['file_graph']
+
+    def _build_file_graph(self):
+        """
+        Build the :attr:`file_graph` from the item graph
+        """
         paths = {item.path for item in self.item_graph}
         basepath = Path(commonpath([str(p) for p in paths]))
         paths_map = {p: p.relative_to(basepath) for p in paths}
@@ -226,15 +400,15 @@ class Scheduler:
 
         return file_graph
 
-
     def __getitem__(self, name):
         """
         Find and return an item in the Scheduler's call graph
         """
-        for item in self.items:
-            if item == name:
-                return item
-        return None
+        if isinstance(name, Item):
+            name = name.name
+        if not isinstance(name, str):
+            return None
+        return self.item_map.get(name.lower())
 
     def create_item(self, name):
         """
@@ -326,12 +500,11 @@ class Scheduler:
             The fully-qualified name corresponding to :data:`routine` from
             the set of discovered routines
         """
-        if '#' in routine:
-            name = routine.lower()
-        else:
-            name = f'#{routine.lower()}'
-
-        candidates = [c for c in self.obj_map if c.lower().endswith(name)]
+        scope_name, _, local_name = routine.lower().rpartition('#')
+        candidates = self._obj_map_candidates.get(local_name, [])
+        if scope_name:
+            # Match all candidates whose scope name ends with the given scope name
+            candidates = [c for c in candidates if c[:c.index('#')].lower().endswith(scope_name)]
         if not candidates:
             warning(f'Scheduler could not find routine {routine}')
             if self.config.default['strict']:
@@ -412,6 +585,8 @@ class Scheduler:
             if new_items:
                 queue.extend(new_items)
 
+        self._invalidate_graph_cache()
+
     def _break_cycles(self):
         """
         Remove cyclic dependencies by deleting the first outgoing edge of
@@ -427,6 +602,8 @@ class Scheduler:
                 except nx.NetworkXNoCycle:
                     pass
 
+        self._invalidate_graph_cache()
+
     def add_dependencies(self, dependencies):
         """
         Add new dependencies to the item graph
@@ -459,6 +636,8 @@ class Scheduler:
             if new_items:
                 queue.extend(new_items)
 
+        self._invalidate_graph_cache()
+
         if self.full_parse:
             self._parse_items()
             self._enrich()
@@ -472,16 +651,187 @@ class Scheduler:
         # Force the parsing of the routines
         build_args = self.build_args.copy()
         build_args['definitions'] = as_tuple(build_args['definitions']) + self.definitions
+
+        if self.num_workers and self.num_workers > 1:
+            self._parse_items_parallel(build_args)
+            return
+
+        # Keep track of the parsed definitions, as source files loaded from
+        # the parse cache replace their incomplete program units
+        definitions = CaseInsensitiveDict((d.name, d) for d in build_args['definitions'])
+        parsed = []
         for item in reversed(list(nx.topological_sort(self.item_graph))):
-            item.source.make_complete(**build_args)
+            if item.source._incomplete:
+                build_args['definitions'] = tuple(definitions.values())
+                item.source.make_complete(**build_args)
+                definitions.update((d.name, d) for d in item.source.definitions)
+                parsed += [item.source]
+
+        self._clear_item_properties(parsed)
+
+    def _parse_items_parallel(self, build_args):
+        """
+        Trigger the full parse of all source files in the item graph using
+        a pool of :attr:`num_workers` worker processes
+
+        Source files are parsed in reversed topological order of the dependencies
+        between files, such that definitions are always available before a
+        dependent file is parsed. Each file is submitted to the worker pool as
+        soon as all its dependencies have been parsed, and shipped back as a
+        pickled :any:`Sourcefile` object (without AST), which replaces the state
+        of the incomplete object in place. Source files with cyclic dependencies
+        between them are parsed together in a single task.
+
+        With the :any:`OMNI` frontend and an ``xmods`` directory, modules that
+        are imported by the parsed files, directly or indirectly, but that are not
+        part of the item graph are added to the dependency graph as well. For these,
+        only the ``.xmod`` files are generated, unless existing ``.xmod`` files are
+        newer than the source file and none of their dependencies has changed.
+
+        Afterwards, imports and derived types of all parsed program units are
+        re-linked to the definitions in this process, as each worker only
+        operates on copies.
+        """
+        # Build the dependency graph between source files
+        sources = {}
+        file_graph = nx.DiGraph()
+        for item in self.item_graph:
+            sources[item.source.path] = item.source
+            file_graph.add_node(item.source.path)
+        for parent, child in self.item_graph.edges:
+            if parent.source.path != child.source.path:
+                file_graph.add_edge(parent.source.path, child.source.path)
+
+        xmods = build_args.get('xmods')
+        xmod_paths = set()
+        if build_args.get('frontend') == OMNI and xmods:
+            xmod_paths = self._add_module_dependencies(file_graph, sources)
+
+        # Collapse cycles and count the unparsed dependencies of each group of files
+        file_graph = nx.condensation(file_graph)
+        num_dependencies = {component: file_graph.out_degree(component) for component in file_graph}
+        ready = deque(component for component in file_graph if not num_dependencies[component])
+        changed = set()
+
+        definitions = CaseInsensitiveDict((d.name, d) for d in as_tuple(build_args['definitions']))
+        parsed = []
+        tasks = {}
+        with workqueue(workers=self.num_workers) as q:
+            while ready or tasks:
+                while ready:
+                    component = ready.popleft()
+                    paths = sorted(file_graph.nodes[component]['members'])
+                    parse_paths = [path for path in paths if path not in xmod_paths and sources[path]._incomplete]
+
+                    # Re-use xmods of unchanged files if no dependency has changed
+                    xmod_sources = [
+                        (path, sources[path].source.string) for path in paths if path in xmod_paths
+                    ]
+                    if xmod_sources and not parse_paths and all(
+                        _xmods_up_to_date(sources[path], xmods) for path, _ in xmod_sources
+                    ) and not any(c in changed for c in file_graph.successors(component)):
+                        xmod_sources = []
+
+                    if not parse_paths and not xmod_sources:
+                        ready += self._finish_component(file_graph, component, num_dependencies)
+                        continue
+
+                    # Only ship the definitions of modules that are imported in these files
+                    imported = set().union(*(_imported_module_names(sources[path]) for path in parse_paths))
+                    task_args = build_args.copy()
+                    task_args['definitions'] = tuple(definitions[name] for name in imported if name in definitions)
+                    task = q.call(
+                        _make_complete, [sources[path] for path in parse_paths],
+                        xmod_sources=xmod_sources, **task_args
+                    )
+                    tasks[task] = (component, parse_paths)
+                    changed.add(component)
+
+                # Merge the parsed source files back into the original objects
+                done, _ = wait(tasks, return_when=FIRST_COMPLETED)
+                for task in done:
+                    component, paths = tasks.pop(task)
+                    for path, source in zip(paths, task.result()):
+                        sources[path].__dict__.update(source.__dict__)
+                        definitions.update((d.name, d) for d in sources[path].definitions)
+                        parsed += [sources[path]]
+                    ready += self._finish_component(file_graph, component, num_dependencies)
+
+        # Re-link imported definitions and derived types to the objects in this process
+        definitions = EnrichmentContext(tuple(definitions.values()))
+        for source in parsed:
+            source.relink_definitions(definitions)
+
+        self._clear_item_properties(parsed)
+
+    @staticmethod
+    def _finish_component(file_graph, component, num_dependencies):
+        """
+        Mark a group of files in the condensed file graph as parsed and return
+        the groups of dependent files that have become ready for parsing
+        """
+        ready = []
+        for dependent in file_graph.predecessors(component):
+            num_dependencies[dependent] -= 1
+            if not num_dependencies[dependent]:
+                ready += [dependent]
+        return ready
+
+    def _add_module_dependencies(self, file_graph, sources):
+        """
+        Add the source files of all modules imported by the files in
+        :data:`file_graph` and the corresponding dependencies to the graph,
+        based on the results of the initial source scan
+
+        Parameters
+        ----------
+        file_graph : :any:`networkx.DiGraph`
+            Dependency graph between source file paths, which is extended in-place
+        sources : dict
+            Map of file paths to :any:`Sourcefile` objects, which is extended in-place
+
+        Returns
+        -------
+        set of :any:`pathlib.Path`
+            The paths of the files that have been added to the graph
+        """
+        module_sources = {
+            module.name.lower(): obj
+            for obj in set(self.obj_map.values()) for module in obj.modules
+        }
 
+        added = set()
+        queue = list(sources.values())
+        while queue:
+            source = queue.pop()
+            for name in sorted(_imported_module_names(source)):
+                module_source = module_sources.get(name)
+                if module_source is None or module_source.path == source.path:
+                    continue
+                if module_source.path not in sources:
+                    sources[module_source.path] = module_source
+                    added.add(module_source.path)
+                    queue += [module_source]
+                file_graph.add_edge(source.path, module_source.path)
+        return added
+
+    def _clear_item_properties(self, sources):
+        """
+        Reset cached properties of all items in the given :any:`Sourcefile`
+        objects that may still refer to the incomplete IR from before parsing
+        """
+        paths = {source.path for source in sources}
+        for item in self.item_graph:
+            if item.source.path in paths:
+                for name in ('scope', 'routine', 'members', 'imports', 'targets'):
+                    item.clear_cached_property(name)
 
     @Timer(logger=info, text='[Loki::Scheduler] Enriched call tree in {:.2f}s')
     def _enrich(self):
         """
         Enrich subroutine calls for inter-procedural transformations
         """
-        definitions = self.definitions
+        definitions = EnrichmentContext(self.definitions)
         for item in self.item_graph:
             if not isinstance(item, SubroutineItem):
                 continue
@@ -514,6 +864,8 @@ class Scheduler:
         yields also the successors of these items to provide direct access
         to the called routine.
 
+        The successors are computed once and cached until the item graph is modified.
+
         Parameters
         ----------
         item : :any:`Item`
@@ -523,13 +875,277 @@ class Scheduler:
         -------
         list of :any:`Item`
         """
-        successors = []
-        for child in self.item_graph.successors(item):
-            if isinstance(child, (SubroutineItem, GlobalVarImportItem)):
-                successors += [self.item_map[child.name]]
+        successors_map = self._graph_cache.setdefault('successors', {})
+        if item.name not in successors_map:
+            successors = []
+            for child in self.item_graph.successors(item):
+                if isinstance(child, (SubroutineItem, GlobalVarImportItem)):
+                    successors += [self.item_map[child.name]]
+                else:
+                    successors += [self.item_map[child.name]] + self.item_successors(child)
+            successors_map[item.name] = tuple(successors)
+        return list(successors_map[item.name])
+
+    def _item_fingerprints(self):
+        """
+        Compute the input fingerprint of every item in the scheduler's graph
+
+        The input fingerprint of an item is derived from the content of its source
+        file, the item's configuration and the names of its successors.
+        """
+        file_hashes = {}
+        fingerprints = {}
+        for item in self.item_graph:
+            path = item.source.path
+            if path not in file_hashes:
+                if path is not None and Path(path).exists():
+                    file_hashes[path] = filehash(read_file(path))
+                else:
+                    file_hashes[path] = filehash(item.source.to_fortran())
+            successors = sorted(child.name for child in self.item_graph.successors(item))
+            config = sorted((k, repr(v)) for k, v in item.config.items())
+            fingerprints[item.name] = filehash(repr((item.name, file_hashes[path], config, successors)))
+        return fingerprints
+
+    def _update_incremental(self, transformations):
+        """
+        Record the given group of transformations, which are applied in a single
+        traversal, in the chain of applied transformations and determine the
+        items to skip in incremental processing mode
+
+        Upon the first traversal, all items with a changed input fingerprint, all
+        their ancestors (which depend on the changed interface of their successors)
+        and all other items in the same source files are marked for processing.
+        All other items are skipped in each traversal for as long as the
+        ``trafo_data`` they receive is identical to the previous run. To that end,
+        the ``trafo_data`` of skipped items is reset to the state they received
+        in the previous run before each traversal.
+
+        Changes of the configuration of the transformation pipeline need to be
+        captured in the :attr:`ProcessingManifest.signature`.
+        """
+        fingerprints = tuple(
+            ProcessingManifest.transformation_fingerprint(transformation)
+            for transformation in transformations
+        )
+        position = len(self._chain)
+        self._chain += list(fingerprints)
+        key = (position, len(self._chain))
+        self._groups += [(key, tuple(transformations))]
+
+        if position == 0:
+            self._fingerprints = self._item_fingerprints()
+            self._skipped_items = set()
+            self._applied_groups = {}
+            self._trafo_data_records = {}
+            self._incremental_graph = None
+            if self.manifest.chain[:len(fingerprints)] != fingerprints:
+                info('[Loki::Scheduler] Transformation chain changed, processing all items')
+                return
+
+            changed = {
+                name for name, fingerprint in self._fingerprints.items()
+                if self.manifest.fingerprints.get(name, (None, None))[0] != fingerprint
+            }
+            dirty = self._incremental_dependencies(changed)
+            self._skipped_items = set(self._fingerprints) - dirty
+            info(
+                f'[Loki::Scheduler] Re-processing {len(dirty)} of {len(self._fingerprints)} items '
+                f'({len(changed)} changed)'
+            )
+
+        elif self._skipped_items and self.manifest.chain[key[0]:key[1]] != fingerprints:
+            self.manifest.discard()
+            names = ', '.join(fingerprint[0] for fingerprint in fingerprints)
+            raise RuntimeError(
+                f'[Loki::Scheduler] Transformation {names} does not match the chain '
+                'in the processing manifest, manifest has been discarded'
+            )
+
+        # Reset skipped items to the trafo_data they received in the previous run
+        for name in self._skipped_items:
+            if (record := self.manifest.trafo_data.get(name, {}).get(key)) is not None:
+                self.item_map[name].trafo_data = pickle.loads(record[0])
+
+    def _incremental_dependencies(self, names):
+        """
+        Return the given item names together with the names of all their ancestors
+        and of all items in the same source files, which need to be processed
+        together with them in incremental processing mode
+        """
+        if self._incremental_graph is None:
+            self._incremental_graph = nx.relabel_nodes(
+                self.item_graph, {item: item.name for item in self.item_graph}
+            )
+        file_items = defaultdict(set)
+        for name in self._incremental_graph:
+            file_items[id(self.item_map[name].source)].add(name)
+
+        dependencies = set()
+        queue = list(names)
+        while queue:
+            name = queue.pop()
+            if name in dependencies:
+                continue
+            dependencies.add(name)
+            queue += nx.ancestors(self._incremental_graph, name)
+            queue += file_items[id(self.item_map[name].source)]
+        return dependencies
+
+    def _match_incremental(self, items, index):
+        """
+        Return the records of the ``trafo_data`` of the given skipped items in the
+        traversal :data:`index` of the previous run, or `None` if any of the items
+        has received different ``trafo_data`` than in the previous run
+        """
+        key = self._groups[index][0]
+        records = []
+        for item in items:
+            fingerprint = self.manifest.fingerprints.get(item.name)
+            record = self.manifest.trafo_data.get(item.name, {}).get(key)
+            if fingerprint is None or record is None or record[1] is None:
+                return None
+            state = ProcessingManifest.trafo_data_state(self.item_map[item.name].trafo_data)
+            if state is None or ProcessingManifest.trafo_data_digest(state) != fingerprint[1].get(key):
+                return None
+            records += [record]
+        return records
+
+    def _skip_incremental(self, items, index):
+        """
+        Check if the given items can be skipped in the traversal :data:`index`
+        in incremental processing mode
+
+        This is the case if all items are marked as skipped and have received
+        the same ``trafo_data`` as in the previous run, in which case their
+        resulting ``trafo_data`` from the previous run is restored. Otherwise,
+        all items and their dependencies are marked for processing in this
+        and all following traversals.
+        """
+        if not all(item.name in self._skipped_items for item in items):
+            return False
+
+        if (records := self._match_incremental(items, index)) is not None:
+            key = self._groups[index][0]
+            for item, record in zip(items, records):
+                self.item_map[item.name].trafo_data = pickle.loads(record[1])
+                self._trafo_data_records.setdefault(item.name, {})[key] = record
+            return True
+
+        for name in self._incremental_dependencies({item.name for item in items}) & self._skipped_items:
+            self._skipped_items.remove(name)
+            self._applied_groups[name] = 0
+        return False
+
+    def _record_trafo_data(self, item, index, received):
+        """
+        Record the received and resulting ``trafo_data`` of an item that has
+        been processed in the traversal :data:`index`
+        """
+        key = self._groups[index][0]
+        result = ProcessingManifest.trafo_data_state(self.item_map[item.name].trafo_data)
+        self._trafo_data_records.setdefault(item.name, {})[key] = (received, result)
+        if item.name in self._applied_groups:
+            self._applied_groups[item.name] = index + 1
+
+    def _apply_group(self, index, names):
+        """
+        Apply the transformations of the traversal :data:`index` to the items
+        with the given names, using the ``trafo_data`` they received in the
+        previous run
+        """
+        key, transformations = self._groups[index]
+        transformation = transformations[0]
+        item_filter = as_tuple(transformation.item_filter)
+        graph = self.file_graph if transformation.traverse_file_graph else self.item_graph
+
+        traversal = list(nx.topological_sort(graph))
+        if transformation.reverse_traversal:
+            traversal = traversal[::-1]
+
+        for node in traversal:
+            if transformation.traverse_file_graph:
+                items = [item for item in graph.nodes[node]['items'] if item.name in names]
+            else:
+                items = [self.item_map[node.name]] if node.name in names else []
+            if item_filter:
+                items = [item for item in items if isinstance(item, item_filter)]
+            if not items or (items[0].is_ignored and not transformation.process_ignored_items):
+                continue
+
+            received = {}
+            for item in items:
+                if (record := self.manifest.trafo_data.get(item.name, {}).get(key)) is not None:
+                    self.item_map[item.name].trafo_data = pickle.loads(record[0])
+                received[item.name] = ProcessingManifest.trafo_data_state(self.item_map[item.name].trafo_data)
+
+            if transformation.traverse_file_graph:
+                for trafo in transformations:
+                    trafo.apply(items[0].source, items=items)
             else:
-                successors += [self.item_map[child.name]] + self.item_successors(child)
-        return successors
+                self._apply_to_item(transformations, items[0])
+
+            for item in items:
+                self._record_trafo_data(item, index, received[item.name])
+
+        for name in names:
+            self._applied_groups[name] = index + 1
+
+    def _catch_up_incremental(self, stop):
+        """
+        Apply all traversals before :data:`stop` that have been skipped for items
+        that have since been marked for processing
+
+        The current ``trafo_data`` of these items is retained.
+        """
+        pending = {name: applied for name, applied in self._applied_groups.items() if applied < stop}
+        if not pending:
+            return
+        trafo_data = {name: self.item_map[name].trafo_data for name in pending}
+        for index in range(min(pending.values()), stop):
+            self._apply_group(index, {name for name in pending if self._applied_groups[name] <= index})
+        for name, data in trafo_data.items():
+            self.item_map[name].trafo_data = data
+
+    def _finish_incremental(self, index):
+        """
+        Apply the traversal :data:`index` to all items that have been marked for
+        processing after they have been skipped in this traversal
+        """
+        self._catch_up_incremental(index)
+        names = {name for name, applied in self._applied_groups.items() if applied == index}
+        if names:
+            self._apply_group(index, names)
+
+    def write_manifest(self):
+        """
+        Record the fingerprints, received ``trafo_data`` and applied transformations
+        of the current run in the :any:`ProcessingManifest` and write it to disk
+
+        This should be called after all transformations, including the writing
+        of output files, have been applied successfully.
+        """
+        if self.manifest is None:
+            return
+
+        if self._skipped_items and tuple(self._chain) != tuple(self.manifest.chain):
+            self.manifest.discard()
+            raise RuntimeError(
+                '[Loki::Scheduler] Applied transformations do not match the chain '
+                'in the processing manifest, manifest has been discarded'
+            )
+
+        fingerprints = self._fingerprints or self._item_fingerprints()
+        self.manifest.fingerprints = {
+            name: (fingerprint, {
+                key: ProcessingManifest.trafo_data_digest(received)
+                for key, (received, _) in self._trafo_data_records.get(name, {}).items()
+            })
+            for name, fingerprint in fingerprints.items()
+        }
+        self.manifest.trafo_data = dict(self._trafo_data_records)
+        self.manifest.chain = tuple(self._chain)
+        self.manifest.write()
 
     def process(self, transformation):
         """
@@ -550,12 +1166,77 @@ class Scheduler:
         object corresponding to an item in the scheduler graph. If combined with
         a :data:`item_filter`, only source files with at least one object corresponding
         to an item of that type are processed.
+
+        Transformations that declare :any:`Transformation.item_local` are applied
+        to the independent items of each topological generation in parallel, if
+        the scheduler has been created with more than one worker (:data:`num_workers`).
+        """
+        self._process_fused((transformation,))
+
+    def process_pipeline(self, transformations):
+        """
+        Process all :attr:`items` in the scheduler's graph with an ordered
+        list of transformations
+
+        Consecutive transformations that declare :any:`Transformation.item_local`
+        and have identical traversal properties (:attr:`Transformation.reverse_traversal`,
+        :attr:`Transformation.traverse_file_graph`, :attr:`Transformation.item_filter`
+        and :attr:`Transformation.process_ignored_items`) are fused into a single
+        graph traversal, which applies all of them to each item in turn. All other
+        transformations are applied in separate traversals as in :meth:`process`.
+
+        Parameters
+        ----------
+        transformations : list of :any:`Transformation`
+            The transformations to apply, in order
+        """
+        for group in self._fuse_transformations(transformations):
+            self._process_fused(group)
+
+    @staticmethod
+    def _fuse_transformations(transformations):
+        """
+        Split the list of :data:`transformations` into groups that can be
+        applied in a single graph traversal
+        """
+        def traversal_key(transformation):
+            return (
+                transformation.reverse_traversal, transformation.traverse_file_graph,
+                as_tuple(transformation.item_filter), transformation.process_ignored_items
+            )
+
+        groups = []
+        for transformation in as_tuple(transformations):
+            if (
+                groups and transformation.item_local and groups[-1][-1].item_local and
+                traversal_key(transformation) == traversal_key(groups[-1][-1])
+            ):
+                groups[-1] += [transformation]
+            else:
+                groups += [[transformation]]
+        return [tuple(group) for group in groups]
+
+    def _process_fused(self, transformations):
         """
-        trafo_name = transformation.__class__.__name__
-        log = f'[Loki::Scheduler] Applied transformation <{trafo_name}>' + ' in {:.2f}s'
+        Apply a group of transformations with identical traversal properties
+        in a single traversal of the graph
+
+        Each transformation in the group is applied to each item before moving
+        on to the next item in the traversal.
+        """
+        trafo_names = ', '.join(transformation.__class__.__name__ for transformation in transformations)
+        log = f'[Loki::Scheduler] Applied transformation <{trafo_names}>' + ' in {:.2f}s'
         with Timer(logger=info, text=log):
 
-            # Extract the graph iteration properties from the transformation
+            # Position of this traversal in incremental processing mode
+            index = None
+            if self.manifest is not None:
+                self._update_incremental(transformations)
+                index = len(self._groups) - 1
+
+            # Extract the graph iteration properties from the first transformation,
+            # which are identical for all transformations in the group
+            transformation = transformations[0]
             graph = self.file_graph if transformation.traverse_file_graph else self.item_graph
             item_filter = as_tuple(transformation.item_filter)
 
@@ -577,7 +1258,24 @@ class Scheduler:
                     if _item.is_ignored and not transformation.process_ignored_items:
                         continue
 
-                    transformation.apply(items[0].source, items=items)
+                    # Skip files that contain only unaffected items in incremental mode
+                    if index is not None:
+                        if self._skip_incremental(items, index):
+                            continue
+                        self._catch_up_incremental(index)
+                        received = {
+                            item.name: ProcessingManifest.trafo_data_state(self.item_map[item.name].trafo_data)
+                            for item in items
+                        }
+
+                    for trafo in transformations:
+                        trafo.apply(items[0].source, items=items)
+
+                    if index is not None:
+                        for item in items:
+                            self._record_trafo_data(item, index, received[item.name])
+            elif transformation.item_local and self.num_workers and self.num_workers > 1:
+                self._process_parallel(transformations, index=index)
             else:
                 for item in traversal:
                     if item.is_ignored and not transformation.process_ignored_items:
@@ -589,19 +1287,112 @@ class Scheduler:
                     # Use entry from item_map to ensure the original item is used in transformation
                     _item = self.item_map[item.name]
 
-                    # Pick out the IR node to which to apply the transformation
-                    # TODO: should this become an Item property?
-                    if isinstance(item, SubroutineItem):
-                        source = _item.routine
-                    else:
-                        source = _item.scope
-
-                    # Process work item with appropriate kernel
-                    transformation.apply(
-                        source, role=_item.role, mode=_item.mode,
-                        item=_item, targets=_item.targets,
-                        successors=self.item_successors(_item), depths=self.depths
-                    )
+                    if index is not None:
+                        if self._skip_incremental([_item], index):
+                            continue
+                        self._catch_up_incremental(index)
+                        received = ProcessingManifest.trafo_data_state(_item.trafo_data)
+
+                    self._apply_to_item(transformations, _item)
+
+                    if index is not None:
+                        self._record_trafo_data(_item, index, received)
+
+            if index is not None:
+                self._finish_incremental(index)
+
+    def _apply_to_item(self, transformations, item):
+        """
+        Apply :data:`transformations` in turn to the IR node of the given item
+        """
+        successors = self.item_successors(item)
+
+        # Process work item with appropriate kernels
+        for trafo in transformations:
+            # Pick out the IR node to which to apply the transformation
+            # TODO: should this become an Item property?
+            if isinstance(item, SubroutineItem):
+                source = item.routine
+            else:
+                source = item.scope
+
+            trafo.apply(
+                source, role=item.role, mode=item.mode,
+                item=item, targets=item.targets,
+                successors=successors, depths=self.depths
+            )
+
+    def _process_parallel(self, transformations, index=None):
+        """
+        Apply a group of item-local transformations to the items of each
+        topological generation of the graph in parallel worker processes
+
+        Items within a generation do not depend on each other. They are grouped
+        by source file, and each source file is sent to a worker together with
+        the successors of its items. The transformed source files are merged
+        back into the original :any:`Sourcefile` objects, and calls and imports
+        are re-linked to the updated program units afterwards.
+
+        In incremental processing mode, :data:`index` is the position of
+        the traversal in the list of applied transformation groups.
+        """
+        transformation = transformations[0]
+        item_filter = as_tuple(transformation.item_filter)
+        generations = list(nx.topological_generations(self.item_graph))
+        if transformation.reverse_traversal:
+            generations = generations[::-1]
+
+        # Depths are keyed by name, to avoid sending all items to the workers
+        depths = {item.name: depth for item, depth in self.depths.items()}
+
+        with workqueue(workers=self.num_workers) as q:
+            for generation in generations:
+                generation = [
+                    self.item_map[item.name] for item in generation
+                    if not (item.is_ignored and not transformation.process_ignored_items)
+                    and not (item_filter and not isinstance(item, item_filter))
+                ]
+
+                # Determine all items to process before skipping any, as items can
+                # be marked for processing together with other items
+                received = {}
+                if index is not None:
+                    changed = [
+                        item for item in generation
+                        if item.name in self._skipped_items and self._match_incremental([item], index) is None
+                    ]
+                    for item in changed:
+                        self._skip_incremental([item], index)
+                    generation = [item for item in generation if not self._skip_incremental([item], index)]
+                    self._catch_up_incremental(index)
+                    received = {
+                        item.name: ProcessingManifest.trafo_data_state(item.trafo_data) for item in generation
+                    }
+
+                items_by_source = defaultdict(list)
+                for item in generation:
+                    items_by_source[id(item.source)] += [item]
+
+                tasks = []
+                for items in items_by_source.values():
+                    successors = [self.item_successors(item) for item in items]
+                    tasks += [(items, q.call(_apply_transformations, transformations, items, successors, depths))]
+
+                # Merge the transformed source files back into the original objects
+                for items, task in tasks:
+                    source, trafo_data = task.result()
+                    items[0].source.__dict__.update(source.__dict__)
+                    for item, data in zip(items, trafo_data):
+                        item.trafo_data = data
+                        if index is not None:
+                            self._record_trafo_data(item, index, received[item.name])
+                self._clear_item_properties([items[0].source for items, _ in tasks])
+
+        # Re-link calls, imports and derived types to the updated program units
+        definitions = EnrichmentContext(self.definitions)
+        sources = {id(item.source): item.source for item in self.item_graph}
+        for source in sources.values():
+            source.relink_definitions(definitions)
 
     def callgraph(self, path, with_file_graph=False):
         """
@@ -14,7 +14,9 @@ from pymbolic.primitives import Expression
 from loki.ir import Node
 from loki.visitors import Visitor, Transformer
 from loki.tools import flatten, as_tuple
-from loki.expression.mappers import SubstituteExpressionsMapper, ExpressionRetriever, AttachScopesMapper
+from loki.expression.mappers import (
+    SubstituteExpressionsMapper, ExpressionRetriever, MultiExpressionRetriever, AttachScopesMapper
+)
 from loki.expression.symbols import (
     Array, Scalar, InlineCall, TypedSymbol, FloatLiteral, IntLiteral, LogicLiteral,
     StringLiteral, IntrinsicLiteral, DeferredTypeSymbol
@@ -22,7 +24,8 @@ from loki.expression.symbols import (
 
 __all__ = [
     'FindExpressions', 'FindVariables', 'FindTypedSymbols', 'FindInlineCalls',
-    'FindLiterals', 'SubstituteExpressions', 'ExpressionFinder', 'AttachScopes'
+    'FindLiterals', 'SubstituteExpressions', 'ExpressionFinder', 'MultiExpressionFinder',
+    'AttachScopes'
 ]
 
 
@@ -191,6 +194,114 @@ class FindLiterals(ExpressionFinder):
     )))
 
 
+class MultiExpressionFinder(ExpressionFinder):
+    """
+    A visitor to collect the results of multiple named queries for
+    sub-expressions in a single traversal of an IR tree.
+
+    This is equivalent to applying the corresponding :any:`ExpressionFinder`
+    for each query individually, but traverses the IR tree and every
+    expression tree only once.
+
+    .. code-block:: python
+
+        results = MultiExpressionFinder({
+            'variables': FindVariables,
+            'calls': FindInlineCalls,
+            'arrays': lambda e: isinstance(e, Array)
+        }).visit(routine.body)
+        variables, calls = results['variables'], results['calls']
+
+    Parameters
+    ----------
+    queries : dict
+        Map of query names to either an :any:`ExpressionFinder` subclass,
+        whose retriever's query is used, or a function handle that is given
+        each visited expression node and yields `True` or `False` depending
+        on whether that expression should be included into the result
+    unique : bool, optional
+        If `True` the visitor will return a `set` of unique sub-expression
+        for each query instead of a list of possibly repeated instances.
+    with_ir_node : bool, optional
+        If `True` the visitor will return tuples which contain the
+        sub-expression and the corresponding IR node in which the
+        expression is contained for each query.
+
+    Returns
+    -------
+    dict
+        Map of query names to the result of each query, as it would be
+        returned by the corresponding :any:`ExpressionFinder`
+    """
+
+    def __init__(self, queries, unique=True, with_ir_node=False):
+        super().__init__(unique=unique, with_ir_node=with_ir_node)
+        self.queries = {
+            name: query.retriever.query if isinstance(query, type) else query
+            for name, query in queries.items()
+        }
+        self.retriever = MultiExpressionRetriever(self.queries)
+        self._found = None
+        self._found_with_nodes = None
+
+    def visit(self, o, *args, **kwargs):
+        self._found = {name: [] for name in self.queries}
+        self._found_with_nodes = []
+        self._collect(o, **kwargs)
+
+        if self.with_ir_node:
+            return {
+                name: tuple(
+                    (node, self.find_uniques(found[name]))
+                    for node, found in self._found_with_nodes if found[name]
+                )
+                for name in self.queries
+            }
+        if self.unique:
+            return {name: self.find_uniques(found) for name, found in self._found.items()}
+        return {name: tuple(found) for name, found in self._found.items()}
+
+    def _collect(self, o, **kwargs):
+        """
+        Dispatch :data:`o` to the handler that adds the matching
+        sub-expressions to the currently active results
+        """
+        super().visit(o, **kwargs)
+
+    def _collect_with_node(self, o, children, **kwargs):
+        """
+        Add the matching sub-expressions of :data:`children` to the results and,
+        if :attr:`with_ir_node` is `True`, associate them with :data:`o`
+        """
+        if not self.with_ir_node:
+            for c in children:
+                self._collect(c, **kwargs)
+            return
+
+        found = {name: [] for name in self.queries}
+        found, self._found = self._found, found
+        for c in children:
+            self._collect(c, **kwargs)
+        found, self._found = self._found, found
+        if any(found.values()):
+            self._found_with_nodes.append((o, found))
+
+    def visit_tuple(self, o, **kwargs):
+        self._collect_with_node(o, o, **kwargs)
+
+    visit_list = visit_tuple
+
+    def visit_Expression(self, o, **kwargs):
+        for name, exprs in self.retriever.retrieve(o).items():
+            self._found[name] += exprs
+
+    def visit_Node(self, o, **kwargs):
+        self._collect_with_node(o, flatten(o.children), **kwargs)
+
+    def visit_TypeDef(self, o, **kwargs):
+        pass
+
+
 class SubstituteExpressions(Transformer):
     """
     A dedicated visitor to perform expression substitution in all IR nodes
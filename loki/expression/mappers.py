@@ -9,7 +9,6 @@
 Mappers for traversing and transforming the
 :ref:`internal_representation:Expression tree`.
 """
-from copy import deepcopy
 import re
 from itertools import zip_longest
 import pymbolic.primitives as pmbl
@@ -28,7 +27,8 @@ from loki.tools import as_tuple, flatten
 from loki.types import SymbolAttributes, BasicType
 
 
-__all__ = ['LokiStringifyMapper', 'ExpressionRetriever', 'ExpressionDimensionsMapper',
+__all__ = ['LokiStringifyMapper', 'ExpressionRetriever', 'MultiExpressionRetriever',
+           'ExpressionDimensionsMapper',
            'ExpressionCallbackMapper', 'SubstituteExpressionsMapper',
            'LokiIdentityMapper', 'AttachScopesMapper', 'DetachScopesMapper']
 
@@ -359,6 +359,40 @@ class ExpressionRetriever(LokiWalkMapper):
         return self.exprs
 
 
+class MultiExpressionRetriever(LokiWalkMapper):
+    """
+    A mapper for the expression tree that looks for entries specified by
+    multiple named queries in a single traversal.
+
+    Parameters
+    ----------
+    queries : dict
+        Map of query names to function handles that are given each visited
+        expression node and yield `True` or `False` depending on whether that
+        expression should be included into the result of that query.
+    """
+    # pylint: disable=abstract-method
+
+    def __init__(self, queries, **kwargs):
+        super().__init__(**kwargs)
+
+        self.queries = tuple(queries.items())
+        self.reset()
+
+    def post_visit(self, expr, *args, **kwargs):
+        for name, query in self.queries:
+            if query(expr):
+                self.exprs[name].append(expr)
+
+    def reset(self):
+        self.exprs = {name: [] for name, _ in self.queries}
+
+    def retrieve(self, expr, *args, **kwargs):
+        self.reset()
+        self(expr, *args, **kwargs)
+        return self.exprs
+
+
 class ExpressionDimensionsMapper(Mapper):
     """
     A visitor for an expression that determines the dimensions of the expression.
@@ -534,17 +568,19 @@ class LokiIdentityMapper(IdentityMapper):
         kwargs.setdefault('recurse_to_declaration_attributes', False)
         new_expr = super().__call__(expr, *args, **kwargs)
         if getattr(expr, 'source', None):
+            # Source objects are not modified after parsing, so rebuilt
+            # nodes can share them with the original node
             if isinstance(new_expr, tuple):
                 for e in new_expr:
                     if self.invalidate_source:
                         e.source = None
                     else:
-                        e.source = deepcopy(expr.source)
+                        e.source = expr.source
             else:
                 if self.invalidate_source:
                     new_expr.source = None
-                else:
-                    new_expr.source = deepcopy(expr.source)
+                elif new_expr is not expr:
+                    new_expr.source = expr.source
         return new_expr
 
     rec = __call__
@@ -746,6 +782,13 @@ class SubstituteExpressionsMapper(LokiIdentityMapper):
        The mapping can be applied to itself using the utility function
        :any:`recursive_expression_map_update`.
 
+    The mapper memoizes the result for every expression node it has visited,
+    which means repeated occurrences of the same node object are mapped only
+    once. If all keys in :data:`expr_map` are symbols or inline calls, the
+    names of these symbols are used to return symbols (including their
+    parents and subscripts) that do not refer to any of these names
+    unchanged, without traversing them.
+
     Parameters
     ----------
     expr_map : dict
@@ -757,6 +800,8 @@ class SubstituteExpressionsMapper(LokiIdentityMapper):
     """
     # pylint: disable=abstract-method
 
+    _name_pattern = re.compile(r'[^\W\d]\w*')
+
     def __init__(self, expr_map, invalidate_source=True):
         super().__init__(invalidate_source=invalidate_source)
 
@@ -764,6 +809,57 @@ class SubstituteExpressionsMapper(LokiIdentityMapper):
         for expr in self.expr_map.keys():
             setattr(self, expr.mapper_method, self.map_from_expr_map)
 
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from loki.expression.symbols import TypedSymbol, MetaSymbol
+        self._symbol_types = (TypedSymbol, MetaSymbol)
+        self._memo = {}
+        self._names = self._get_key_names(expr_map)
+
+    @staticmethod
+    def _get_key_names(expr_map):
+        """
+        Return the set of canonical base names (i.e., without parent names) of
+        all keys in :data:`expr_map`, or `None` if any key is not a symbol or
+        inline call
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from loki.expression.symbols import TypedSymbol, MetaSymbol, InlineCall, StrCompareMixin
+        names = set()
+        for expr in expr_map:
+            if isinstance(expr, InlineCall):
+                expr = expr.function
+            if not isinstance(expr, (TypedSymbol, MetaSymbol)):
+                return None
+            names.add(StrCompareMixin._canonical(expr.name).split('%')[-1])
+        return names
+
+    def _may_contain_key(self, expr):
+        """
+        Check if the symbol :data:`expr` contains a symbol whose name matches a key
+        in :attr:`expr_map`, using the names in its canonical string representation
+        """
+        if self._names is None or not isinstance(expr, self._symbol_types):
+            return True
+        return not self._names.isdisjoint(self._name_pattern.findall(expr._canonical_key()))
+
+    def __call__(self, expr, *args, **kwargs):
+        if args or len(kwargs) > 1 or kwargs.get('recurse_to_declaration_attributes'):
+            return super().__call__(expr, *args, **kwargs)
+
+        # Memoize results by object identity (the node is stored alongside the result
+        # to keep it alive and thus its id unique)
+        key = id(expr)
+        if key in self._memo:
+            return self._memo[key][1]
+        if self._may_contain_key(expr):
+            new_expr = super().__call__(expr, *args, **kwargs)
+        else:
+            new_expr = expr
+        self._memo[key] = (expr, new_expr)
+        return new_expr
+
+    rec = __call__
+
     def map_from_expr_map(self, expr, *args, **kwargs):
         """
         Replace an expr with its substitution, if found in the :attr:`expr_map`,
@@ -63,6 +63,11 @@ class StrCompareMixin:
 
     The purpose of the string comparison override is to reliably and flexibly
     identify expression symbols from equivalent strings.
+
+    The canonical string representation of an expression node is computed on
+    first use and cached on the node, since expression nodes are treated as
+    immutable. The cache is not pickled or copied, and setters of attributes
+    that affect the string representation must call :meth:`_reset_canonical`.
     """
 
     @staticmethod
@@ -72,13 +77,35 @@ class StrCompareMixin:
             return str(s).replace(' ', '')
         return str(s).lower().replace(' ', '')
 
+    def _canonical_key(self):
+        """
+        Return the canonical string representation of this node, using
+        the cached representations if available
+        """
+        keys = self.__dict__.get('_canonical_keys')
+        if keys is None:
+            key = str(self).replace(' ', '')
+            keys = (key, key.lower())
+            self.__dict__['_canonical_keys'] = keys
+        return keys[0] if config['case-sensitive'] else keys[1]
+
+    def _reset_canonical(self):
+        """
+        Drop the cached canonical string representations
+        """
+        self.__dict__.pop('_canonical_keys', None)
+
     def __hash__(self):
-        return hash(self._canonical(self))
+        return hash(self._canonical_key())
 
     def __eq__(self, other):
-        if isinstance(other, (str, type(self))):
+        if self is other:
+            return True
+        if isinstance(other, str):
+            return self._canonical_key() == self._canonical(other)
+        if isinstance(other, type(self)):
             # Do comparsion based on canonical string representations
-            return self._canonical(self) == self._canonical(other)
+            return self._canonical_key() == other._canonical_key()
 
         return super().__eq__(other)
 
@@ -144,6 +171,8 @@ class TypedSymbol:
     @name.setter
     def name(self, name):
         self._name = name.split('%')[-1]
+        if isinstance(self, StrCompareMixin):
+            self._reset_canonical()
 
     def __getinitargs__(self):
         """
@@ -257,6 +286,8 @@ class TypedSymbol:
         assert parent is None or isinstance(parent, (TypedSymbol, MetaSymbol,
             Reference, Dereference))
         self._parent = parent
+        if isinstance(self, StrCompareMixin):
+            self._reset_canonical()
 
     @property
     def parents(self):
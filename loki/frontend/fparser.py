@@ -6,6 +6,7 @@
 # nor does it submit to any jurisdiction.
 
 # pylint: disable=too-many-lines
+from itertools import accumulate
 import re
 
 from codetiming import Timer
@@ -41,10 +42,58 @@ from loki.types import BasicType, DerivedType, ProcedureType, SymbolAttributes
 from loki.config import config
 
 
-__all__ = ['HAVE_FP', 'FParser2IR', 'parse_fparser_file', 'parse_fparser_source',
+__all__ = ['HAVE_FP', 'FParser2IR', 'init_fparser', 'parse_fparser_file', 'parse_fparser_source',
            'parse_fparser_ast', 'parse_fparser_expression', 'get_fparser_node']
 
 
+_fparser_parser = None
+"""The fparser parser class for Fortran 2008, created by :any:`init_fparser`"""
+
+_fparser_class_hierarchy = None
+"""fparser's global class hierarchy for which :data:`_fparser_parser` has been created"""
+
+
+def _clear_fparser_symbol_tables():
+    """
+    Clear FParser's symbol tables if the FParser version is new enough to have them
+    """
+    try:
+        from fparser.two.symbol_table import SYMBOL_TABLES  # pylint: disable=import-outside-toplevel
+        SYMBOL_TABLES.clear()
+    except ImportError:
+        pass
+
+
+def init_fparser():
+    """
+    Create the fparser parser for Fortran 2008 once per process and return it
+
+    Creating the parser sets up fparser's global class hierarchy, which is
+    comparatively expensive. The parser is therefore cached and only re-created
+    if the class hierarchy has been replaced since, e.g., because the
+    :class:`fparser.two.parser.ParserFactory` has been used elsewhere.
+
+    This can be used as the ``initializer`` for worker processes, e.g., of a
+    :class:`concurrent.futures.ProcessPoolExecutor`, to set up the parser once
+    per worker before parsing any files.
+
+    Returns
+    -------
+    :class:`fparser.two.Fortran2003.Program`
+        The parser class to use with an fparser reader
+    """
+    global _fparser_parser, _fparser_class_hierarchy  # pylint: disable=global-statement
+
+    if not HAVE_FP:
+        error('Fparser is not available. Try "pip install fparser".')
+        raise RuntimeError
+
+    if _fparser_parser is None or Fortran2003.Base.subclasses is not _fparser_class_hierarchy:
+        _fparser_parser = ParserFactory().create(std='f2008')
+        _fparser_class_hierarchy = Fortran2003.Base.subclasses
+    return _fparser_parser
+
+
 @Timer(logger=debug, text=lambda s: f'[Loki::FP] Executed parse_fparser_file in {s:.2f}s')
 def parse_fparser_file(filename):
     """
@@ -60,20 +109,10 @@ def parse_fparser_source(source):
     """
     Generate a parse tree from string
     """
-    if not HAVE_FP:
-        error('Fparser is not available. Try "pip install fparser".')
-        raise RuntimeError
-
-    # Clear FParser's symbol tables if the FParser version is new enough to have them
-    try:
-        from fparser.two.symbol_table import SYMBOL_TABLES  # pylint: disable=import-outside-toplevel
-        SYMBOL_TABLES.clear()
-    except ImportError:
-        pass
+    f2008_parser = init_fparser()
+    _clear_fparser_symbol_tables()
 
     reader = FortranStringReader(source, ignore_comments=False)
-    f2008_parser = ParserFactory().create(std='f2008')
-
     return f2008_parser(reader)
 
 
@@ -129,11 +168,9 @@ def parse_fparser_expression(source, scope):
     :any:`Expression`
         The expression tree corresponding to the expression
     """
-    if not HAVE_FP:
-        error('Fparser is not installed')
-        raise RuntimeError
+    init_fparser()
+    _clear_fparser_symbol_tables()
 
-    _ = ParserFactory().create(std='f2008')
     # Wrap source in brackets to make sure it appears like a valid expression
     # for fparser, and strip that Parenthesis node from the ast immediately after
     ast = Fortran2003.Primary('(' + source + ')').children[1]
@@ -222,10 +259,51 @@ def rget_child(node, node_type):
     return None
 
 
-def extract_fparser_source(node, raw_source):
+def get_line_offsets(raw_source):
+    """
+    Compute the start index of every line in :data:`raw_source`
+
+    Lines are split as in :meth:`str.splitlines`. The returned tuple has one
+    more entry than the number of lines, which marks the end of the last line.
+    """
+    return (0,) + tuple(accumulate(len(line) for line in raw_source.splitlines(keepends=True)))
+
+
+def get_source_span(line_offsets, lines, buffer=None):
+    """
+    Return the start and end index of the given range of :data:`lines` in the
+    source string described by :data:`line_offsets`
+
+    Parameters
+    ----------
+    line_offsets : tuple of int
+        The start index of every line, as returned by :meth:`get_line_offsets`
+    lines : tuple of int
+        Start and end line number (1-based and inclusive)
+    buffer : str, optional
+        The source string. If given, any leading and trailing newline
+        characters are excluded from the span.
+    """
+    num_lines = len(line_offsets) - 1
+    start = line_offsets[min(max(lines[0] - 1, 0), num_lines)]
+    end = line_offsets[max(min(lines[1], num_lines), 0)]
+    if buffer is not None:
+        while start < end and buffer[start] == '\n':
+            start += 1
+        while end > start and buffer[end - 1] == '\n':
+            end -= 1
+    return (start, max(start, end))
+
+
+def extract_fparser_source(node, raw_source, line_offsets=None):
     """
     Extract the :any:`Source` object for any py:class:`fparser.two.utils.BlockBase`
     from the raw source string.
+
+    The returned :any:`Source` object references :data:`raw_source` instead of
+    storing a copy of the source string. When extracting the source for many
+    nodes, the :data:`line_offsets` of :data:`raw_source` (see
+    :meth:`get_line_offsets`) should be computed once and provided here.
     """
     assert isinstance(node, BlockBase)
     if node.item is not None:
@@ -241,10 +319,11 @@ def extract_fparser_source(node, raw_source):
             # If we don't have source information for start/end we have to bail out
             return None
         lines = (start_node.item.span[0], end_node.item.span[1])
-    string = None
-    if raw_source is not None:
-        string = ''.join(raw_source.splitlines(keepends=True)[lines[0]-1:lines[1]])
-    return Source(lines, string=string)
+    if raw_source is None:
+        return Source(lines)
+    if line_offsets is None:
+        line_offsets = get_line_offsets(raw_source)
+    return Source(lines, buffer=raw_source, span=get_source_span(line_offsets, lines))
 
 
 class FParser2IR(GenericVisitor):
@@ -252,7 +331,8 @@ class FParser2IR(GenericVisitor):
 
     def __init__(self, raw_source, definitions=None, pp_info=None, scope=None):
         super().__init__()
-        self.raw_source = raw_source.splitlines(keepends=True)
+        self.raw_source = raw_source
+        self.line_offsets = get_line_offsets(raw_source)
         self.definitions = CaseInsensitiveDict((d.name, d) for d in as_tuple(definitions))
         self.pp_info = pp_info
         self.default_scope = scope
@@ -264,14 +344,22 @@ class FParser2IR(GenericVisitor):
             raise NotImplementedError
         warning(msg)
 
+    def get_lines_source(self, lines):
+        """
+        Helper method that builds the source object for the given range of lines.
+
+        The source object references the raw source string via the precomputed
+        :attr:`line_offsets` instead of storing a copy of the lines.
+        """
+        span = get_source_span(self.line_offsets, lines, buffer=self.raw_source)
+        return Source(lines=lines, buffer=self.raw_source, span=span)
+
     def get_source(self, o, source):
         """
         Helper method that builds the source object for the node.
         """
         if o is not None and not isinstance(o, str) and o.item is not None:
-            lines = (o.item.span[0], o.item.span[1])
-            string = ''.join(self.raw_source[lines[0] - 1:lines[1]]).strip('\n')
-            source = Source(lines=lines, string=string)
+            source = self.get_lines_source((o.item.span[0], o.item.span[1]))
         return source
 
     def get_block_source(self, start_node, end_node):
@@ -279,10 +367,7 @@ class FParser2IR(GenericVisitor):
         Helper method that builds the source object for a block node.
         """
         # Extract source by looking at everything between start_type and end_type nodes
-        lines = (start_node.item.span[0], end_node.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
-        source = Source(lines=lines, string=string)
-        return source
+        return self.get_lines_source((start_node.item.span[0], end_node.item.span[1]))
 
     def get_label(self, o):
         """
@@ -700,10 +785,9 @@ class FParser2IR(GenericVisitor):
             if _type is None or _type.dtype is BasicType.DEFERRED:
                 _type = SymbolAttributes(dtype)
 
-            if o.children[0].upper() == 'CLASS':
-                _type.polymorphic = True
-
             # Strip import annotations
+            if o.children[0].upper() == 'CLASS':
+                return _type.clone(imported=None, module=None, polymorphic=True)
             return _type.clone(imported=None, module=None)
 
         return self.visit_Base(o, **kwargs)
@@ -1438,8 +1522,7 @@ class FParser2IR(GenericVisitor):
 
         # Extract source object for construct
         lines = (assoc_stmt.item.span[0], end_assoc_stmt.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
-        source = Source(lines=lines, string=string)
+        source = self.get_lines_source(lines)
 
         # Handle the associates
         associations = self.visit(assoc_stmt, **kwargs)
@@ -1547,8 +1630,7 @@ class FParser2IR(GenericVisitor):
 
         # Extract source object for construct
         lines = (interface_stmt.item.span[0], end_interface_stmt.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
-        source = Source(lines=lines, string=string)
+        source = self.get_lines_source(lines)
 
         # The interface spec
         abstract = False
@@ -1696,8 +1778,7 @@ class FParser2IR(GenericVisitor):
 
         # Extract source object for construct
         lines = (subroutine_stmt.item.span[0], end_subroutine_stmt.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
-        source = Source(lines=lines, string=string)
+        source = self.get_lines_source(lines)
 
         # We make sure the subroutine objects for all member routines are
         # instantiated before parsing the actual spec and body of the parent routine.
@@ -1989,8 +2070,7 @@ class FParser2IR(GenericVisitor):
 
         # Extract source object for construct
         lines = (module_stmt.item.span[0], end_module_stmt.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
-        source = Source(lines=lines, string=string)
+        source = self.get_lines_source(lines)
 
         # Instantiate the object
         module = self.visit(module_stmt, **kwargs)
@@ -2137,8 +2217,7 @@ class FParser2IR(GenericVisitor):
         sources, labels = [], []
         for conditional in (if_then_stmt,) + else_if_stmts:
             lines = (conditional.item.span[0], end_if_stmt.item.span[1])
-            string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
-            sources += [Source(lines=lines, string=string)]
+            sources += [self.get_lines_source(lines)]
             labels += [self.get_label(conditional)]
 
         # Build IR nodes backwards using else-if branch as else body
@@ -2212,8 +2291,7 @@ class FParser2IR(GenericVisitor):
 
         # Extract source object for construct
         lines = (select_case_stmt.item.span[0], end_select_stmt.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
-        source = Source(lines=lines, string=string)
+        source = self.get_lines_source(lines)
 
         # Handle the SELECT CASE statement
         expr = self.visit(select_case_stmt, **kwargs)
@@ -2661,8 +2739,7 @@ class FParser2IR(GenericVisitor):
 
         # Extract source object for construct
         lines = (where_stmt.item.span[0], end_where_stmt.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
-        source = Source(lines=lines, string=string)
+        source = self.get_lines_source(lines)
 
         # Find all ELSEWHERE statements
         where_stmts, where_stmts_index = zip(*(
@@ -2677,7 +2754,7 @@ class FParser2IR(GenericVisitor):
         # Handle all cases
         conditions = tuple(self.visit(c, **kwargs) for c in where_stmts)
         bodies = tuple(
-            flatten(as_tuple(self.visit(c, **kwargs) for c in o.children[start+1:stop]))
+            as_tuple(flatten(self.visit(c, **kwargs) for c in o.children[start+1:stop]))
             for start, stop in zip(where_stmts_index[:-1], where_stmts_index[1:])
         )
 
@@ -2883,8 +2960,7 @@ class FParser2IR(GenericVisitor):
             end_do_stmt = rget_child(o, Fortran2003.Continue_Stmt)
             assert str(end_do_stmt.item.label) == do_stmt.label.string
         lines = (do_stmt.item.span[0], end_do_stmt.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
-        source = Source(lines=lines, string=string)
+        source = self.get_lines_source(lines)
         label = self.get_label(do_stmt)
         construct_name = do_stmt.item.name
         # Extract loop header and get stepping info
@@ -3114,11 +3190,10 @@ class FParser2IR(GenericVisitor):
         # Extract source by looking at everything between SELECT and END SELECT
         end_select_stmt = rget_child(o, Fortran2003.End_Select_Type_Stmt)
         lines = (select_stmt.item.span[0], end_select_stmt.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
-        source = Source(lines=lines, string=string)
+        source = self.get_lines_source(lines)
         label = self.get_label(select_stmt)
         # TODO: Treat this with a dedicated IR node (LOKI-33)
-        return (*banter, ir.Intrinsic(text=string, label=label, source=source))
+        return (*banter, ir.Intrinsic(text=source.string, label=label, source=source))
 
     def visit_Nullify_Stmt(self, o, **kwargs):
         if not o.items[1]:
@@ -127,17 +127,17 @@ class OFP2IR(GenericVisitor):
             raise NotImplementedError
         warning(msg)
 
-    def lookup_method(self, instance):
+    def _lookup_handler(self, instance):
         """
-        Alternative lookup method for XML element types, identified by ``element.tag``
+        Alternative handler lookup for XML element types, identified by ``element.tag``
         """
         if isinstance(instance, Iterable):
-            return super().lookup_method(instance)
+            return super()._lookup_handler(instance)
 
         tag = instance.tag.replace('-', '_')
         if tag in self._handlers:
             return self._handlers[tag]
-        return super().lookup_method(instance)
+        return super()._lookup_handler(instance)
 
     def get_label(self, o):
         """
@@ -5,8 +5,11 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+from os import devnull
 from pathlib import Path
 from shutil import which
+from subprocess import Popen, PIPE, CalledProcessError
+from tempfile import TemporaryFile
 import xml.etree.ElementTree as ET
 from codetiming import Timer
 
@@ -29,7 +32,11 @@ from loki.pragma_utils import (
 from loki.types import BasicType, DerivedType, ProcedureType, SymbolAttributes
 
 
-__all__ = ['HAVE_OMNI', 'parse_omni_source', 'parse_omni_file', 'parse_omni_ast']
+__all__ = [
+    'HAVE_OMNI', 'parse_omni_source', 'parse_omni_file', 'parse_omni_ast',
+    'iterparse_omni_source', 'iterparse_omni_file', 'parse_omni_events',
+    'generate_omni_xmods'
+]
 
 
 HAVE_OMNI = which('F_Front') is not None
@@ -47,27 +54,81 @@ def parse_omni_file(filename, xmods=None):
     if not HAVE_OMNI:
         error('OMNI is not available. Is "F_Front" in the search path?')
 
-    dump_xml_files = config['omni-dump-xml']
-
     filepath = Path(filename)
     info(f'[Loki::OMNI] Parsing {filepath}')
+    cmd = _omni_command(filepath, xmods)
+
+    if config['omni-dump-xml']:
+        # Parse AST from xml file dumped to disk
+        xml_path = filepath.with_suffix('.xml')
+        cmd += ['-o', f'{xml_path}']
+        execute(cmd)
+        return ET.parse(str(xml_path)).getroot()
+
+    result = execute(cmd, silent=False, capture_output=True, text=True)
+    return ET.fromstring(result.stdout)
 
-    xml_path = filepath.with_suffix('.xml')
-    xmods = xmods or []
 
+def _omni_command(filepath, xmods=None):
+    """
+    Build the command line for OMNI's frontend (F_Front) to parse :data:`filepath`
+    """
     cmd = ['F_Front', '-fleave-comment']
-    for m in xmods:
+    for m in as_tuple(xmods):
         cmd += ['-M', f'{Path(m)}']
     cmd += [f'{filepath}']
+    return cmd
+
+
+def iterparse_omni_file(filename, xmods=None):
+    """
+    Deploy the OMNI compiler's frontend (F_Front) and incrementally parse
+    the generated XML
 
-    if dump_xml_files:
+    In contrast to :any:`parse_omni_file`, the output of F_Front is not
+    stored as a string but parsed while it is being generated. This yields
+    the ``start`` and ``end`` events of :any:`xml.etree.ElementTree.iterparse`,
+    which can be consumed by :any:`parse_omni_events`.
+
+    Note that the intermediate XML files can be dumped to file via by setting
+    the environment variable ``LOKI_OMNI_DUMP_XML``.
+    """
+    if not HAVE_OMNI:
+        error('OMNI is not available. Is "F_Front" in the search path?')
+
+    filepath = Path(filename)
+    info(f'[Loki::OMNI] Parsing {filepath}')
+    cmd = _omni_command(filepath, xmods)
+
+    if config['omni-dump-xml']:
         # Parse AST from xml file dumped to disk
+        xml_path = filepath.with_suffix('.xml')
         cmd += ['-o', f'{xml_path}']
         execute(cmd)
-        return ET.parse(str(xml_path)).getroot()
-
-    result = execute(cmd, silent=False, capture_output=True, text=True)
-    return ET.fromstring(result.stdout)
+        yield from ET.iterparse(str(xml_path), events=('start', 'end'))
+        return
+
+    debug('[Loki] Executing: %s', ' '.join(cmd))
+    with TemporaryFile() as stderr, Popen(cmd, stdout=PIPE, stderr=stderr) as proc:
+        try:
+            yield from ET.iterparse(proc.stdout, events=('start', 'end'))
+        except ET.ParseError:
+            # Report the failure of F_Front instead of the incomplete XML
+            proc.stdout.read()
+            if proc.wait() == 0:
+                raise
+        finally:
+            # Drain the pipe if the consumer stops early
+            proc.stdout.read()
+
+        if proc.wait() != 0:
+            stderr.seek(0)
+            output_str = stderr.read().decode()
+            error(f'Error: Execution of {cmd[0]} failed:')
+            error(f'  Full command: {" ".join(cmd)}')
+            if output_str:
+                error(f'  Output of the command:\n\n{output_str}')
+            raise CalledProcessError(proc.returncode, cmd, stderr=output_str)
 
 
 @Timer(logger=debug, text=lambda s: f'[Loki::OMNI] Executed parse_omni_source in {s:.2f}s')
@@ -75,11 +136,24 @@ def parse_omni_source(source, filepath=None, xmods=None):
     """
     Deploy the OMNI compiler's frontend (F_Front) to AST for a source string.
     """
-    # Use basename of filepath if given
+    filepath = _write_omni_source(source, filepath)
+    return parse_omni_file(filename=filepath, xmods=xmods)
+
+
+def _write_omni_source(source, filepath=None):
+    """
+    Write :data:`source` to a temporary file as input for F_Front and return its path
+    """
+    # Use basename of filepath if given, with a hash of the full path and the
+    # source to avoid clashes between files with the same basename that are
+    # processed concurrently
     if filepath is None:
         filepath = Path(filehash(source, prefix='omni-', suffix='.f90'))
     else:
-        filepath = filepath.with_suffix(f'.omni{filepath.suffix}')
+        filepath = Path(filepath)
+        filepath = Path(filehash(
+            f'{filepath.resolve()}\n{source}', prefix=f'{filepath.stem}.', suffix=f'.omni{filepath.suffix}'
+        ))
 
     # Always store intermediate flies in tmp dir
     filepath = gettempdir()/filepath.name
@@ -87,8 +161,31 @@ def parse_omni_source(source, filepath=None, xmods=None):
     debug(f'[Loki::OMNI] Writing temporary source {filepath}')
     with filepath.open('w') as f:
         f.write(source)
+    return filepath
+
+
+def generate_omni_xmods(source, filepath=None, xmods=None):
+    """
+    Deploy the OMNI compiler's frontend (F_Front) for a source string only
+    to generate the ``.xmod`` files of the modules defined in it
+
+    The XML output of F_Front is discarded.
+    """
+    if not HAVE_OMNI:
+        error('OMNI is not available. Is "F_Front" in the search path?')
+
+    filepath = _write_omni_source(source, filepath)
+    info(f'[Loki::OMNI] Generating xmods for {filepath}')
+    execute(_omni_command(filepath, xmods) + ['-o', devnull])
 
-    return parse_omni_file(filename=filepath, xmods=xmods)
+
+def iterparse_omni_source(source, filepath=None, xmods=None):
+    """
+    Deploy the OMNI compiler's frontend (F_Front) for a source string and
+    incrementally parse the generated XML (see :any:`iterparse_omni_file`)
+    """
+    filepath = _write_omni_source(source, filepath)
+    return iterparse_omni_file(filename=filepath, xmods=xmods)
 
 
 @Timer(logger=debug, text=lambda s: f'[Loki::OMNI] Executed parse_omni_ast in {s:.2f}s')
@@ -107,6 +204,64 @@ def parse_omni_ast(ast, definitions=None, type_map=None, symbol_map=None,
     return _ir
 
 
+@Timer(logger=debug, text=lambda s: f'[Loki::OMNI] Executed parse_omni_events in {s:.2f}s')
+def parse_omni_events(events, definitions=None, raw_source=None, scope=None):
+    """
+    Generate an internal IR from a stream of OMNI XML parse events, as
+    produced by :any:`iterparse_omni_file`.
+
+    Every program unit in the ``globalDeclarations`` of the XML tree is
+    converted as soon as it has been parsed completely. Afterwards, its XML
+    element is removed from the tree and no reference is kept in the IR,
+    which bounds the memory consumption by the type table and the largest
+    program unit instead of the full XML tree.
+
+    Parameters
+    ----------
+    events : iterable
+        The ``(event, element)`` pairs for ``start`` and ``end`` events
+    definitions : list, optional
+        List of external :any:`Module` to provide derived-type and procedure declarations
+    raw_source : str
+        Fortran source string
+    scope : :any:`Scope`, optional
+        The enclosing parent scope
+
+    Returns
+    -------
+    :any:`Section`
+        The IR of all program units
+    """
+    parents = []
+    type_map, symbol_map = {}, None
+    omni2ir = None
+    body = []
+    for event, element in events:
+        if event == 'start':
+            parents.append(element)
+            continue
+        parents.pop()
+
+        if len(parents) == 1:
+            # The type table and global symbols precede the declarations
+            if element.tag == 'typeTable':
+                type_map = {t.attrib['type']: t for t in element}
+            elif element.tag == 'symbols':
+                symbol_map = {s.attrib['type']: s for s in element}
+        elif len(parents) == 2 and parents[-1].tag == 'globalDeclarations':
+            if omni2ir is None:
+                omni2ir = OMNI2IR(type_map=type_map, definitions=definitions, symbol_map=symbol_map,
+                                  raw_source=raw_source, scope=scope, retain_ast=False)
+            body += [omni2ir.visit(element)]
+            parents[-1].remove(element)
+
+    # Perform some minor sanitation tasks
+    _ir = ir.Section(body=as_tuple(body))
+    _ir = sanitize_ir(_ir, OMNI)
+
+    return _ir
+
+
 class OMNI2IR(GenericVisitor):
     # pylint: disable=unused-argument  # Stop warnings about unused arguments
 
@@ -121,7 +276,7 @@ class OMNI2IR(GenericVisitor):
     }
 
     def __init__(self, definitions=None, type_map=None, symbol_map=None,
-                 raw_source=None, scope=None):
+                 raw_source=None, scope=None, retain_ast=True):
         super().__init__()
 
         self.definitions = CaseInsensitiveDict((d.name, d) for d in as_tuple(definitions))
@@ -130,6 +285,7 @@ class OMNI2IR(GenericVisitor):
         self.raw_source = raw_source.splitlines(keepends=True)
         self.default_scope = scope
         self.lineno = None  # use to save lineno of last element with attribute lineno
+        self.retain_ast = retain_ast  # store XML elements as the AST of program units
 
     @staticmethod
     def warn_or_fail(msg):
@@ -155,14 +311,18 @@ class OMNI2IR(GenericVisitor):
             _type = SymbolAttributes(BasicType.from_fortran_type(type_attrib))
         return _type
 
-    def lookup_method(self, instance):
+    def _lookup_handler(self, instance):
         """
-        Alternative lookup method for XML element types, identified by ``element.tag``
+        Alternative handler lookup for XML element types, identified by ``element.tag``
         """
         tag = instance.tag.replace('-', '_')
         if tag in self._handlers:
             return self._handlers[tag]
-        return super().lookup_method(instance)
+        return super()._lookup_handler(instance)
+
+    def get_ast(self, o):
+        """Helper method that returns the AST to store for a program unit"""
+        return o if self.retain_ast else None
 
     def get_source(self, o):
         """Helper method that builds the source object for a node"""
@@ -342,13 +502,13 @@ class OMNI2IR(GenericVisitor):
             routine = Subroutine(
                 name=name, args=args, prefix=prefix, bind=None,
                 result_name=result, is_function=is_function, parent=scope,
-                ast=o, source=self.get_source(o)
+                ast=self.get_ast(o), source=self.get_source(o)
             )
         else:
             routine.__initialize__(
                 name=name, args=args, docstring=routine.docstring, spec=routine.spec,
                 body=routine.body, contains=routine.contains, prefix=prefix, bind=None,
-                result_name=result, is_function=is_function, ast=o,
+                result_name=result, is_function=is_function, ast=self.get_ast(o),
                 source=self.get_source(o), incomplete=routine._incomplete
             )
 
@@ -420,7 +580,7 @@ class OMNI2IR(GenericVisitor):
         # pylint: disable=unnecessary-dunder-call
         routine.__initialize__(
             name=routine.name, args=routine._dummies, docstring=docstring, spec=spec,
-            body=body, contains=contains, ast=o, prefix=routine.prefix,
+            body=body, contains=contains, ast=self.get_ast(o), prefix=routine.prefix,
             bind=routine.bind, result_name=routine.result_name,
             is_function=routine.is_function, rescope_symbols=True,
             source=routine.source, incomplete=False
@@ -516,7 +676,7 @@ class OMNI2IR(GenericVisitor):
         # pylint: disable=unnecessary-dunder-call
         module.__initialize__(
             name=module.name, docstring=docstring, spec=spec, contains=contains,
-            ast=o, rescope_symbols=True, source=kwargs['source'], incomplete=False
+            ast=self.get_ast(o), rescope_symbols=True, source=kwargs['source'], incomplete=False
         )
 
         return module
@@ -569,7 +729,7 @@ class OMNI2IR(GenericVisitor):
                     _type = _type.clone(dtype=dtype)
 
                 if tast.attrib.get('is_external') == 'true':
-                    _type.external = True
+                    _type = _type.clone(external=True)
                 elif variable == kwargs['scope'].name and _type.dtype.return_type is not None:
                     # This is the declaration of the return type inside a function, which is
                     # why we restore the return_type
@@ -807,31 +967,36 @@ class OMNI2IR(GenericVisitor):
         else:
             raise ValueError
 
+        attrs = {}
         shape = o.findall('indexRange')
         if shape:
-            _type.shape = tuple(self.visit(s, **kwargs) for s in shape)
+            attrs['shape'] = tuple(self.visit(s, **kwargs) for s in shape)
 
         # OMNI types are build recursively from references (Matroshka-style)
         if o.get('intent') is not None:
-            _type.intent = o.get('intent')
+            attrs['intent'] = o.get('intent')
         if o.get('is_allocatable') == 'true':
-            _type.allocatable = True
+            attrs['allocatable'] = True
         if o.get('is_pointer') == 'true':
-            _type.pointer = True
+            attrs['pointer'] = True
         if o.get('is_optional') == 'true':
-            _type.optional = True
+            attrs['optional'] = True
         if o.get('is_parameter') == 'true':
-            _type.parameter = True
+            attrs['parameter'] = True
         if o.get('is_target') == 'true':
-            _type.target = True
+            attrs['target'] = True
         if o.get('is_contiguous') == 'true':
-            _type.contiguous = True
+            attrs['contiguous'] = True
         if o.get('is_private') == 'true':
-            _type.private = True
+            attrs['private'] = True
         if o.get('is_public') == 'true':
-            _type.public = True
+            attrs['public'] = True
         if o.get('is_save') == 'true':
-            _type.save = True
+            attrs['save'] = True
+
+        # The referenced type may be shared with a symbol table
+        if attrs:
+            _type = _type.clone(**attrs)
         return _type
 
     def visit_FfunctionType(self, o, **kwargs):
@@ -11,13 +11,14 @@ Preprocessing utilities for frontends.
 from collections import defaultdict, OrderedDict
 from pathlib import Path
 import io
+import os
 import re
 import pcpp
 from codetiming import Timer
 
 from loki.logging import debug, perf
 from loki.config import config
-from loki.tools import as_tuple, gettempdir, filehash
+from loki.tools import as_tuple, gettempdir, filehash, ContentCache
 from loki.visitors import FindNodes
 from loki.ir import VariableDeclaration, Intrinsic
 from loki.frontend.util import OMNI, OFP, FP, REGEX
@@ -26,13 +27,113 @@ from loki.frontend.util import OMNI, OFP, FP, REGEX
 __all__ = ['preprocess_cpp', 'sanitize_input', 'sanitize_registry', 'PPRule']
 
 
-def preprocess_cpp(source, filepath=None, includes=None, defines=None):
+_cpp_headers = {}
+"""Content and hash of the header files read by :any:`preprocess_cpp`, keyed by absolute file path"""
+
+_cpp_header_tokens = {}
+"""Tokenised lines of the header files in :data:`_cpp_headers`, keyed by file content"""
+
+
+def _read_cpp_header(path):
+    """
+    Return the cache entry ``(stat, content, hash)`` for the header file
+    :data:`path` in :data:`_cpp_headers`
+
+    The file is read only if it has not been read before or its modification
+    time or size have changed. As in ``pcpp``, a byte order mark is removed.
+    """
+    stat = os.stat(path)
+    stat = (stat.st_mtime_ns, stat.st_size)
+    entry = _cpp_headers.get(path)
+    if entry is None or entry[0] != stat:
+        with open(path, 'r') as f:  # pylint: disable=unspecified-encoding
+            content = f.read()
+        if content.startswith('\ufeff'):
+            content = content[1:]
+        if entry is not None:
+            _cpp_header_tokens.pop(entry[1], None)
+        entry = (stat, content, filehash(content))
+        _cpp_headers[path] = entry
+        _cpp_header_tokens.setdefault(content, None)
+    return entry
+
+
+class _LokiCPreprocessor(pcpp.Preprocessor):
+    """
+    The ``pcpp`` preprocessor used in :any:`preprocess_cpp`
+
+    Header files are read and tokenised only once per process and shared
+    between all instances. The absolute path and content hash of every file
+    included by an instance are recorded in :attr:`included_files`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.included_files = {}
+
+    def on_comment(self, tok):  # pylint: disable=unused-argument
+        # Pass through C-style comments
+        return True
+
+    def on_error(self, file, line, msg):
+        # Redirect CPP error to our logger and increment return code
+        debug(f'[Loki-CPP] {file}:{line: d} error: {msg}')
+        self.return_code += 1
+
+    def on_file_open(self, is_system_include, includepath):
+        entry = _read_cpp_header(includepath)
+        self.included_files[includepath] = entry[2]
+        return io.StringIO(entry[1])
+
+    def group_lines(self, input, abssource):  # pylint: disable=redefined-builtin
+        if input not in _cpp_header_tokens:
+            yield from super().group_lines(input, abssource)
+            return
+
+        lines = _cpp_header_tokens[input]
+        if lines is None:
+            lines = tuple(
+                tuple((type(tok), tok.__dict__) for tok in line)
+                for line in super().group_lines(input, abssource)
+            )
+            _cpp_header_tokens[input] = lines
+
+        # Tokens are modified during macro expansion, and we create new token
+        # objects from the cached attributes for each use
+        new = object.__new__
+        for line in lines:
+            tokens = []
+            for cls, attrs in line:
+                tok = new(cls)
+                tok.__dict__.update(attrs)
+                tok.source = abssource
+                tokens.append(tok)
+            yield tokens
+
+
+def _cpp_cache_key(source, includes, defines):
+    """
+    Compute the :any:`ContentCache` key for the preprocessed :data:`source`
+    """
+    includes = [os.path.abspath(str(i)) for i in includes]
+    return ContentCache.key('cpp', source, includes, defines, pcpp.__version__)
+
+
+def preprocess_cpp(source, filepath=None, includes=None, defines=None, cache=None):
     """
     Invoke an external C-preprocessor to sanitize input files.
 
     Note that the global option ``LOKI_CPP_DUMP_FILES`` will cause the intermediate
     preprocessed source to be written to a temporary file in ``LOKI_TMP_DIR``.
 
+    Header files are tokenised only once per process and re-used in
+    subsequent calls as long as they are unchanged. If a :data:`cache` is
+    given, the preprocessed source is stored in it, keyed by the source
+    string, include paths and definitions. A cached result is only used if
+    none of the header files included by the source have changed. Note that
+    header files that are added to an include path, and which would shadow
+    a previously included file, are not detected.
+
     Parameters
     ----------
     source : str
@@ -44,36 +145,52 @@ def preprocess_cpp(source, filepath=None, includes=None, defines=None):
         Include paths for the C-preprocessor.
     defines : (list of) str
         Symbol definitions to add to the C-preprocessor.
+    cache : :any:`ContentCache`, optional
+        Cache for the preprocessed source across runs
     """
-
-    class _LokiCPreprocessor(pcpp.Preprocessor):
-
-        def on_comment(self, tok):  # pylint: disable=unused-argument
-            # Pass through C-style comments
-            return True
-
-        def on_error(self, file, line, msg):
-            # Redirect CPP error to our logger and increment return code
-            debug(f'[Loki-CPP] {file}:{line: d} error: {msg}')
-            self.return_code += 1
-
-    # Add include paths to PP
-    pp = _LokiCPreprocessor()
-    # Suppress line directives
-    pp.line_directive = None
-
-    for i in as_tuple(includes):
-        pp.add_path(str(i))
-
-    # Add and sanitize defines to PP
-    for d in as_tuple(defines):
-        if '=' not in d:
-            d += '=1'
-        d = d.replace('=', ' ', 1)
-        pp.define(d)
-
-    # Parse source through preprocessor
-    pp.parse(source)
+    includes = as_tuple(includes)
+
+    # Sanitize defines
+    defines = tuple(d if '=' in d else f'{d}=1' for d in as_tuple(defines))
+
+    preprocessed = None
+    if cache is not None:
+        key = _cpp_cache_key(source, includes, defines)
+        entry = cache.get(key)
+        if entry is not None:
+            preprocessed, included_files = entry
+            try:
+                unchanged = all(
+                    _read_cpp_header(path)[2] == content_hash
+                    for path, content_hash in included_files.items()
+                )
+            except OSError:
+                unchanged = False
+            if not unchanged:
+                preprocessed = None
+
+    if preprocessed is None:
+        # Add include paths to PP
+        pp = _LokiCPreprocessor()
+        # Suppress line directives
+        pp.line_directive = None
+
+        for i in includes:
+            pp.add_path(str(i))
+
+        # Add defines to PP
+        for d in defines:
+            pp.define(d.replace('=', ' ', 1))
+
+        # Parse source through preprocessor
+        pp.parse(source)
+
+        s = io.StringIO()
+        pp.write(s)
+        preprocessed = s.getvalue()
+
+        if cache is not None:
+            cache.put(key, (preprocessed, pp.included_files))
 
     if config['cpp-dump-files']:
         if filepath is None:
@@ -83,17 +200,12 @@ def preprocess_cpp(source, filepath=None, includes=None, defines=None):
         pp_path = gettempdir()/pp_path.name
         debug(f'[Loki] C-preprocessor, writing {str(pp_path)}')
 
-        # Dump preprocessed source to file and read it
+        # Dump preprocessed source to file
         with pp_path.open('w') as f:
-            pp.write(f)
-        with pp_path.open('r') as f:
-            preprocessed = f.read()
-        return preprocessed
+            f.write(preprocessed)
 
     # Return the preprocessed string
-    s = io.StringIO()
-    pp.write(s)
-    return s.getvalue()
+    return preprocessed
 
 
 @Timer(logger=perf, text=lambda s: f'[Loki::Frontend] Executed sanitize_input in {s:.2f}s')
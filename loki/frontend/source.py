@@ -30,6 +30,11 @@ class Source:
     """
     Store information about the original source for an IR node.
 
+    The source string can either be given explicitly or as a span in a
+    shared :data:`buffer`, e.g., the full content of the source file. In the
+    latter case, the string is only materialized on access, which avoids
+    storing copies of the same text in every :any:`Source` object.
+
     Parameters
     ----------
     line : tuple
@@ -38,13 +43,39 @@ class Source:
         The original raw source string
     file : str (optional)
         The file name
+    buffer : str (optional)
+        A shared source string of which :data:`span` marks the source string
+        of this object. Ignored if :data:`string` is given.
+    span : tuple (optional)
+        Start and end index of the source string in :data:`buffer`
     """
 
-    def __init__(self, lines, string=None, file=None):
+    def __init__(self, lines, string=None, file=None, buffer=None, span=None):
         assert lines and len(lines) == 2 and (lines[1] is None or lines[1] >= lines[0])
         self.lines = lines
-        self.string = string
         self.file = file
+        if string is None and buffer is not None:
+            assert span and len(span) == 2
+            self._string = None
+            self._buffer = buffer
+            self._span = span
+        else:
+            self.string = string
+
+    @property
+    def string(self):
+        """
+        The original raw source string
+        """
+        if self._buffer is not None:
+            return self._buffer[self._span[0]:self._span[1]]
+        return self._string
+
+    @string.setter
+    def string(self, string):
+        self._string = string
+        self._buffer = None
+        self._span = None
 
     def __repr__(self):
         line_end = f'-{self.lines[1]}' if self.lines[1] else ''
@@ -52,7 +83,7 @@ class Source:
 
     def __eq__(self, o):
         if isinstance(o, Source):
-            return self.__dict__ == o.__dict__
+            return (self.lines, self.string, self.file) == (o.lines, o.string, o.file)
         return super().__eq__(o)
 
     def __hash__(self):
@@ -89,23 +120,26 @@ class Source:
         """
         cstart, cend = self.find(string, ignore_case=ignore_case, ignore_space=ignore_space)
         if None not in (cstart, cend):
-            string = self.string[cstart:cend]
-            lstart = self.lines[0] + self.string[:cstart].count('\n')
-            lend = lstart + string.count('\n')
-            lines = (lstart, lend)
-        else:
-            lines = self.lines
-        return Source(lines=lines, string=string, file=self.file)
+            return self.clone_with_span((cstart, cend))
+        return Source(lines=self.lines, string=string, file=self.file)
 
     def clone_with_span(self, span):
         """
         Clone the source object and extract the given line span from the original source
         string (relative to the string length).
         """
-        string = self.string[span[0]:span[1]]
-        lstart = self.lines[0] + self.string[:span[0]].count('\n')
-        lend = lstart + string.count('\n')
-        return Source(lines=(lstart, lend), string=string, file=self.file)
+        if self._buffer is None:
+            string = self.string[span[0]:span[1]]
+            lstart = self.lines[0] + self.string[:span[0]].count('\n')
+            lend = lstart + string.count('\n')
+            return Source(lines=(lstart, lend), string=string, file=self.file)
+
+        # Translate the span to absolute indices in the buffer
+        start, end, _ = slice(*span).indices(self._span[1] - self._span[0])
+        start, end = self._span[0] + start, self._span[0] + max(start, end)
+        lstart = self.lines[0] + self._buffer.count('\n', self._span[0], start)
+        lend = lstart + self._buffer.count('\n', start, end)
+        return Source(lines=(lstart, lend), file=self.file, buffer=self._buffer, span=(start, end))
 
     def clone_lines(self, span=None):
         """
@@ -113,10 +147,28 @@ class Source:
         """
         if span is not None:
             return self.clone_with_span(span).clone_lines()
-        return [
-            Source(lines=(self.lines[0]+idx,)*2, string=line, file=self.file)
-            for idx, line in enumerate(self.string.splitlines())
-        ]
+        if self._buffer is None or any(c in self.string for c in _line_boundaries):
+            return [
+                Source(lines=(self.lines[0]+idx,)*2, string=line, file=self.file)
+                for idx, line in enumerate(self.string.splitlines())
+            ]
+
+        # Create line-wise spans in the buffer, with the same semantics as ``splitlines``
+        sources = []
+        start, end = self._span
+        lineno = self.lines[0]
+        while start < end:
+            line_end = self._buffer.find('\n', start, end)
+            if line_end == -1:
+                line_end = end
+            sources += [Source(lines=(lineno, lineno), file=self.file, buffer=self._buffer, span=(start, line_end))]
+            start = line_end + 1
+            lineno += 1
+        return sources
+
+
+_line_boundaries = '\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+"""Line boundaries other than ``\\n`` that are recognized by :meth:`str.splitlines`"""
 
 
 class FortranReader:
@@ -148,14 +200,63 @@ class FortranReader:
         The sanitized source code
     sanitized_spans : list of int
         Start index of each line in the sanitized string
+
+    The original source code is stored only once and shared with all readers
+    created via :meth:`reader_from_sanitized_span` and all :any:`Source` objects
+    created by the reader, which reference it via the start index of each line.
     """
 
     def __init__(self, raw_source):
         self.line_offset = 0
         raw_source = raw_source.strip()
-        self.source_lines = raw_source.splitlines()
         self._sanitize_raw_source(raw_source)
 
+        # Store the source string with normalized line breaks and the start index
+        # of each line (plus the end of the last line) in the shared buffer
+        if any(c in raw_source for c in _line_boundaries):
+            raw_source = '\n'.join(raw_source.splitlines())
+        self._buffer = raw_source
+        if raw_source:
+            self._line_starts = (0,) + tuple(accumulate(len(line) + 1 for line in raw_source.split('\n')))
+        else:
+            self._line_starts = (0,)
+        self._num_lines = len(self._line_starts) - 1
+
+    @property
+    def source_lines(self):
+        """
+        The lines of the original source code covered by this reader
+        """
+        if not self._num_lines:
+            return []
+        return self._buffer_string(0, self._num_lines).split('\n')
+
+    def _buffer_span(self, start, end):
+        """
+        Return the span in the shared buffer for the lines of the original source
+        code with indices ``[start, end)``
+        """
+        start, end = max(start, 0), min(end, self._num_lines)
+        if start >= end:
+            return (0, 0)
+        start += self.line_offset
+        end += self.line_offset
+        return (self._line_starts[start], self._line_starts[end] - 1)
+
+    def _buffer_string(self, start, end):
+        """
+        Return the string of the lines of the original source code with indices ``[start, end)``
+        """
+        span = self._buffer_span(start, end)
+        return self._buffer[span[0]:span[1]]
+
+    def _source_from_lines(self, lines, start, end):
+        """
+        Create a :any:`Source` object for the lines of the original source code with
+        indices ``[start, end)``
+        """
+        return Source(lines=lines, buffer=self._buffer, span=self._buffer_span(start, end))
+
     @Timer(logger=debug, text=lambda s: f'[Loki::Frontend] Executed _sanitize_raw_source in {s:.2f}s')
     def _sanitize_raw_source(self, raw_source):
         """
@@ -224,7 +325,7 @@ class FortranReader:
             if sanitized_end == len(self.sanitized_lines):
                 # Span reaches until the end of the sanitized_string: include everything
                 # after it as well
-                source_end = len(self.source_lines)
+                source_end = self._num_lines
             else:
                 # Include everything until (but not including) the line corresponding to the
                 # first line after the span in the sanitized string
@@ -243,17 +344,13 @@ class FortranReader:
         """
         Create a :any:`Source` object with the content of the reader
         """
-        if not self.source_lines:
-            string = ''
-            lines = (self.line_offset + 1, self.line_offset + 1)
-        elif include_padding:
-            string = '\n'.join(self.source_lines)
-            lines = (self.line_offset + 1, self.line_offset + len(self.source_lines))
-        else:
-            lines = (self.sanitized_lines[0].span[0], self.sanitized_lines[-1].span[1])
-            index = (lines[0] - self.line_offset - 1, lines[1] - self.line_offset)
-            string = '\n'.join(self.source_lines[index[0]:index[1]])
-        return Source(lines=lines, string=string)
+        if not self._num_lines:
+            return Source(lines=(self.line_offset + 1, self.line_offset + 1), string='')
+        if include_padding:
+            lines = (self.line_offset + 1, self.line_offset + self._num_lines)
+            return self._source_from_lines(lines, 0, self._num_lines)
+        lines = (self.sanitized_lines[0].span[0], self.sanitized_lines[-1].span[1])
+        return self._source_from_lines(lines, lines[0] - self.line_offset - 1, lines[1] - self.line_offset)
 
     def source_from_head(self):
         """
@@ -263,22 +360,20 @@ class FortranReader:
         This means typically comments or preprocessor directives. Returns `None` if there
         is nothing.
         """
-        if not self.source_lines:
+        if not self._num_lines:
             return None
 
         if not self.sanitized_lines:
-            string = '\n'.join(self.source_lines)
-            lines = (self.line_offset + 1, self.line_offset + len(self.source_lines))
-            return Source(lines=lines, string=string)
+            lines = (self.line_offset + 1, self.line_offset + self._num_lines)
+            return self._source_from_lines(lines, 0, self._num_lines)
 
         line_diff = self.sanitized_lines[0].span[0] - self.line_offset
         if line_diff == 1:
             return None
         assert line_diff > 0
 
-        string = '\n'.join(self.source_lines[:line_diff - 1])
         lines = (self.line_offset + 1, self.sanitized_lines[0].span[0] - 1)
-        return Source(lines=lines, string=string)
+        return self._source_from_lines(lines, 0, line_diff - 1)
 
     def source_from_tail(self):
         """
@@ -291,15 +386,14 @@ class FortranReader:
         if not self.sanitized_lines:
             return None
 
-        line_diff = len(self.source_lines) + self.line_offset - self.sanitized_lines[-1].span[1]
+        line_diff = self._num_lines + self.line_offset - self.sanitized_lines[-1].span[1]
         if line_diff == 0:
             return None
         assert line_diff > 0
 
         start = self.sanitized_lines[-1].span[1] + 1
-        string = '\n'.join(self.source_lines[self.get_line_index(start):])
         lines = (start, start + line_diff - 1)
-        return Source(lines=lines, string=string)
+        return self._source_from_lines(lines, self.get_line_index(start), self._num_lines)
 
     def source_from_sanitized_span(self, span, include_padding=False):
         """
@@ -307,11 +401,11 @@ class FortranReader:
         to the given span in the sanitized string
         """
         *_, source_start, source_end = self.get_line_indices_from_span(span, include_padding)
-        string = '\n'.join(self.source_lines[source_start:source_end])
-        if not string:
+        buffer_span = self._buffer_span(source_start, source_end)
+        if buffer_span[0] == buffer_span[1]:
             return None
         lines = (self.line_offset + source_start + 1, self.line_offset + source_end)
-        return Source(lines=lines, string=string)
+        return Source(lines=lines, buffer=self._buffer, span=buffer_span)
 
     def reader_from_sanitized_span(self, span, include_padding=False):
         """
@@ -324,7 +418,9 @@ class FortranReader:
 
         new_reader = FortranReader.__new__(FortranReader)
         new_reader.line_offset = self.line_offset + source_start
-        new_reader.source_lines = self.source_lines[source_start:source_end]
+        new_reader._buffer = self._buffer
+        new_reader._line_starts = self._line_starts
+        new_reader._num_lines = max(0, min(source_end, self._num_lines) - source_start)
         new_reader.sanitized_lines = self.sanitized_lines[sanit_start:sanit_end]
         span_offset = self.sanitized_spans[sanit_start]
         new_reader.sanitized_spans = tuple(span - span_offset for span in self.sanitized_spans[sanit_start:sanit_end+1])
@@ -365,7 +461,7 @@ class FortranReader:
         line = self.current_line
         start = self.get_line_index(line.span[0])
         end = self.get_line_index(line.span[1])
-        return Source(lines=line.span, string='\n'.join(self.source_lines[start:end+1]))
+        return self._source_from_lines(line.span, start, end + 1)
 
 
 def extract_source(ast, text, label=None, full_lines=False):
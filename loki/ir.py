@@ -13,7 +13,6 @@ Control flow node classes for
 
 from collections import OrderedDict
 from dataclasses import dataclass
-from functools import partial
 from itertools import chain
 from typing import Any, Tuple, Union
 
@@ -40,6 +39,8 @@ __all__ = [
     'Import', 'VariableDeclaration', 'ProcedureDeclaration', 'DataDeclaration',
     'StatementFunction', 'TypeDef', 'MultiConditional', 'MaskedStatement',
     'Intrinsic', 'Enumeration', 'RawSource',
+    # Utility routines
+    'set_ir_validation', 'ModificationCounter',
 ]
 
 # Configuration for validation mechanism via pydantic
@@ -48,8 +49,68 @@ dataclass_validation_config  = {
     'arbitrary_types_allowed': True,
 }
 
-# Using this decorator, we can force strict validation
-dataclass_strict = partial(dataclass_validated, config=dataclass_validation_config)
+# Global switch for the validation of node arguments, see :any:`set_ir_validation`
+_validation_enabled = True
+
+# All node classes created via :any:`dataclass_strict`
+_validated_classes = []
+
+
+def dataclass_strict(**kwargs):
+    """
+    Class decorator that creates a :mod:`pydantic` dataclass with strict
+    validation of the constructor arguments
+
+    Validation is performed unless it has been switched off globally
+    via :any:`set_ir_validation`.
+    """
+    def decorator(cls):
+        cls = dataclass_validated(cls, config=dataclass_validation_config, **kwargs)
+        cls.__pydantic_run_validation__ = _validation_enabled
+        _validated_classes.append(cls)
+        return cls
+    return decorator
+
+
+def set_ir_validation(enabled):
+    """
+    Enable or disable the validation of constructor arguments of IR nodes
+
+    Validation checks the types of all arguments when IR nodes are created
+    or rebuilt, which incurs significant overhead when constructing large
+    control flow trees. Without validation, nodes are constructed like plain
+    frozen dataclasses and arguments are stored as given, i.e., without any
+    type coercion. This is the callback for the ``ir-validation`` option in
+    Loki's global config, which can be set via the environment variable
+    ``LOKI_IR_VALIDATION``.
+
+    Parameters
+    ----------
+    enabled : bool
+        Run validation of node arguments
+    """
+    global _validation_enabled  # pylint: disable=global-statement
+    _validation_enabled = bool(enabled)
+    for cls in _validated_classes:
+        cls.__pydantic_run_validation__ = _validation_enabled
+
+
+class ModificationCounter:
+    """
+    Counter of in-place updates to the nodes of an IR tree
+
+    The counter is registered with the nodes of the tree via
+    :meth:`Node._track_modifications` and incremented by any in-place update
+    of traversable properties of these nodes via :meth:`Node._update`.
+    This allows to detect modifications of the tree, e.g., of the IR of a
+    single :any:`ProgramUnit`, without a global counter that is affected by
+    updates to unrelated trees.
+    """
+
+    __slots__ = ('count',)
+
+    def __init__(self):
+        self.count = 0
 
 # Abstract base classes
 
@@ -139,8 +200,26 @@ class Node:
         """
         argnames = [i for i in self._traversable if i not in kwargs]
         kwargs.update(zip(argnames, args))
+        if args or not kwargs.keys().isdisjoint(self._traversable):
+            for counter in self.__dict__.get('_modification_counters', ()):
+                counter.count += 1
         self.__dict__.update(kwargs)
 
+    def _track_modifications(self, counter):
+        """
+        Register a :any:`ModificationCounter` that is incremented by any
+        in-place update of traversable properties of this node
+
+        Parameters
+        ----------
+        counter : :any:`ModificationCounter`
+            The counter of an IR tree that contains this node, which is
+            used to invalidate indices of the tree, such as :any:`NodeIndex`
+        """
+        counters = self.__dict__.get('_modification_counters', ())
+        if counter not in counters:
+            self.__dict__['_modification_counters'] = counters + (counter,)
+
     @property
     def args(self):
         """
@@ -243,6 +322,9 @@ class InternalNode(Node):
 
     def __post_init__(self):
         super().__post_init__()
+        if isinstance(self.body, list):
+            # Normalise the body if validation (and the implied type coercion) is disabled
+            self._update(body=tuple(self.body))
         assert self.body is None or isinstance(self.body, tuple)
 
     def __repr__(self):
@@ -328,6 +410,9 @@ class Section(InternalNode, _SectionBase):
 
     def __post_init__(self):
         super().__post_init__()
+        if isinstance(self.body, list):
+            # Normalise the body if validation (and the implied type coercion) is disabled
+            self._update(body=tuple(self.body))
         assert self.body is None or isinstance(self.body, tuple)
 
         # Ensure we have no nested tuples in the body
@@ -275,11 +275,15 @@ class Module(ProgramUnit):
         # TODO: We need to remove the AST, as certain AST types
         # (eg. FParser) are not pickle-safe.
         del s['_ast']
+        s.pop('_node_index', None)
+        s.pop('_ir_property_cache', None)
         return s
 
     def __setstate__(self, s):
         self.__dict__.update(s)
 
+        self._ast = None
+
         # Re-register all contained procedures in symbol table and update parentage
         if self.contains:
             for node in self.contains.body:
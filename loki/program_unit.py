@@ -6,6 +6,7 @@
 # nor does it submit to any jurisdiction.
 
 from abc import abstractmethod
+from types import MappingProxyType
 
 from loki import ir
 from loki.expression import Variable
@@ -17,10 +18,73 @@ from loki.logging import debug
 from loki.scope import Scope
 from loki.tools import CaseInsensitiveDict, as_tuple, flatten
 from loki.types import BasicType, DerivedType, ProcedureType
-from loki.visitors import FindNodes, Transformer
+from loki.visitors import FindNodes, NodeIndex, Transformer
 
 
-__all__ = ['ProgramUnit']
+__all__ = ['ProgramUnit', 'EnrichmentContext']
+
+
+class EnrichmentContext:
+    """
+    Precomputed lookup tables for a list of definitions that can be passed
+    to :any:`ProgramUnit.enrich` instead of the list of definitions
+
+    This avoids rebuilding the map of definitions and the symbol lookups in
+    imported modules for every program unit that is enriched, when the same
+    definitions are used for many program units, e.g., in the :any:`Scheduler`.
+    Lookup tables for individual modules are built lazily upon first use.
+
+    The context assumes that the set of symbols declared in each definition
+    does not change while it is in use.
+
+    Parameters
+    ----------
+    definitions : list of :any:`ProgramUnit`
+        A list of all available definitions
+    """
+
+    def __init__(self, definitions):
+        self.definitions = as_tuple(definitions)
+        self.definitions_map = CaseInsensitiveDict((r.name, r) for r in self.definitions)
+        self._symbols = {}
+        self._node_maps = {}
+
+    @classmethod
+    def create(cls, definitions):
+        """
+        Return :data:`definitions` if it is already an :any:`EnrichmentContext`
+        or create a new context otherwise
+        """
+        if isinstance(definitions, cls):
+            return definitions
+        return cls(definitions)
+
+    def get(self, name):
+        """
+        Return the definition with the given name or `None`
+        """
+        return self.definitions_map.get(name)
+
+    def symbols(self, unit):
+        """
+        Return :any:`ProgramUnit.symbols` of the given definition :data:`unit`
+        """
+        if id(unit) not in self._symbols:
+            self._symbols[id(unit)] = (unit, unit.symbols)
+        return self._symbols[id(unit)][1]
+
+    def lookup(self, unit, name):
+        """
+        Return the IR node for :data:`name` in the given definition :data:`unit`
+
+        This is equivalent to ``unit[name]``.
+        """
+        if id(unit) not in self._node_maps:
+            node_map = CaseInsensitiveDict((s.name, s) for s in self.symbols(unit))
+            node_map.update(unit.typedef_map)
+            node_map.update(unit.subroutine_map)
+            self._node_maps[id(unit)] = (unit, node_map)
+        return self._node_maps[id(unit)][1][name]
 
 
 class ProgramUnit(Scope):
@@ -280,15 +344,16 @@ class ProgramUnit(Scope):
 
         Parameters
         ----------
-        definitions : list of :any:`ProgramUnit`
-            A list of all available definitions
+        definitions : list of :any:`ProgramUnit` or :any:`EnrichmentContext`
+            A list of all available definitions, or a context object with
+            precomputed lookup tables for these definitions
         recurse : bool, optional
             Enrich contained scopes
         """
-        definitions_map = CaseInsensitiveDict((r.name, r) for r in as_tuple(definitions))
+        definitions = EnrichmentContext.create(definitions)
 
         for imprt in self.imports:
-            if not (module := definitions_map.get(imprt.module)):
+            if not (module := definitions.get(imprt.module)):
                 # Skip modules that are not available in the definitions list
                 continue
 
@@ -301,7 +366,7 @@ class ProgramUnit(Scope):
                 rename_list = CaseInsensitiveDict((k, v) for k, v in as_tuple(imprt.rename_list))
                 symbols = [
                     Variable(name=rename_list.get(symbol.name, symbol.name), scope=self)
-                    for symbol in module.symbols
+                    for symbol in definitions.symbols(module)
                 ]
 
             updated_symbol_attrs = {}
@@ -309,7 +374,7 @@ class ProgramUnit(Scope):
                 # Take care of renaming upon import
                 local_name = symbol.name
                 remote_name = symbol.type.use_name or local_name
-                remote_node = module[remote_name]
+                remote_node = definitions.lookup(module, remote_name)
 
                 if hasattr(remote_node, 'procedure_type'):
                     # This is a subroutine/function defined in the remote module
@@ -426,12 +491,64 @@ class ProgramUnit(Scope):
 
         return obj
 
+    @property
+    def node_index(self):
+        """
+        :any:`NodeIndex` of the :attr:`ir` of this unit
+
+        The index is built lazily on first access and rebuilt when a node
+        of this unit's IR has been updated in-place or a component of the
+        IR has been replaced since it was built. Modifications are tracked
+        via a :any:`ModificationCounter` owned by this unit, such that
+        updates to other program units do not invalidate the index.
+        """
+        index = getattr(self, '_node_index', None)
+        unit_ir = self.ir
+        if index is None or not index.is_valid(unit_ir):
+            counter = getattr(self, '_modification_counter', None)
+            if counter is None:
+                counter = ir.ModificationCounter()
+                self._modification_counter = counter
+            index = NodeIndex(unit_ir, counter=counter)
+            self._node_index = index
+        return index
+
+    def _find_nodes(self, match, section):
+        """
+        Return all nodes of type :data:`match` in :data:`section`, using the
+        :attr:`node_index` of this unit
+
+        This is equivalent to ``FindNodes(match).visit(section)``.
+        """
+        if section is None:
+            return ()
+        return as_tuple(self.node_index.find(match, root=section))
+
+    def _cached_ir_property(self, name, builder):
+        """
+        Return the value of the IR-derived property :data:`name`, which is
+        computed by :data:`builder` and cached until the :attr:`node_index`
+        of this unit is rebuilt
+
+        Note that the returned objects are shared between all callers. Builders
+        must therefore return immutable objects, such as tuples or read-only
+        mapping views (:any:`types.MappingProxyType`).
+        """
+        index = self.node_index
+        cache = getattr(self, '_ir_property_cache', None)
+        if cache is None or cache[0] is not index:
+            cache = (index, {})
+            self._ir_property_cache = cache
+        if name not in cache[1]:
+            cache[1][name] = builder()
+        return cache[1][name]
+
     @property
     def typedefs(self):
         """
         Return the :any:`TypeDef` defined in the :attr:`spec` of this unit
         """
-        return as_tuple(FindNodes(ir.TypeDef).visit(self.spec))
+        return self._find_nodes(ir.TypeDef, self.spec)
 
     @property
     def typedef_map(self):
@@ -445,14 +562,16 @@ class ProgramUnit(Scope):
         """
         Return the declarations from the :attr:`spec` of this unit
         """
-        return as_tuple(FindNodes((ir.VariableDeclaration, ir.ProcedureDeclaration)).visit(self.spec))
+        return self._find_nodes((ir.VariableDeclaration, ir.ProcedureDeclaration), self.spec)
 
     @property
     def variables(self):
         """
         Return the variables declared in the :attr:`spec` of this unit
         """
-        return as_tuple(flatten(decl.symbols for decl in self.declarations))
+        return self._cached_ir_property(
+            'variables', lambda: as_tuple(flatten(decl.symbols for decl in self.declarations))
+        )
 
     @variables.setter
     def variables(self, variables):
@@ -487,40 +606,58 @@ class ProgramUnit(Scope):
     def variable_map(self):
         """
         Map of variable names to :any:`Variable` objects
+
+        The map is cached until the IR of this unit changes and is returned
+        as a read-only view. Use a copy to build derived maps.
         """
-        return CaseInsensitiveDict((v.name, v) for v in self.variables)
+        return self._cached_ir_property(
+            'variable_map', lambda: MappingProxyType(CaseInsensitiveDict((v.name, v) for v in self.variables))
+        )
 
     @property
     def imports(self):
         """
         Return the list of :any:`Import` in this unit
         """
-        return as_tuple(FindNodes(ir.Import).visit(self.spec or ()))
+        return self._cached_ir_property('imports', lambda: self._find_nodes(ir.Import, self.spec))
 
     @property
     def import_map(self):
         """
         Map of imported symbol names to :any:`Import` objects
+
+        The map is cached until the IR of this unit changes and is returned
+        as a read-only view. Use a copy to build derived maps.
         """
-        return CaseInsensitiveDict((s.name, imprt) for imprt in self.imports for s in imprt.symbols)
+        return self._cached_ir_property(
+            'import_map',
+            lambda: MappingProxyType(CaseInsensitiveDict(
+                (s.name, imprt) for imprt in self.imports for s in imprt.symbols
+            ))
+        )
 
     @property
     def imported_symbols(self):
         """
         Return the symbols imported in this unit
         """
-        imports = self.imports
-        return as_tuple(flatten(
+        return self._cached_ir_property('imported_symbols', lambda: as_tuple(flatten(
             imprt.symbols or [s[1] for s in imprt.rename_list or []]
-            for imprt in imports
-        ))
+            for imprt in self.imports
+        )))
 
     @property
     def imported_symbol_map(self):
         """
         Map of imported symbol names to objects
+
+        The map is cached until the IR of this unit changes and is returned
+        as a read-only view. Use a copy to build derived maps.
         """
-        return CaseInsensitiveDict((s.name, s) for s in self.imported_symbols)
+        return self._cached_ir_property(
+            'imported_symbol_map',
+            lambda: MappingProxyType(CaseInsensitiveDict((s.name, s) for s in self.imported_symbols))
+        )
 
     @property
     def all_imports(self):
@@ -538,7 +675,7 @@ class ProgramUnit(Scope):
         """
         Return the list of :any:`Interface` declared in this unit
         """
-        return as_tuple(FindNodes(ir.Interface).visit(self.spec))
+        return self._find_nodes(ir.Interface, self.spec)
 
     @property
     def interface_symbols(self):
@@ -570,7 +707,7 @@ class ProgramUnit(Scope):
         """
         List of symbols defined via an enum
         """
-        return as_tuple(flatten(enum.symbols for enum in FindNodes(ir.Enumeration).visit(self.spec or ())))
+        return as_tuple(flatten(enum.symbols for enum in self._find_nodes(ir.Enumeration, self.spec)))
 
     @property
     def definitions(self):
@@ -588,8 +725,8 @@ class ProgramUnit(Scope):
         """
 
         #Find all nodes that may contain symbols
-        nodelist = FindNodes((ir.VariableDeclaration, ir.ProcedureDeclaration,
-                    ir.Import, ir.Interface, ir.Enumeration)).visit(self.spec or ())
+        nodelist = self._find_nodes((ir.VariableDeclaration, ir.ProcedureDeclaration,
+                                     ir.Import, ir.Interface, ir.Enumeration), self.spec)
 
         #Return all symbols found in nodelist as well as any procedure_symbols
         #in contained subroutines
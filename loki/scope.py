@@ -31,6 +31,10 @@ class SymbolTable(dict):
 
     The interface of this table behaves like a :any:`dict`.
 
+    Stored :any:`SymbolAttributes` objects are shared by all look-ups and
+    are immutable (see :meth:`SymbolAttributes.share`). To update the
+    attributes of a symbol, a modified clone has to be stored in the table.
+
     Parameters
     ----------
     parent : :any:`SymbolTable`, optional
@@ -126,7 +130,7 @@ class SymbolTable(dict):
         value = super().get(name, None)
         if value is None and recursive and self.parent is not None:
             return self.parent._lookup_formatted_name(name, recursive)
-        return value.clone() if value is not None else None
+        return value
 
     def lookup(self, name, recursive=True):
         """
@@ -142,6 +146,7 @@ class SymbolTable(dict):
         Returns
         -------
         :any:`SymbolAttributes` or `None`
+            The shared, immutable attributes object stored in the table
         """
         formatted_name = self.format_lookup_name(name)  # pylint: disable=assignment-from-no-return
         value = self._lookup_formatted_name(formatted_name, recursive)
@@ -154,7 +159,7 @@ class SymbolTable(dict):
         value = self.lookup(key, recursive=False)
         if value is None:
             raise KeyError(key)
-        return value.clone()
+        return value
 
     def get(self, key, default=None):
         """
@@ -168,12 +173,12 @@ class SymbolTable(dict):
             Return this value if :attr:`key` is not found in the table
         """
         value = self.lookup(key, recursive=False)
-        return value.clone() if value is not None else default
+        return value if value is not None else default
 
     def __setitem__(self, key, value):
         assert isinstance(value, SymbolAttributes)
         name_parts = self.format_lookup_name(key)  # pylint: disable=assignment-from-no-return
-        super().__setitem__(name_parts, value.clone())
+        super().__setitem__(name_parts, value.share())
 
     def __hash__(self):
         return hash(tuple(self.keys()))
@@ -205,16 +210,16 @@ class SymbolTable(dict):
         if default is None:
             default = SymbolAttributes(BasicType.DEFERRED)
         assert isinstance(default, SymbolAttributes)
-        super().setdefault(self.format_lookup_name(key), default.clone())
+        super().setdefault(self.format_lookup_name(key), default.share())
 
     def update(self, other):
         """
         Update this symbol table with entries from :attr:`other`
         """
         if isinstance(other, dict):
-            other = {self.format_lookup_name(k): v.clone() for k, v in other.items()}
+            other = {self.format_lookup_name(k): v.share() for k, v in other.items()}
         else:
-            other = {self.format_lookup_name(k): v.clone() for k, v in other}
+            other = {self.format_lookup_name(k): v.share() for k, v in other}
         super().update(other)
 
     def clone(self, **kwargs):
@@ -230,7 +235,7 @@ class SymbolTable(dict):
         Returns
         -------
         :any:`SymbolTable`
-            The clone symbol table with copies of all :any:`SymbolAttributes`
+            The clone symbol table, which shares all :any:`SymbolAttributes`
         """
         if self.case_sensitive and 'case_sensitive' not in kwargs:
             kwargs['case_sensitive'] = self.case_sensitive
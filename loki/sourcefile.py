@@ -9,6 +9,8 @@
 Contains the declaration of :any:`Sourcefile` that is used to represent and
 manipulate (Fortran) source code files.
 """
+import re
+from importlib.metadata import version, PackageNotFoundError
 from pathlib import Path
 from codetiming import Timer
 
@@ -18,20 +20,110 @@ from loki.frontend import (
     OMNI, OFP, FP, REGEX, sanitize_input, Source, read_file, preprocess_cpp,
     parse_omni_source, parse_ofp_source, parse_fparser_source,
     parse_omni_ast, parse_ofp_ast, parse_fparser_ast, parse_regex_source,
-    RegexParserClass
+    RegexParserClass, iterparse_omni_source, parse_omni_events, generate_omni_xmods
 
 )
-from loki.ir import Section, RawSource, Comment, PreprocessorDirective
+from loki.ir import Section, RawSource, Comment, PreprocessorDirective, ScopedNode, TypeDef
 from loki.logging import info, perf
 from loki.module import Module
-from loki.program_unit import ProgramUnit
+from loki.program_unit import ProgramUnit, EnrichmentContext
 from loki.subroutine import Subroutine
-from loki.tools import flatten, as_tuple
+from loki.tools import flatten, as_tuple, ContentCache
+from loki.types import DerivedType
+from loki.visitors import FindNodes
+from loki.config import config
 
 
 __all__ = ['Sourcefile']
 
 
+_re_use_module = re.compile(r'^[ \t]*use\b(?:[ \t]*,[ \t]*\w+)?[ \t]*(?:::)?[ \t]*(\w+)', re.IGNORECASE | re.MULTILINE)
+
+_parse_caches = {}
+
+
+def _get_parse_cache():
+    """
+    Return the :any:`ContentCache` for parse results in the configured
+    ``parse-cache-dir`` or `None` if the parse cache is disabled
+    """
+    if not config['parse-cache-dir']:
+        return None
+    path = Path(config['parse-cache-dir'])
+    if path not in _parse_caches:
+        max_size = config['parse-cache-size']
+        max_size = max_size * 1024 * 1024 if max_size else None
+        _parse_caches[path] = ContentCache(path, max_size=max_size)
+    return _parse_caches[path]
+
+
+def _package_version(name):
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
+
+
+def _parse_cache_key(kind, raw_source, definitions):
+    """
+    Compute the key for the parse result of :data:`raw_source`
+
+    The key includes the source string, the versions of Loki and fparser,
+    and the source of all :data:`definitions` that are imported by
+    :data:`raw_source`, either directly or transitively via the imports of
+    these definitions. The file path is not part of the key, which allows
+    identical sources at different paths to share a cache entry.
+    """
+    definition_map = {d.name.lower(): d for d in as_tuple(definitions)}
+    definitions_key = {}
+    imported = [name.lower() for name in _re_use_module.findall(raw_source)]
+    while imported:
+        name = imported.pop()
+        if name in definitions_key or (d := definition_map.get(name)) is None:
+            continue
+        d_source = d.source.string if d.source is not None and d.source.string else d.to_fortran()
+        definitions_key[name] = (name, d._incomplete, ContentCache.key(d_source))
+        imported += [name.lower() for name in _re_use_module.findall(d_source)]
+    return ContentCache.key(
+        kind, raw_source, _package_version('loki'), _package_version('fparser'),
+        sorted(definitions_key.values())
+    )
+
+
+def _relink_path(source, path):
+    """
+    Update the path of a :any:`Sourcefile` loaded from the parse cache, which
+    may have been stored for an identical source at a different path
+    """
+    source.path = Path(path) if path is not None else path
+    if source.source is not None:
+        source.source.file = path
+
+
+def _relink_typedefs(unit):
+    """
+    Update derived types in the symbol tables of :data:`unit` and all nested
+    scopes to use the :any:`TypeDef` of the type's symbol in the scope hierarchy
+    """
+    scopes = [unit]
+    while scopes:
+        scope = scopes.pop()
+        updated_symbol_attrs = {}
+        for name, attrs in scope.symbol_attrs.items():
+            if not isinstance(attrs.dtype, DerivedType) or not isinstance(attrs.dtype.typedef, TypeDef):
+                continue
+            type_attrs = scope.symbol_attrs.lookup(attrs.dtype.name)
+            if type_attrs is None or not isinstance(type_attrs.dtype, DerivedType):
+                continue
+            if isinstance(type_attrs.dtype.typedef, TypeDef) and type_attrs.dtype.typedef is not attrs.dtype.typedef:
+                updated_symbol_attrs[name] = attrs.clone(dtype=type_attrs.dtype)
+        scope.symbol_attrs.update(updated_symbol_attrs)
+
+        if isinstance(scope, ProgramUnit):
+            scopes += list(scope.subroutines)
+            scopes += FindNodes(ScopedNode).visit(scope.ir)
+
+
 class Sourcefile:
     """
     Class to handle and manipulate source files, storing :any:`Module` and
@@ -119,7 +211,8 @@ class Sourcefile:
                 # Trigger CPP-preprocessing explicitly, as includes and
                 # defines can also be used by our OMNI frontend
                 source = preprocess_cpp(source=raw_source, filepath=filepath,
-                                        includes=includes, defines=defines)
+                                        includes=includes, defines=defines,
+                                        cache=_get_parse_cache())
             else:
                 source = raw_source
 
@@ -166,13 +259,13 @@ class Sourcefile:
             :data:`includes`, otherwise :data:`omni_includes` defaults to the
             value of :data:`includes`.
         """
-        # Always CPP-preprocess source files for OMNI, but optionally
-        # use a different set of include paths if specified that way.
-        # (It's a hack, I know, but OMNI sucks, so what can I do...?)
-        if omni_includes is not None and len(omni_includes) > 0:
-            includes = omni_includes
-        source = preprocess_cpp(raw_source, filepath=filepath,
-                                includes=includes, defines=defines)
+        source = cls._preprocess_omni(raw_source, filepath, includes=includes,
+                                      defines=defines, omni_includes=omni_includes)
+
+        if config['omni-stream-xml']:
+            events = iterparse_omni_source(source=source, filepath=filepath, xmods=xmods)
+            return cls._from_omni_events(events=events, path=filepath, raw_source=raw_source,
+                                         definitions=definitions)
 
         # Parse the file content into an OMNI Fortran AST
         ast = parse_omni_source(source=source, filepath=filepath, xmods=xmods)
@@ -180,6 +273,49 @@ class Sourcefile:
         return cls._from_omni_ast(ast=ast, path=filepath, raw_source=raw_source,
                                   definitions=definitions, typetable=typetable)
 
+    @staticmethod
+    def _preprocess_omni(raw_source, filepath, includes=None, defines=None, omni_includes=None):
+        """
+        Apply the C-preprocessor to a source string as input for the OMNI frontend
+        """
+        # Always CPP-preprocess source files for OMNI, but optionally
+        # use a different set of include paths if specified that way.
+        # (It's a hack, I know, but OMNI sucks, so what can I do...?)
+        if omni_includes is not None and len(omni_includes) > 0:
+            includes = omni_includes
+        return preprocess_cpp(raw_source, filepath=filepath,
+                              includes=includes, defines=defines,
+                              cache=_get_parse_cache())
+
+    @classmethod
+    def generate_omni_xmods(cls, raw_source, filepath, includes=None, defines=None,
+                            xmods=None, omni_includes=None):
+        """
+        Generate the ``.xmod`` files for the modules defined in a given source
+        string with the OMNI frontend, without parsing it
+
+        The source string is preprocessed in the same way as in :meth:`from_omni`.
+
+        Parameters
+        ----------
+        raw_source : str
+            Fortran source string
+        filepath : str or :any:`pathlib.Path`
+            The filepath of this source file
+        includes : list of str, optional
+            Include paths to pass to the C-preprocessor.
+        defines : list of str, optional
+            Symbol definitions to pass to the C-preprocessor.
+        xmods : str, optional
+            Path to directory to find and store ``.xmod`` files.
+        omni_includes: list of str, optional
+            Include paths that replace :data:`includes` for the OMNI frontend,
+            as in :meth:`from_omni`.
+        """
+        source = cls._preprocess_omni(raw_source, filepath, includes=includes,
+                                      defines=defines, omni_includes=omni_includes)
+        generate_omni_xmods(source, filepath=filepath, xmods=xmods)
+
     @classmethod
     def _from_omni_ast(cls, ast, path=None, raw_source=None, definitions=None, typetable=None):
         """
@@ -200,6 +336,18 @@ class Sourcefile:
         source = Source(lines, string=raw_source, file=path)
         return cls(path=path, ir=ir, ast=ast, source=source)
 
+    @classmethod
+    def _from_omni_events(cls, events, path=None, raw_source=None, definitions=None):
+        """
+        Generate the full set of `Subroutine` and `Module` members of the `Sourcefile`
+        from a stream of OMNI XML parse events, without retaining the XML tree.
+        """
+        ir = parse_omni_events(events=events, definitions=definitions, raw_source=raw_source)
+
+        lines = (1, raw_source.count('\n') + 1)
+        source = Source(lines, string=raw_source, file=path)
+        return cls(path=path, ir=ir, source=source)
+
     @classmethod
     def from_ofp(cls, raw_source, filepath, definitions=None):
         """
@@ -250,6 +398,15 @@ class Sourcefile:
         definitions : list
             List of external :any:`Module` to provide derived-type and procedure declarations
         """
+        # Re-use the result of a previous parse from the parse cache
+        if (cache := _get_parse_cache()) is not None:
+            key = _parse_cache_key('from_fparser', raw_source, definitions)
+            if (obj := cache.get(key)) is not None:
+                perf(f'[Loki::Sourcefile] Loaded {filepath} from parse cache')
+                _relink_path(obj, filepath)
+                obj.relink_definitions(definitions)
+                return obj
+
         # Preprocess using internal frontend-specific PP rules
         # to sanitize input and work around known frontend problems.
         source, pp_info = sanitize_input(source=raw_source, frontend=FP)
@@ -257,8 +414,12 @@ class Sourcefile:
         # Parse the file content into a Fortran AST
         ast = parse_fparser_source(source)
 
-        return cls._from_fparser_ast(path=filepath, ast=ast, definitions=definitions,
-                                     pp_info=pp_info, raw_source=raw_source)
+        obj = cls._from_fparser_ast(path=filepath, ast=ast, definitions=definitions,
+                                    pp_info=pp_info, raw_source=raw_source)
+
+        if cache is not None:
+            cache.put(key, obj)
+        return obj
 
     @classmethod
     def _from_fparser_ast(cls, ast, path=None, raw_source=None, definitions=None, pp_info=None):
@@ -308,6 +469,10 @@ class Sourcefile:
             return cls.from_regex(source, filepath=None, parser_classes=parser_classes)
 
         if frontend == OMNI:
+            if config['omni-stream-xml']:
+                events = iterparse_omni_source(source, xmods=xmods)
+                return cls._from_omni_events(path=None, events=events, raw_source=source,
+                                             definitions=definitions)
             ast = parse_omni_source(source, xmods=xmods)
             typetable = ast.find('typeTable')
             return cls._from_omni_ast(path=None, ast=ast, raw_source=source,
@@ -332,11 +497,28 @@ class Sourcefile:
         :any:`RawSource` nodes in the :attr:`Sourcefile.ir`.
 
         Existing :any:`Module` and :any:`Subroutine` objects continue to exist and references
-        to them stay valid, as they will only be updated instead of replaced.
+        to them stay valid, as they will only be updated instead of replaced. The exception
+        to this is when the parse cache is enabled (via the ``parse-cache-dir`` config option)
+        and the result of a previous parse with the :any:`FP` frontend is re-used, in which
+        case the cached program units replace the existing objects.
         """
         if not self._incomplete:
             return
 
+        # Re-use the result of a previous parse from the parse cache
+        cache = None
+        if frontend_args.get('frontend', FP) == FP and self.source is not None and self.source.string:
+            if (cache := _get_parse_cache()) is not None:
+                definitions = frontend_args.get('definitions')
+                key = _parse_cache_key('make_complete', self.source.string, definitions)
+                if (obj := cache.get(key)) is not None:
+                    perf(f'[Loki::Sourcefile] Loaded {self.path} from parse cache')
+                    path = self.path
+                    self.__dict__.update(obj.__dict__)
+                    _relink_path(self, path)
+                    self.relink_definitions(definitions)
+                    return
+
         log = f'[Loki::Sourcefile] Finished constructing from {self.path}' + ' in {:.2f}s'
         with Timer(logger=info, text=log):
 
@@ -408,6 +590,29 @@ class Sourcefile:
                     parser_classes = self._parser_classes | parser_classes
                 self._parser_classes = parser_classes
 
+        if cache is not None:
+            cache.put(key, self)
+
+    def relink_definitions(self, definitions):
+        """
+        Attach :data:`definitions` to all program units in this source file
+
+        This enriches imports via :any:`ProgramUnit.enrich` and updates derived
+        types to use the :any:`TypeDef` of the attached definitions. This is
+        required when the IR has been unpickled, e.g., when loaded from the
+        parse cache or received from a worker process, as it refers to copies
+        of the definitions that were used during parsing.
+
+        Parameters
+        ----------
+        definitions : list of :any:`ProgramUnit` or :any:`EnrichmentContext`
+            :any:`Module` and :any:`Subroutine` objects to attach
+        """
+        definitions = EnrichmentContext.create(definitions)
+        for node in self.definitions:
+            node.enrich(definitions, recurse=True)
+            _relink_typedefs(node)
+
     @property
     def source(self):
         return self._source
@@ -520,6 +725,10 @@ class Sourcefile:
         _ignore = ('_ast',)
         return dict((k, v) for k, v in self.__dict__.items() if k not in _ignore)
 
+    def __setstate__(self, s):
+        self.__dict__.update(s)
+        self._ast = None
+
     def apply(self, op, **kwargs):
         """
         Apply a given transformation to the source file object.
@@ -13,8 +13,8 @@ from loki.frontend import (
 )
 from loki.logging import debug
 from loki.pragma_utils import is_loki_pragma, pragmas_attached
-from loki.program_unit import ProgramUnit
-from loki.tools import as_tuple, CaseInsensitiveDict
+from loki.program_unit import ProgramUnit, EnrichmentContext
+from loki.tools import as_tuple
 from loki.types import BasicType, ProcedureType, SymbolAttributes
 from loki.visitors import FindNodes, Transformer
 
@@ -116,7 +116,7 @@ class Subroutine(ProgramUnit):
         )
 
     def __getstate__(self):
-        _ignore = ('_ast', '_parent')
+        _ignore = ('_ast', '_parent', '_node_index', '_ir_property_cache')
         return dict((k, v) for k, v in self.__dict__.items() if k not in _ignore)
 
     def __setstate__(self, s):
@@ -380,7 +380,7 @@ class Subroutine(ProgramUnit):
         # FIXME: This will fail if one of the argument is declared via an interface!
 
         # First map variables to existing declarations
-        declarations = FindNodes((ir.VariableDeclaration, ir.ProcedureDeclaration)).visit(self.spec)
+        declarations = self.declarations
         decl_map = dict((v, decl) for decl in declarations for v in decl.symbols)
 
         arguments = as_tuple(arguments)
@@ -424,7 +424,7 @@ class Subroutine(ProgramUnit):
         arg_names = [arg.name for arg in self.arguments]
         routine = Subroutine(name=self.name, args=arg_names, spec=None, body=None)
         decl_map = {}
-        for decl in FindNodes((ir.VariableDeclaration, ir.ProcedureDeclaration)).visit(self.spec):
+        for decl in self.declarations:
             if any(v.name in arg_names for v in decl.symbols):
                 assert all(v.name in arg_names and v.type.intent is not None for v in decl.symbols), \
                     "Declarations must have intents and dummy and local arguments cannot be mixed."
@@ -443,26 +443,28 @@ class Subroutine(ProgramUnit):
 
         Parameters
         ----------
-        definitions : list of :any:`ProgramUnit`
-            A list of all available definitions
+        definitions : list of :any:`ProgramUnit` or :any:`EnrichmentContext`
+            A list of all available definitions, or a context object with
+            precomputed lookup tables for these definitions
         recurse : bool, optional
             Enrich contained scopes
         """
+        definitions = EnrichmentContext.create(definitions)
+
         # First, enrich imported symbols
         super().enrich(definitions, recurse=recurse)
 
         # Secondly, take care of procedures that are declared via interface block includes
         # and therefore are not discovered via module imports
-        definitions_map = CaseInsensitiveDict((r.name, r) for r in as_tuple(definitions))
         with pragmas_attached(self, ir.CallStatement, attach_pragma_post=False):
-            for call in FindNodes(ir.CallStatement).visit(self.body):
+            for call in self._find_nodes(ir.CallStatement, self.body):
                 # Calls marked as 'reference' are inactive and thus skipped
                 not_active = is_loki_pragma(call.pragma, starts_with='reference')
                 if call.not_active is not not_active:
                     call._update(not_active=not_active)
 
                 symbol = call.name
-                routine = definitions_map.get(symbol.name)
+                routine = definitions.get(symbol.name)
 
                 if not routine and symbol.parent:
                     # Type-bound procedure: try to obtain procedure from typedef
@@ -24,7 +24,7 @@ from loki.config import config
 
 __all__ = [
     'gettempdir', 'filehash', 'delete', 'find_paths', 'find_files',
-    'disk_cached', 'load_module'
+    'disk_cached', 'ContentCache', 'load_module'
 ]
 
 
@@ -150,6 +150,119 @@ def disk_cached(argname, suffix='cache'):
     return decorator
 
 
+class ContentCache:
+    """
+    Content-addressed cache that stores pickled objects in a directory
+
+    Entries are identified by a hash of arbitrary key components (see
+    :meth:`key`), making the cache independent of file locations and
+    modification times. The total size of the cache directory is bounded by
+    :data:`max_size`, with the least recently used entries evicted first.
+
+    Parameters
+    ----------
+    path : str or :any:`pathlib.Path`
+        Directory in which to store cache entries
+    max_size : int, optional
+        Maximum total size of all entries in bytes. No limit if not given.
+    """
+
+    suffix = '.pickle'
+
+    def __init__(self, path, max_size=None):
+        self.path = Path(path)
+        self.max_size = max_size
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._size = None
+
+    @staticmethod
+    def key(*parts):
+        """
+        Compute a cache key from the string representation of :data:`parts`
+        """
+        h = md5()
+        for part in parts:
+            h.update(str(part).encode())
+            h.update(b'\0')
+        return h.hexdigest()
+
+    def _entry(self, key):
+        return self.path/f'{key}{self.suffix}'
+
+    def get(self, key):
+        """
+        Return the object stored under :data:`key` or `None` if not cached
+
+        The access time of the entry is updated for LRU eviction. Entries
+        that cannot be loaded are removed from the cache.
+        """
+        entry = self._entry(key)
+        try:
+            with entry.open('rb') as f:
+                obj = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # pylint: disable=broad-except
+            debug(f'[Loki] Removing unreadable cache entry {entry}: {e}')
+            entry.unlink(missing_ok=True)
+            return None
+        os.utime(entry)
+        return obj
+
+    def put(self, key, obj):
+        """
+        Store :data:`obj` under :data:`key` and evict old entries if necessary
+        """
+        entry = self._entry(key)
+        tmp_entry = entry.with_name(f'{entry.name}.{os.getpid()}.tmp')
+        with tmp_entry.open('wb') as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            old_size = entry.stat().st_size
+        except FileNotFoundError:
+            old_size = 0
+        os.replace(tmp_entry, entry)
+
+        if self.max_size is not None:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            else:
+                # Account for the entry that has been overwritten
+                self._size += entry.stat().st_size - old_size
+            if self._size > self.max_size:
+                self.evict()
+
+    def _entries(self):
+        """
+        List of tuples ``(mtime, size, path)`` for all entries in the cache
+        """
+        entries = []
+        for entry in self.path.glob(f'*{self.suffix}'):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries += [(stat.st_mtime, stat.st_size, entry)]
+        return entries
+
+    def evict(self):
+        """
+        Remove least recently used entries until the total size of the
+        cache does not exceed :attr:`max_size`
+        """
+        if self.max_size is None:
+            return
+
+        entries = self._entries()
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if self._size <= self.max_size:
+                break
+            debug(f'[Loki] Evicting cache entry {entry}')
+            entry.unlink(missing_ok=True)
+            self._size -= size
+
+
 def load_module(module, path=None):
     """
     Handle import paths and load the compiled module
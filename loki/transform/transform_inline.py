@@ -13,7 +13,7 @@ Collection of utility routines to perform code-level force-inlining.
 from collections import defaultdict
 
 from loki.expression import (
-    FindVariables, FindInlineCalls, FindLiterals,
+    FindVariables, FindInlineCalls, FindLiterals, MultiExpressionFinder,
     SubstituteExpressions, LokiIdentityMapper
 )
 from loki.ir import Import, Comment, Assignment, VariableDeclaration, CallStatement
@@ -372,7 +372,10 @@ def map_call_to_procedure_body(call, caller):
         raise RuntimeError('Procedure definition not found! ')
 
     argmap = {}
-    callee_vars = FindVariables().visit(callee.body)
+    found = MultiExpressionFinder(
+        {'variables': FindVariables, 'calls': FindInlineCalls}
+    ).visit(callee.body)
+    callee_vars = found['variables']
 
     # Match dimension indexes between the argument and the given value
     # for all occurences of the argument in the body
@@ -405,7 +408,7 @@ def map_call_to_procedure_body(call, caller):
 
     # Deal with PRESENT check for optional arguments
     present_checks = tuple(
-        check for check in FindInlineCalls().visit(callee.body) if check.function == 'PRESENT'
+        check for check in found['calls'] if check.function == 'PRESENT'
     )
     present_map = {
         check: sym.Literal('.true.') if check.arguments[0] in call.arg_map else sym.Literal('.false.')
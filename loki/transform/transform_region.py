@@ -202,7 +202,7 @@ def region_to_call(routine):
                 region_routine.rescope_symbols()
 
                 # Build the call signature
-                region_routine_var_map = region_routine.variable_map
+                region_routine_var_map = region_routine.variable_map.copy()
                 region_routine_arguments = []
                 for intent, args in zip(('in', 'inout', 'out'), (region_in_args, region_inout_args, region_out_args)):
                     for arg in args:
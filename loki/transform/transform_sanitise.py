@@ -43,6 +43,9 @@ class SanitiseTransformation(Transformation):
         ranges; default: False.
     """
 
+    # Sanitisation steps modify only the processed routine
+    item_local = True
+
     def __init__(
             self, resolve_associate_mappings=True, resolve_sequence_association=False
     ):
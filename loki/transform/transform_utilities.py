@@ -13,7 +13,7 @@ import platform
 from collections import defaultdict
 from pymbolic.primitives import Expression
 from loki.expression import (
-    symbols as sym, FindVariables, FindInlineCalls, FindLiterals,
+    symbols as sym, FindVariables, FindInlineCalls, FindLiterals, MultiExpressionFinder,
     SubstituteExpressions, SubstituteExpressionsMapper, ExpressionFinder,
     ExpressionRetriever, TypedSymbol, MetaSymbol
 )
@@ -366,11 +366,11 @@ def replace_selected_kind(routine):
     mapper = IsoFortranEnvMapper()
 
     # Find all selected_x_kind calls in spec and body
-    calls = [call for call in FindInlineCalls().visit(routine.ir)
-             if mapper.is_selected_kind_call(call)]
+    found = MultiExpressionFinder({'calls': FindInlineCalls, 'literals': FindLiterals}).visit(routine.ir)
+    calls = [call for call in found['calls'] if mapper.is_selected_kind_call(call)]
 
     # Need to pick out kinds in Literals explicitly
-    calls += [literal.kind for literal in FindLiterals().visit(routine.ir)
+    calls += [literal.kind for literal in found['literals']
               if hasattr(literal, 'kind') and mapper.is_selected_kind_call(literal.kind)]
 
     map_call = {call: mapper.map_call(call, routine) for call in calls}
@@ -446,21 +446,31 @@ def recursive_expression_map_update(expr_map, max_iterations=10):
             return expr.scope
         return arg
 
+    def apply_to_replacement(expr, replacement, mapper):
+        # Helper utility to rebuild the replacement node with the mapper applied to its
+        # init args, or to return the replacement unchanged if none of the args changed
+        init_args = replacement.__getinitargs__()
+        new_args = tuple(
+            apply_to_init_arg(name, arg, expr, mapper)
+            for name, arg in zip(replacement.init_arg_names, init_args)
+        )
+        if all(new is old for new, old in zip(new_args, init_args)):
+            return replacement
+        return type(replacement)(**dict(zip(replacement.init_arg_names, new_args)))
+
     for _ in range(max_iterations):
         # We update the expression map by applying it to the children of each replacement
         # node, thus making sure node replacements are also applied to nested attributes,
         # e.g. call arguments or array subscripts etc.
         mapper = SubstituteExpressionsMapper(expr_map)
         prev_map, expr_map = expr_map, {
-            expr: type(replacement)(**{
-                name: apply_to_init_arg(name, arg, expr, mapper)
-                for name, arg in zip(replacement.init_arg_names, replacement.__getinitargs__())
-            })
+            expr: apply_to_replacement(expr, replacement, mapper)
             for expr, replacement in expr_map.items()
         }
 
         # Check for early termination opportunities
-        if prev_map == expr_map:
+        if all(expr_map[expr] is replacement or expr_map[expr] == replacement
+               for expr, replacement in prev_map.items()):
             break
 
     return expr_map
@@ -70,6 +70,12 @@ class Transformation:
         Apply transformation to "ignored" :any:`Item` objects for analysis.
         This might be needed if IPO-information needs to be passed across
         library boundaries.
+    item_local : bool
+        Declares that the transformation modifies only the IR and ``trafo_data``
+        of the processed :any:`Item` and uses information of successor items
+        read-only, without changing the names of program units. This allows the
+        :any:`Scheduler` to process independent items in parallel worker processes
+        (default: ``False``).
     """
 
     # Forces scheduler traversal in reverse order from the leaf nodes upwards
@@ -89,6 +95,9 @@ class Transformation:
     # Option to process "ignored" items for analysis
     process_ignored_items = False
 
+    # Modifies only the processed item, which allows parallel processing of items
+    item_local = False
+
     def transform_subroutine(self, routine, **kwargs):
         """
         Defines the transformation to apply to :any:`Subroutine` items.
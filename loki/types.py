@@ -363,6 +363,11 @@ class SymbolAttributes:
     There is no need to check for the presence of attributes, undefined
     attributes can be queried and default to `None`.
 
+    Once stored in a :any:`SymbolTable`, the object is shared by all
+    look-ups of the symbol and becomes immutable. To change attributes,
+    a modified copy has to be created via :meth:`clone` and stored in
+    the table instead.
+
     Parameters
     ----------
     dtype : :any:`DataType`
@@ -371,7 +376,10 @@ class SymbolAttributes:
         Any attributes that should be stored as properties
     """
 
+    __slots__ = ('__dict__', '__weakref__', '_shared')
+
     def __init__(self, dtype, **kwargs):
+        object.__setattr__(self, '_shared', False)
         if isinstance(dtype, DataType):
             self.dtype = dtype
         else:
@@ -385,6 +393,10 @@ class SymbolAttributes:
         return hash(tuple(self.__dict__))
 
     def __setattr__(self, name, value):
+        if self._shared:
+            raise AttributeError(
+                f'Cannot set attribute {name} of shared {self!r}, use clone() instead'
+            )
         if value is None and name in dir(self):
             delattr(self, name)
         else:
@@ -396,14 +408,29 @@ class SymbolAttributes:
         return object.__getattribute__(self, name)
 
     def __delattr__(self, name):
+        if self._shared:
+            raise AttributeError(
+                f'Cannot delete attribute {name} of shared {self!r}, use clone() instead'
+            )
         object.__delattr__(self, name)
 
     def __getstate__(self):
         return self.__dict__
 
     def __setstate__(self, d):
+        object.__setattr__(self, '_shared', False)
         self.__dict__.update(d)
 
+    def share(self):
+        """
+        Mark the object as shared, which makes it immutable, and return it
+
+        This is called when the object is stored in a :any:`SymbolTable`, which
+        allows to return the same object for every look-up without copying.
+        """
+        object.__setattr__(self, '_shared', True)
+        return self
+
     def __repr__(self):
         parameters = [str(self.dtype)]
         for k, v in self.__dict__.items():
@@ -438,6 +465,7 @@ class SymbolAttributes:
         Clone the :any:`SymbolAttributes`, optionally overwriting any attributes
 
         Attributes that should be removed should simply be given as `None`.
+        The clone is not shared, even if the original object is.
         """
         args = self.__dict__.copy()
         args.update(kwargs)
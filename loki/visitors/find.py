@@ -8,12 +8,18 @@
 """
 Visitor classes that allow searching the IR
 """
+from bisect import bisect_left
+from heapq import merge
 from itertools import groupby
 
+from loki.ir import Node, TypeDef, ModificationCounter
 from loki.visitors.visitor import Visitor
-from loki.tools import flatten
+from loki.tools import flatten, as_tuple
 
-__all__ = ['FindNodes', 'SequenceFinder', 'PatternFinder', 'is_parent_of', 'is_child_of', 'FindScopes']
+__all__ = [
+    'FindNodes', 'SequenceFinder', 'PatternFinder', 'is_parent_of', 'is_child_of', 'FindScopes',
+    'NodeIndex'
+]
 
 
 class FindNodes(Visitor):
@@ -109,6 +115,146 @@ class FindNodes(Visitor):
         return ret or self.default_retval()
 
 
+class NodeIndex:
+    """
+    Index of the nodes in an IR tree by node type, which allows to answer
+    repeated queries for node types and the relation of nodes in the tree
+    without traversing the tree.
+
+    The index is built in a single traversal of the tree. It records all
+    nodes in the same order as :any:`FindNodes`, and, like :any:`FindNodes`,
+    does not include the bodies of :any:`TypeDef` nodes. Type queries
+    via :meth:`find` have the same result as :any:`FindNodes` with the
+    default :data:`mode` and can be restricted to subtrees of the indexed
+    tree. Nodes are identified by object identity.
+
+    The index registers a :any:`ModificationCounter` with all indexed
+    nodes, such that any in-place update of traversable properties of
+    these nodes (via :meth:`Node._update`) invalidates the index, which
+    needs to be rebuilt if :meth:`is_valid` returns `False`. Updates to
+    nodes of other trees do not affect the index.
+
+    Parameters
+    ----------
+    ir : :any:`Node` or tuple
+        The IR tree to index
+    counter : :any:`ModificationCounter`, optional
+        The counter to register with the nodes of the tree, e.g., a counter
+        owned by the :any:`ProgramUnit` of the tree that is shared by all
+        indices of its IR. By default, a new counter is created.
+    """
+
+    def __init__(self, ir, counter=None):
+        self.ir = ir
+        self.counter = ModificationCounter() if counter is None else counter
+        self.modification_count = self.counter.count
+
+        self._nodes = []
+        self._positions = {}
+        self._extents = {}
+        self._parents = {}
+        self._type_cache = {}
+        self._build(ir, None)
+
+    def _build(self, o, parent):
+        """
+        Recursively add :data:`o` and its children to the index
+        """
+        if isinstance(o, (tuple, list)):
+            for i in o:
+                self._build(i, parent)
+            return
+        if not isinstance(o, Node):
+            return
+
+        o._track_modifications(self.counter)
+        start = len(self._nodes)
+        self._nodes.append(o)
+        self._positions.setdefault(type(o), []).append(start)
+        self._parents.setdefault(id(o), parent)
+        if not isinstance(o, TypeDef):
+            for i in o.children:
+                self._build(i, o)
+        self._extents.setdefault(id(o), (start, len(self._nodes)))
+
+    def is_valid(self, ir=None):
+        """
+        Check if the index is still valid
+
+        Parameters
+        ----------
+        ir : :any:`Node` or tuple, optional
+            If given, check also that the index has been built for this tree
+
+        Returns
+        -------
+        bool
+            `True` if no indexed node has been updated since building the index
+        """
+        if self.modification_count != self.counter.count:
+            return False
+        if ir is None:
+            return True
+        ir, own_ir = as_tuple(ir), as_tuple(self.ir)
+        return len(ir) == len(own_ir) and all(a is b for a, b in zip(ir, own_ir))
+
+    def __contains__(self, node):
+        return id(node) in self._extents
+
+    def find(self, match, root=None):
+        """
+        Return all nodes of the given type(s), optionally restricted to
+        the subtree of an indexed node
+
+        Parameters
+        ----------
+        match : type or tuple of type
+            The node type(s) to look for
+        root : :any:`Node`, optional
+            Restrict the search to :data:`root` and its subtree
+
+        Returns
+        -------
+        list
+            The matching nodes in the order of traversal
+        """
+        if root is None:
+            start, end = 0, len(self._nodes)
+        else:
+            start, end = self._extents[id(root)]
+
+        if match not in self._type_cache:
+            self._type_cache[match] = [
+                positions for cls, positions in self._positions.items() if issubclass(cls, match)
+            ]
+        ranges = [
+            positions[bisect_left(positions, start):bisect_left(positions, end)]
+            for positions in self._type_cache[match]
+        ]
+        return [self._nodes[i] for i in merge(*ranges)]
+
+    def parent(self, node):
+        """
+        Return the parent node of :data:`node` or `None` if it is at the root level
+        """
+        return self._parents[id(node)]
+
+    def is_child_of(self, node, other):
+        """
+        Check if :data:`node` is contained in the subtree below :data:`other`
+        """
+        if node not in self or other not in self:
+            return False
+        start, end = self._extents[id(other)]
+        return start < self._extents[id(node)][0] < end
+
+    def is_parent_of(self, node, other):
+        """
+        Check if :data:`other` is contained in the subtree below :data:`node`
+        """
+        return self.is_child_of(other, node)
+
+
 def is_child_of(node, other):
     """
     Utility function to test relationship between nodes.
@@ -36,14 +36,17 @@ class Transformer(Visitor):
     containing :math:`n`.
 
     .. warning::
-       Applying a :class:`Transformer` to an IR tree rebuilds all nodes by
-       default, which means individual nodes from the original IR are no longer
-       found in the new tree. To update references to IR nodes, the attribute
+       Applying a :class:`Transformer` to an IR tree rebuilds all nodes that
+       contain replaced nodes by default, which means these nodes from the
+       original IR are no longer found in the new tree. Nodes without any
+       changes in their subtree are retained and shared between the original
+       and the new tree. To update references to IR nodes, the attribute
        :any:`Transformer.rebuilt` provides a mapping from original to rebuilt
        nodes. Alternatively, with :data:`inplace` the mapping can be
        applied without rebuilding the tree, leaving existing references to
        individual IR nodes intact (as long as the mapping does not replace or
-       remove them in the tree).
+       remove them in the tree). To create a full copy of the tree, which
+       does not share any nodes with the original, use :data:`rebuild_unchanged`.
 
     Parameters
     ----------
@@ -60,6 +63,11 @@ class Transformer(Visitor):
         If set to `True`, this will also rebuild :class:`ScopedNode` in the IR.
         This requires updating :attr:`TypedSymbol.scope` properties, which is
         expensive and thus carried out only when explicitly requested.
+        This implies :data:`rebuild_unchanged`.
+    rebuild_unchanged : bool, optional
+        If set to `True`, all nodes are rebuilt, including those without any
+        changes in their subtree. This creates a full copy of the tree and
+        is the default if no :data:`mapper` is given.
 
     Attributes
     ----------
@@ -67,15 +75,21 @@ class Transformer(Visitor):
         After applying the :class:`Transformer` to an IR, this contains a
         mapping :math:`n \rightarrow n'` for every node of the original tree
         :math:`n \in T` to the rebuilt nodes in the new tree :math:`n' \in T'`.
+        Nodes that are retained in the new tree are not included.
     """
 
-    def __init__(self, mapper=None, invalidate_source=True, inplace=False, rebuild_scopes=False):
+    def __init__(self, mapper=None, invalidate_source=True, inplace=False, rebuild_scopes=False,
+                 rebuild_unchanged=None):
         super().__init__()
         self.mapper = mapper.copy() if mapper is not None else {}
         self.invalidate_source = invalidate_source
         self.rebuilt = {}
         self.inplace = inplace
         self.rebuild_scopes = rebuild_scopes
+        if rebuild_unchanged is None:
+            # Without mapper, the transformer is typically used to copy the tree
+            rebuild_unchanged = not self.mapper
+        self.rebuild_unchanged = rebuild_unchanged or rebuild_scopes
 
     def _rebuild_without_source(self, o, children, **args):
         """
@@ -98,14 +112,28 @@ class Transformer(Visitor):
         """
         Utility method to rebuild the given node with the provided children.
 
+        Unless :data:`rebuild_unchanged` is `True`, the original node is
+        returned if the children are identical to the node's children and
+        no other arguments are given.
+        """
+        if not (args or self.rebuild_unchanged or self.inplace) and self._is_unchanged(o.children, children):
+            return o
+        return self._rebuild_node(o, children, **args)
+
+    def _rebuild_node(self, o, children, **args):
+        """
+        Utility method to unconditionally rebuild the given node with the
+        provided children.
+
         If :data:`invalidate_source` is `True`, :data:`Node.source` is set to
         `None` whenever any of the children has :data:`source == None`.
         """
         args_frozen = o.args_frozen
         args_frozen.update(args)
         if self.invalidate_source and 'source' in args_frozen:
-            if any(isinstance(child, Node) for child in flatten(children)):
-                child_has_no_source = [getattr(i, 'source', None) is None for i in flatten(children)]
+            flat_children = flatten(children)
+            if any(isinstance(child, Node) for child in flat_children):
+                child_has_no_source = [getattr(i, 'source', None) is None for i in flat_children]
                 if any(child_has_no_source) or len(child_has_no_source) != len(flatten(o.children)):
                     return self._rebuild_without_source(o, children, **args_frozen)
 
@@ -117,6 +145,14 @@ class Transformer(Visitor):
         # Rebuild updated nodes by default
         return o._rebuild(*children, **args_frozen)
 
+    @staticmethod
+    def _is_unchanged(original, visited):
+        """
+        Utility method to check if all :data:`visited` children are
+        identical to the :data:`original` children.
+        """
+        return len(original) == len(visited) and all(a is b for a, b in zip(original, visited))
+
     def visit_object(self, o, **kwargs):
         """Return the object unchanged."""
         return o
@@ -151,13 +187,19 @@ class Transformer(Visitor):
         Visit all elements in a tuple, injecting any one-to-many mappings.
         """
         # First inject tuples that match at least a sub-set of current nodes
+        original = o
         o = self._inject_tuple_mapping(o)
 
         # Then recurse over the new nodes
         visited = tuple(self.visit(i, **kwargs) for i in o)
 
         # Strip empty sublists/subtuples or None entries
-        return tuple(i for i in visited if i is not None and as_tuple(i))
+        visited = tuple(i for i in visited if i is not None and as_tuple(i))
+
+        # Retain the original tuple if nothing has changed
+        if isinstance(original, tuple) and not self.rebuild_unchanged and self._is_unchanged(original, visited):
+            return original
+        return visited
 
     visit_list = visit_tuple
 
@@ -179,6 +221,10 @@ class Transformer(Visitor):
             if not is_iterable(handle) or o not in handle:
                 return handle._rebuild(**handle.args)
 
+            # Always rebuild nodes that are part of a one-to-many mapping
+            rebuilt = tuple(self.visit(i, **kwargs) for i in o.children)
+            return self._rebuild_node(o, rebuilt)
+
         rebuilt = tuple(self.visit(i, **kwargs) for i in o.children)
         return self._rebuild(o, rebuilt)
 
@@ -265,7 +311,12 @@ class NestedTransformer(Transformer):
         visited = self._inject_tuple_mapping(visited)
 
         # Strip empty sublists/subtuples or None entries
-        return tuple(i for i in visited if i is not None and as_tuple(i))
+        visited = tuple(i for i in visited if i is not None and as_tuple(i))
+
+        # Retain the original tuple if nothing has changed
+        if isinstance(o, tuple) and not self.rebuild_unchanged and self._is_unchanged(o, visited):
+            return o
+        return visited
 
     visit_list = visit_tuple
 
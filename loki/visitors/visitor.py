@@ -10,6 +10,7 @@ Visitor base classes for traversing the IR
 """
 
 import inspect
+from types import MethodType
 
 __all__ = ['GenericVisitor', 'Visitor']
 
@@ -40,15 +41,37 @@ class GenericVisitor:
             pass
     """
 
-    def __init__(self):
+    _handlers = {}
+    """
+    Class-level map of class names to handler functions, which is created
+    once for each visitor class when the class is defined
+    """
+
+    _dispatch_table = {}
+    """
+    Class-level cache of the handler functions resolved via the MRO
+    for each visited class
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._build_handlers()
+
+    @classmethod
+    def _build_handlers(cls):
+        """
+        Inspect the methods of this class to find out which handlers are
+        defined and populate the class' handler table.
+        """
         handlers = {}
         # visit methods are spelt visit_Foo.
         prefix = "visit_"
-        # Inspect the methods on this instance to find out which
-        # handlers are defined.
-        for (name, meth) in inspect.getmembers(self, predicate=inspect.ismethod):
+        for name in dir(cls):
             if not name.startswith(prefix):
                 continue
+            meth = inspect.getattr_static(cls, name)
+            if not inspect.isfunction(meth):
+                continue
             # Check the argument specification
             # Valid options are:
             #    visit_Foo(self, o, [*args, **kwargs])
@@ -57,7 +80,21 @@ class GenericVisitor:
                 raise RuntimeError("Visit method signature must be "
                                    "visit_Foo(self, o, [*args, **kwargs])")
             handlers[name[len(prefix):]] = meth
-        self._handlers = handlers
+        cls._handlers = handlers
+        cls._dispatch_table = {}
+
+    @classmethod
+    def _resolve_handler(cls, klass):
+        """
+        Find the handler function for :data:`klass` by walking its MRO and
+        store it in the class' dispatch table.
+        """
+        for base in klass.__mro__:
+            handler = cls._handlers.get(base.__name__)
+            if handler:
+                cls._dispatch_table[klass] = handler
+                return handler
+        raise RuntimeError(f'No handler found for class {klass.__name__}')
 
     default_args = {}
     """
@@ -93,19 +130,21 @@ class GenericVisitor:
 
         :param instance: The instance to look up a method for.
         """
-        cls = instance.__class__
+        return MethodType(self._lookup_handler(instance), self)
+
+    def _lookup_handler(self, instance):
+        """
+        Look up the (unbound) handler function for a visitee.
+
+        Visitors that dispatch on other properties than the visitee's class
+        should override this method.
+
+        :param instance: The instance to look up a handler for.
+        """
         try:
-            # Do we have a method handler defined for this type name
-            return self._handlers[cls.__name__]
+            return self._dispatch_table[instance.__class__]
         except KeyError:
-            # No, walk the MRO.
-            for klass in cls.mro()[1:]:
-                entry = self._handlers.get(klass.__name__)
-                if entry:
-                    # Save it on this type name for faster lookup next time
-                    self._handlers[cls.__name__] = entry
-                    return entry
-        raise RuntimeError(f'No handler found for class {cls.__name__}')
+            return self._resolve_handler(instance.__class__)
 
     def visit(self, o, *args, **kwargs):
         """
@@ -120,8 +159,7 @@ class GenericVisitor:
         **kwargs :
             Optional keyword arguments to pass to the visit methods.
         """
-        meth = self.lookup_method(o)
-        return meth(o, *args, **kwargs)
+        return self._lookup_handler(o)(self, o, *args, **kwargs)
 
     def visit_object(self, o, **kwargs):  # pylint: disable=unused-argument
         """
@@ -142,6 +180,9 @@ class GenericVisitor:
         return self.default_retval()
 
 
+GenericVisitor._build_handlers()  # pylint: disable=protected-access
+
+
 class Visitor(GenericVisitor):
     """
     The basic visitor-class for traversing Loki's control flow tree.
@@ -12,13 +12,14 @@ Loki head script for source-to-source transformations concerning ECMWF
 physics, including "Single Column" (SCA) and CLAW transformations.
 """
 
+from importlib.metadata import version, PackageNotFoundError
 from pathlib import Path
 import click
 
 from loki import (
     Sourcefile, Transformation, Scheduler, SchedulerConfig, SubroutineItem,
     Frontend, as_tuple, set_excepthook, auto_post_mortem_debugger, info,
-    GlobalVarImportItem, Module
+    GlobalVarImportItem, Module, ProcessingManifest, config as loki_config
 )
 
 # Get generalized transformations provided by Loki
@@ -63,9 +64,15 @@ class IdemTransformation(Transformation):
 @click.option('--debug/--no-debug', default=False, show_default=True,
               help=('Enable / disable debug mode. This automatically attaches '
                     'a debugger when exceptions occur'))
-def cli(debug):
+@click.option('--ir-validation/--no-ir-validation', default=None,
+              help=('Enable / disable the validation of constructor arguments of IR nodes. '
+                    'Disabling this speeds up the frontend and transformations. By default, '
+                    'the value of the Loki config option (LOKI_IR_VALIDATION) is used'))
+def cli(debug, ir_validation):
     if debug:
         set_excepthook(hook=auto_post_mortem_debugger)
+    if ir_validation is not None:
+        loki_config['ir-validation'] = ir_validation
 
 
 @cli.command()
@@ -122,12 +129,18 @@ def cli(debug):
               help="Recursively derive explicit shape dimension for argument arrays")
 @click.option('--eliminate-dead-code/--no-eliminate-dead-code', default=True,
               help='Perform dead code elimination, where unreachable branches are trimmed from the code.')
+@click.option('--num-workers', type=int, default=None,
+              help='Number of worker processes to use for source scanning, parsing and item-local transformations.')
+@click.option('--discovery-index', type=click.Path(), default=None,
+              help='Path to a persistent index file to re-use the source scan of unchanged files.')
+@click.option('--manifest', type=click.Path(), default=None,
+              help='Path to a processing manifest file to re-process only items affected by changes.')
 def convert(
         mode, config, build, source, header, cpp, directive, include, define, omni_include, xmod,
         data_offload, remove_openmp, assume_deviceptr, frontend, trim_vector_sections,
         global_var_offload, remove_derived_args, inline_members, inline_marked,
         resolve_sequence_association, resolve_sequence_association_inlined_calls,
-        derive_argument_array_shape, eliminate_dead_code
+        derive_argument_array_shape, eliminate_dead_code, num_workers, discovery_index, manifest
 ):
     """
     Batch-processing mode for Fortran-to-Fortran transformations that
@@ -142,6 +155,21 @@ def convert(
 
     info(f'[Loki] Batch-processing source files using config: {config} ')
 
+    if manifest:
+        # The manifest is invalidated by any change of options, config file or headers
+        params = click.get_current_context().params
+        signature = tuple(
+            (k, repr(v)) for k, v in sorted(params.items())
+            if k not in ('num_workers', 'discovery_index', 'manifest')
+        )
+        try:
+            signature += (version('loki'),)
+        except PackageNotFoundError:
+            pass
+        signature += (Path(config).read_text() if config else None,)
+        signature += tuple(Path(h).read_text() for h in header)
+        manifest = ProcessingManifest(manifest, signature=signature)
+
     config = SchedulerConfig.from_file(config)
 
     directive = None if directive.lower() == 'none' else directive.lower()
@@ -173,7 +201,9 @@ def convert(
     paths = [Path(p).resolve() for p in as_tuple(source)]
     paths += [Path(h).resolve().parent for h in as_tuple(header)]
     scheduler = Scheduler(
-        paths=paths, config=config, frontend=frontend, definitions=definitions, **build_args
+        paths=paths, config=config, frontend=frontend, definitions=definitions,
+        num_workers=num_workers, discovery_index=discovery_index, manifest=manifest,
+        **build_args
     )
 
     # Pull dimension definition from configuration
@@ -240,15 +270,13 @@ def convert(
         ))
 
     if mode in ['scc', 'scc-hoist', 'scc-stack']:
-        # Apply the basic SCC transformation set
-        scheduler.process( SCCBaseTransformation(
-            horizontal=horizontal, directive=directive
-        ))
-        scheduler.process( SCCDevectorTransformation(
-            horizontal=horizontal, trim_vector_sections=trim_vector_sections
-        ))
-        scheduler.process( SCCDemoteTransformation(horizontal=horizontal))
-        scheduler.process( SCCRevectorTransformation(horizontal=horizontal))
+        # Apply the basic SCC transformation set in a single traversal
+        scheduler.process_pipeline([
+            SCCBaseTransformation(horizontal=horizontal, directive=directive),
+            SCCDevectorTransformation(horizontal=horizontal, trim_vector_sections=trim_vector_sections),
+            SCCDemoteTransformation(horizontal=horizontal),
+            SCCRevectorTransformation(horizontal=horizontal)
+        ])
 
     if mode == 'scc-hoist':
         # Apply recursive hoisting of local temporary arrays.
@@ -317,6 +345,9 @@ def convert(
         include_module_var_imports=global_var_offload
     ))
 
+    # Record the processed items for incremental re-processing
+    scheduler.write_manifest()
+
 
 @cli.command('plan')
 @click.option('--mode', '-m', default='sca',
@@ -341,7 +372,12 @@ def convert(
               help='Generate and display the subroutine callgraph.')
 @click.option('--plan-file', type=click.Path(),
               help='CMake "plan" file to generate.')
-def plan(mode, config, header, source, build, root, cpp, directive, frontend, callgraph, plan_file):
+@click.option('--num-workers', type=int, default=None,
+              help='Number of worker processes to use for source scanning and parsing.')
+@click.option('--discovery-index', type=click.Path(), default=None,
+              help='Path to a persistent index file to re-use the source scan of unchanged files.')
+def plan(mode, config, header, source, build, root, cpp, directive, frontend, callgraph, plan_file,
+         num_workers, discovery_index):
     """
     Create a "plan", a schedule of files to inject and transform for a
     given configuration.
@@ -352,7 +388,10 @@ def plan(mode, config, header, source, build, root, cpp, directive, frontend, ca
 
     paths = [Path(s).resolve() for s in source]
     paths += [Path(h).resolve().parent for h in header]
-    scheduler = Scheduler(paths=paths, config=config, frontend=frontend, full_parse=False, preprocess=cpp)
+    scheduler = Scheduler(
+        paths=paths, config=config, frontend=frontend, full_parse=False, preprocess=cpp,
+        num_workers=num_workers, discovery_index=discovery_index
+    )
 
     mode = mode.replace('-', '_')  # Sanitize mode string
 
@@ -6,6 +6,7 @@
 # nor does it submit to any jurisdiction.
 
 from collections import defaultdict
+from pickle import dumps, loads
 from pathlib import Path
 import math
 import sys
@@ -23,7 +24,8 @@ from loki import (
     FindVariables, FindNodes, SubstituteExpressions, Scope, BasicType, SymbolAttributes,
     parse_fparser_expression, Sum, DerivedType, ProcedureType, ProcedureSymbol,
     DeferredTypeSymbol, Module, HAVE_FP, FindExpressions, LiteralList, FindInlineCalls,
-    AttachScopesMapper, FindTypedSymbols, Reference, Dereference
+    AttachScopesMapper, FindTypedSymbols, Reference, Dereference, config_override,
+    SubstituteExpressionsMapper, Source
 )
 from loki.expression import symbols
 from loki.tools import gettempdir, filehash
@@ -995,6 +997,43 @@ def test_string_compare():
     assert symbols.LogicLiteral(value=True) == 'true'
 
 
+def test_string_compare_cached():
+    """
+    Test that cached canonical string representations are consistent with
+    case-sensitivity settings, cloning, pickling and in-place renaming.
+    """
+    scope = Scope()
+    type_int = SymbolAttributes(dtype=BasicType.INTEGER)
+    type_real = SymbolAttributes(dtype=BasicType.REAL)
+
+    i = Variable(name='i', scope=scope, type=type_int)
+    v = Variable(name='V', dimensions=(i,), scope=scope, type=type_real)
+    expr = symbols.Sum((v, i))
+
+    assert expr == 'v(i) + i'
+    assert hash(expr) == hash(symbols.Sum((v, i)))
+    assert hash(v) == hash(v.clone()) == hash('v(i)')
+
+    # Switching case-sensitivity is honoured by cached representations
+    with config_override({'case-sensitive': True}):
+        assert expr != 'v(i) + i'
+        assert expr == 'V(i) + i'
+        assert hash(v) == hash('V(i)')
+    assert expr == 'v(i) + i'
+
+    # Pickled copies and clones re-compute the representation
+    assert loads(dumps(expr)) == expr
+    w = v.clone(name='w')
+    assert w == 'w(i)' and w != v
+    assert v == 'v(i)'
+
+    # Renaming a symbol in-place invalidates the cached representation
+    u = symbols.VariableSymbol(name='u', scope=scope, type=type_int)
+    assert u == 'u'
+    u.name = 'x'
+    assert u == 'x' and hash(u) == hash('x')
+
+
 @pytest.mark.skipif(not HAVE_FP, reason='Fparser not available')
 @pytest.mark.parametrize('expr, string, ref', [
     ('a + 1', 'a', True),
@@ -1344,6 +1383,44 @@ def test_nested_derived_type_substitution():
     assert fgen(new_expr) == 'ydml_phy_mf%yrphy3%n_spband'
 
 
+def test_substitute_expressions_mapper_shortcuts():
+    """
+    Test memoization and the name-based short-circuit in
+    :any:`SubstituteExpressionsMapper`
+    """
+    scope = Scope()
+    type_int = SymbolAttributes(dtype=BasicType.INTEGER)
+    type_arr = SymbolAttributes(dtype=BasicType.REAL, shape=(symbols.RangeIndex((None, None)),))
+    i = symbols.Scalar(name='i', type=type_int, scope=scope)
+    j = symbols.Scalar(name='j', type=type_int, scope=scope)
+    a = symbols.Array(name='a', dimensions=(i,), type=type_arr, scope=scope)
+    b = symbols.Array(name='b', dimensions=(j,), type=type_arr, scope=scope)
+    c = symbols.Scalar(name='c', type=type_int, parent=symbols.Scalar(name='var'), scope=scope)
+    expr = Sum((a, b, a, c))
+
+    mapper = SubstituteExpressionsMapper({i: j})
+    new_expr = mapper(expr)
+    assert new_expr == 'a(j) + b(j) + a(j) + var%c'
+    # Repeated nodes are mapped only once, unaffected subtrees are retained
+    assert new_expr.children[0] is new_expr.children[2]
+    assert new_expr.children[1] is b
+    assert new_expr.children[3] is c
+
+    # Substitutions of derived type members are found in parents and subscripts
+    assert SubstituteExpressionsMapper({c.clone(): j})(Sum((b, c))) == 'b(j) + j'
+    var = symbols.Array(name='var', dimensions=(i,), type=type_arr, scope=scope)
+    d = symbols.Scalar(name='d', parent=var, type=type_int, scope=scope)
+    assert SubstituteExpressionsMapper({i: j})(d) == 'var(j)%d'
+
+    # Sources are retained without copying
+    source = Source(lines=(1, 1), string='a(i)')
+    a_src = a.clone()
+    a_src.source = source
+    new_a = SubstituteExpressionsMapper({i: j}, invalidate_source=False)(a_src)
+    assert new_a == 'a(j)'
+    assert new_a.source is source
+
+
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_variable_in_declaration_initializer(frontend):
     """
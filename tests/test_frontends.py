@@ -25,8 +25,10 @@ from loki import (
     Deallocation, Associate, BasicType, OMNI, OFP, FP, Enumeration,
     config, REGEX, Sourcefile, Import, RawSource, CallStatement,
     RegexParserClass, ProcedureType, DerivedType, Comment, Pragma,
-    PreprocessorDirective, config_override, Section, CommentBlock
+    PreprocessorDirective, config_override, Section, CommentBlock, HAVE_FP, init_fparser, fgen,
+    get_fparser_node, gettempdir
 )
+from loki import ir
 from loki.expression import symbols as sym
 
 
@@ -1756,3 +1758,148 @@ end subroutine test_comment_block
     assert len(blocks[1].comments) == 2
     assert blocks[1].comments[0].text == '! Shut up, ...'
     assert blocks[1].comments[1].text == '! Rick!'
+
+
+@pytest.mark.skipif(not HAVE_FP, reason='Fparser not available')
+def test_fparser_parser_reuse():
+    """
+    Test that the fparser parser is created once and re-created only if
+    fparser's class hierarchy has been replaced
+    """
+    from fparser.two.parser import ParserFactory  # pylint: disable=import-outside-toplevel
+
+    parser = init_fparser()
+    assert init_fparser() is parser
+
+    fcode = """
+subroutine routine_parser_reuse(a)
+  real, intent(inout) :: a
+  a = a + 1.0
+end subroutine routine_parser_reuse
+"""
+    routine = Subroutine.from_source(fcode, frontend=FP)
+    assert init_fparser() is parser
+    assert fgen(routine.body) == 'a = a + 1.0'
+
+    # Replacing the class hierarchy with Fortran 2003 enforces a re-creation
+    ParserFactory().create(std='f2003')
+    routine = Subroutine.from_source(fcode, frontend=FP)
+    assert fgen(routine.body) == 'a = a + 1.0'
+    assert init_fparser() is parser
+
+
+@pytest.mark.skipif(not HAVE_FP, reason='Fparser not available')
+def test_fparser_source_extraction():
+    """
+    Test that source objects created by the fparser frontend reference
+    the raw source string via the line offset index
+    """
+    from loki.frontend.fparser import (  # pylint: disable=import-outside-toplevel
+        get_line_offsets, get_source_span, extract_fparser_source, parse_fparser_source
+    )
+
+    fcode = """
+subroutine routine_source_extraction(a, n)
+  integer, intent(in) :: n
+  real, intent(inout) :: a(n)
+  integer :: i
+
+  do i=1,n
+    if (a(i) > 0.) then
+      a(i) = 2. * a(i)
+    end if
+  end do
+end subroutine routine_source_extraction
+""".strip()
+    lines = fcode.splitlines()
+
+    offsets = get_line_offsets('a\nbc\r\n\nd')
+    assert offsets == (0, 2, 6, 7, 8)
+    assert get_source_span(offsets, (2, 3)) == (2, 7)
+    assert get_source_span(offsets, (2, 3), buffer='a\nbc\r\n\nd') == (2, 5)
+    assert get_source_span(offsets, (3, 10)) == (6, 8)
+
+    ast = parse_fparser_source(fcode)
+    source = extract_fparser_source(get_fparser_node(ast, 'Subroutine_Subprogram'), fcode)
+    assert source.lines == (1, len(lines))
+    assert source.string == fcode
+
+    routine = Subroutine.from_source(fcode, frontend=FP)
+    loop = FindNodes(ir.Loop).visit(routine.body)[0]
+    assert loop.source.lines == (6, 10)
+    assert loop.source.string == '\n'.join(lines[5:10])
+    cond = FindNodes(ir.Conditional).visit(loop.body)[0]
+    assert cond.source.lines == (7, 9)
+    assert cond.source.string == '\n'.join(lines[6:9])
+    assign = FindNodes(ir.Assignment).visit(cond.body)[0]
+    assert assign.source.lines == (8, 8)
+    assert assign.source.string == lines[7]
+
+
+@pytest.mark.skipif(not HAVE_FP, reason='Fparser not available')
+def test_fparser_select_type():
+    """
+    Test that ``SELECT TYPE`` constructs are retained verbatim by the
+    fparser frontend
+    """
+    fcode = """
+module select_type_mod
+  implicit none
+  type :: base_t
+    integer :: a
+  end type base_t
+  type, extends(base_t) :: ext_t
+    integer :: b
+  end type ext_t
+contains
+  subroutine routine_select_type(x)
+    class(base_t), intent(inout) :: x
+    select type (x)
+    type is (ext_t)
+      x%b = 1
+    class default
+      x%a = 1
+    end select
+  end subroutine routine_select_type
+end module select_type_mod
+""".strip()
+    module = Module.from_source(fcode, frontend=FP)
+    routine = module['routine_select_type']
+    intrinsics = FindNodes(ir.Intrinsic).visit(routine.body)
+    assert len(intrinsics) == 1
+    assert intrinsics[0].text.strip().lower().startswith('select type (x)')
+    assert intrinsics[0].text.lower().endswith('end select')
+    assert intrinsics[0].source.lines == (12, 17)
+
+    code = module.to_fortran().lower()
+    assert 'select type (x)' in code
+    assert 'type is (ext_t)' in code
+    assert 'class default' in code
+
+    # Round-trip the generated code
+    module = Module.from_source(module.to_fortran(), frontend=FP)
+    code = module.to_fortran().lower()
+    assert 'type is (ext_t)' in code
+
+
+def test_omni_write_source():
+    """
+    Test that temporary input files for F_Front are unique for files
+    with the same basename in different directories
+    """
+    from loki.frontend.omni import _write_omni_source  # pylint: disable=import-outside-toplevel
+
+    fcode = 'module omni_write_source_mod\nend module omni_write_source_mod\n'
+    path_a = _write_omni_source(fcode, Path('dir_a/omni_write_source_mod.F90'))
+    path_b = _write_omni_source(fcode, Path('dir_b/omni_write_source_mod.F90'))
+    path_c = _write_omni_source(fcode.upper(), Path('dir_a/omni_write_source_mod.F90'))
+    assert len({path_a, path_b, path_c}) == 3
+    for path in (path_a, path_b, path_c):
+        assert path.name.startswith('omni_write_source_mod.')
+        assert path.name.endswith('.omni.F90')
+        assert path.parent == gettempdir()
+    assert path_a.read_text() == fcode
+    assert path_c.read_text() == fcode.upper()
+    assert _write_omni_source(fcode, Path('dir_a/omni_write_source_mod.F90')) == path_a
+    for path in (path_a, path_b, path_c):
+        path.unlink()
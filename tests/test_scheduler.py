@@ -48,9 +48,11 @@ Test directory structure
        * routine_two
 """
 
+import os
 import re
 from pathlib import Path
 from shutil import rmtree
+import networkx as nx
 import pytest
 
 from conftest import (available_frontends, graphviz_present)
@@ -61,8 +63,10 @@ from loki import (
     SubroutineItem, ProcedureBindingItem, gettempdir, ProcedureSymbol,
     ProcedureType, DerivedType, TypeDef, Scalar, Array, FindInlineCalls,
     Import, Variable, GenericImportItem, GlobalVarImportItem, flatten,
-    CaseInsensitiveDict, ModuleWrapTransformation, Dimension
+    CaseInsensitiveDict, ModuleWrapTransformation, Dimension, config_override,
+    FileWriteTransformation, ProcessingManifest, Comment, SanitiseTransformation
 )
+from loki.bulk.scheduler import _xmods_up_to_date
 
 pytestmark = pytest.mark.skipif(not HAVE_FP and not HAVE_OFP, reason='Fparser and OFP not available')
 
@@ -387,6 +391,253 @@ def test_scheduler_definitions(here, config, frontend):
     assert fexprgen(call.arguments[1].shape) == '(3, 3)'
 
 
+@pytest.mark.parametrize('num_workers', [None, 2])
+def test_scheduler_discovery_workers(here, config, frontend, num_workers):
+    """
+    Test that the initial source scan with a pool of worker processes
+    yields the same discovered objects and call tree as the serial scan.
+    """
+    projA = here/'sources/projA'
+
+    reference = Scheduler(
+        paths=projA, includes=projA/'include', config=config,
+        seed_routines=['driverA'], frontend=frontend, full_parse=False
+    )
+    scheduler = Scheduler(
+        paths=projA, includes=projA/'include', config=config,
+        seed_routines=['driverA'], frontend=frontend, full_parse=False,
+        num_workers=num_workers
+    )
+
+    assert list(scheduler.obj_map.keys()) == list(reference.obj_map.keys())
+    assert all(
+        scheduler.obj_map[name].path == reference.obj_map[name].path
+        for name in reference.obj_map
+    )
+    assert {item.name for item in scheduler.items} == {item.name for item in reference.items}
+    assert set(scheduler.dependencies) == set(reference.dependencies)
+
+
+def test_scheduler_discovery_index(config, frontend, monkeypatch):
+    """
+    Test that the persistent discovery index re-uses the scan results
+    of unchanged files and only re-scans modified files.
+    """
+    fcode_driver = """
+subroutine driver
+    implicit none
+    call kernel
+end subroutine driver
+    """.strip()
+
+    fcode_kernel = """
+subroutine kernel
+    implicit none
+end subroutine kernel
+    """.strip()
+
+    workdir = gettempdir()/'test_scheduler_discovery_index'
+    workdir.mkdir(exist_ok=True)
+    (workdir/'driver.F90').write_text(fcode_driver)
+    (workdir/'kernel.F90').write_text(fcode_kernel)
+    index_path = workdir/'index'/'discovery.pickle'
+
+    # Count the files scanned by the scheduler
+    scanned = []
+    from_file = Sourcefile.from_file
+    def counting_from_file(*args, **kwargs):
+        scanned.append(Path(kwargs['filename']).name)
+        return from_file(*args, **kwargs)
+    monkeypatch.setattr(Sourcefile, 'from_file', counting_from_file)
+
+    scheduler = Scheduler(
+        paths=[workdir], config=config, seed_routines=['driver'], frontend=frontend,
+        full_parse=False, discovery_index=index_path
+    )
+    assert index_path.exists()
+    assert sorted(scanned) == ['driver.F90', 'kernel.F90']
+    assert {item.name for item in scheduler.items} == {'#driver', '#kernel'}
+
+    # Unchanged files are re-used from the index
+    scanned.clear()
+    scheduler = Scheduler(
+        paths=[workdir], config=config, seed_routines=['driver'], frontend=frontend,
+        full_parse=False, discovery_index=index_path
+    )
+    assert not scanned
+    assert {item.name for item in scheduler.items} == {'#driver', '#kernel'}
+
+    # Only the modified file is re-scanned
+    (workdir/'driver.F90').write_text(fcode_driver.replace('call kernel', 'call kernel\n    call other'))
+    (workdir/'other.F90').write_text(fcode_kernel.replace('kernel', 'other'))
+    scheduler = Scheduler(
+        paths=[workdir], config=config, seed_routines=['driver'], frontend=frontend,
+        full_parse=True, discovery_index=index_path
+    )
+    assert sorted(scanned) == ['driver.F90', 'other.F90']
+    assert {item.name for item in scheduler.items} == {'#driver', '#kernel', '#other'}
+    assert all(item.source._incomplete is False for item in scheduler.items)
+
+    rmtree(workdir)
+
+
+def test_scheduler_parse_workers(here, config, frontend):
+    """
+    Test that the DAG-parallel parse produces the same IR as the
+    serial parse and re-links definitions in the main process.
+
+    projA: driverA -> kernelA -> compute_l1 -> compute_l2
+                           |
+                     <header_type>
+                           | --> another_l1 -> another_l2
+    """
+    projA = here/'sources/projA'
+
+    header = Sourcefile.from_file(projA/'module/header_mod.f90', frontend=frontend)['header_mod']
+
+    reference = Scheduler(
+        paths=projA, definitions=header, includes=projA/'include', config=config,
+        seed_routines=['driverA'], frontend=frontend
+    )
+    scheduler = Scheduler(
+        paths=projA, definitions=header, includes=projA/'include', config=config,
+        seed_routines=['driverA'], frontend=frontend, num_workers=2
+    )
+
+    assert {item.name for item in scheduler.items} == {item.name for item in reference.items}
+    for item in scheduler.items:
+        assert not item.source._incomplete
+        assert item.source.to_fortran() == reference[item.name].source.to_fortran()
+
+    # Check that the items refer to the completed IR
+    for item in scheduler.items:
+        if isinstance(item, SubroutineItem):
+            assert item.routine is item.source[item.local_name]
+            assert not item.routine._incomplete
+
+    # Check that imports and derived types refer to the definitions in this process
+    driver = scheduler['drivera_mod#drivera'].routine
+    assert driver.parent.symbol_attrs['header_type'].module is header
+    assert driver.variable_map['mystruct'].type.dtype.typedef is header['header_type']
+
+    call = FindNodes(CallStatement).visit(driver.body)[0]
+    assert call.arguments[0].parent.type.dtype.typedef is header['header_type']
+    assert fexprgen(call.arguments[0].shape) == '(:,)'
+    assert fexprgen(call.arguments[1].shape) == '(3, 3)'
+
+    kernel = scheduler['kernela_mod#kernela'].routine
+    assert call.routine is kernel
+
+
+def test_scheduler_omni_module_dependencies(here, config, frontend):
+    """
+    Test that imported modules outside of the item graph are added to the
+    file dependency graph for the generation of OMNI's xmod files, and
+    that existing xmod files are only re-used if they are up-to-date.
+    """
+    projA = here/'sources/projA'
+    scheduler = Scheduler(
+        paths=projA, includes=projA/'include', config=config,
+        seed_routines=['driverA'], frontend=frontend, full_parse=False
+    )
+    header_path = projA/'module/header_mod.f90'
+    assert header_path not in {item.source.path for item in scheduler.items}
+
+    file_graph = nx.DiGraph()
+    sources = {}
+    for item in scheduler.items:
+        sources[item.source.path] = item.source
+        file_graph.add_node(item.source.path)
+
+    assert scheduler._add_module_dependencies(file_graph, sources) == {header_path}
+    assert (projA/'module/kernelA_mod.F90', header_path) in file_graph.edges
+    assert not list(file_graph.successors(header_path))
+
+    xmods = gettempdir()/'test_scheduler_omni_module_dependencies'
+    xmods.mkdir(exist_ok=True)
+    xmod_file = xmods/'header_mod.xmod'
+    xmod_file.unlink(missing_ok=True)
+    assert not _xmods_up_to_date(sources[header_path], xmods)
+    xmod_file.touch()
+    assert _xmods_up_to_date(sources[header_path], [xmods])
+    mtime = header_path.stat().st_mtime_ns
+    os.utime(xmod_file, ns=(mtime - 1, mtime - 1))
+    assert not _xmods_up_to_date(sources[header_path], xmods)
+    rmtree(xmods)
+
+
+@pytest.mark.skipif(not HAVE_FP, reason='Fparser not available')
+def test_scheduler_parse_cache(here, config, monkeypatch):
+    """
+    Test that the scheduler re-uses parse results from the parse cache
+    and that items refer to the cached IR.
+    """
+    projA = here/'sources/projA'
+    cache_dir = gettempdir()/'test_scheduler_parse_cache'
+
+    header = Sourcefile.from_file(projA/'module/header_mod.f90', frontend=FP)['header_mod']
+
+    with config_override({'parse-cache-dir': str(cache_dir)}):
+        reference = Scheduler(
+            paths=projA, definitions=header, includes=projA/'include', config=config,
+            seed_routines=['driverA'], frontend=FP
+        )
+
+        def _fail(*args, **kwargs):
+            raise RuntimeError('Source has been re-parsed')
+        monkeypatch.setattr('loki.sourcefile.parse_fparser_source', _fail)
+
+        scheduler = Scheduler(
+            paths=projA, definitions=header, includes=projA/'include', config=config,
+            seed_routines=['driverA'], frontend=FP
+        )
+
+    for item in scheduler.items:
+        assert not item.source._incomplete
+        assert item.source.to_fortran() == reference[item.name].source.to_fortran()
+        if isinstance(item, SubroutineItem):
+            assert item.routine is item.source[item.local_name]
+
+    driver = scheduler['drivera_mod#drivera'].routine
+    assert driver.variable_map['mystruct'].type.dtype.typedef is header['header_type']
+    call = FindNodes(CallStatement).visit(driver.body)[0]
+    assert call.routine is scheduler['kernela_mod#kernela'].routine
+
+    rmtree(cache_dir)
+
+
+def test_scheduler_find_routine_and_getitem(here, config, frontend):
+    """
+    Test lookup of routine names in the discovered objects and
+    lookup of items in the scheduler graph.
+    """
+    projA = here/'sources/projA'
+
+    scheduler = Scheduler(
+        paths=projA, includes=projA/'include', config=config,
+        seed_routines=['driverA'], frontend=frontend, full_parse=False
+    )
+
+    # Unqualified, fully-qualified and global-scope names
+    assert scheduler.find_routine('kernelA') == 'kernela_mod#kernela'
+    assert scheduler.find_routine('KERNELA_MOD#KernelA') == 'kernela_mod#kernela'
+    assert scheduler.find_routine('a_mod#kernelA') == 'kernela_mod#kernela'
+    assert scheduler.find_routine('#another_l1') == '#another_l1'
+    assert scheduler.find_routine('another_l1') == '#another_l1'
+
+    config['default']['strict'] = False
+    scheduler.config = SchedulerConfig.from_dict(config)
+    assert scheduler.find_routine('other_mod#kernelA') is None
+    assert scheduler.find_routine('does_not_exist') is None
+
+    # Item lookup by name or item
+    item = scheduler['kernelA_mod#kernelA']
+    assert isinstance(item, SubroutineItem) and item.name == 'kernela_mod#kernela'
+    assert scheduler[item] is item
+    assert scheduler['#another_l1'] is scheduler.item_map['#another_l1']
+    assert scheduler['kernela_mod#does_not_exist'] is None
+
+
 def test_scheduler_process(here, config, frontend):
     """
     Create a simple task graph from a single sub-project
@@ -429,6 +680,263 @@ def test_scheduler_process(here, config, frontend):
     assert scheduler.item_map['#another_l2'].routine.name == 'another_l2_kernel'
 
 
+class AppendComment(Transformation):
+    """
+    Append a comment to the body of all kernel routines and record
+    the names of their successors
+    """
+    item_local = True
+
+    def transform_subroutine(self, routine, **kwargs):
+        item = kwargs['item']
+        item.trafo_data['successors'] = [child.name for child in kwargs['successors']]
+        item.trafo_data['depth'] = kwargs['depths'][item]
+        if item.role == 'kernel':
+            routine.body.append(Comment(text=f'! processed {routine.name}'))
+
+
+@pytest.mark.parametrize('num_workers', [None, 2])
+def test_scheduler_process_parallel(here, config, frontend, num_workers):
+    """
+    Test processing of item-local transformations in parallel worker processes.
+
+    projA: driverA -> kernelA -> compute_l1 -> compute_l2
+                           |
+                           | --> another_l1 -> another_l2
+    """
+    projA = here/'sources/projA'
+    config['routines'] = {'driverA': {'role': 'driver', 'expand': True}}
+
+    scheduler = Scheduler(
+        paths=projA, includes=projA/'include', config=config, frontend=frontend,
+        num_workers=num_workers
+    )
+    scheduler.process(transformation=AppendComment())
+
+    def comments(routine):
+        return [c.text for c in FindNodes(Comment).visit(routine.body) if c.text.startswith('! processed')]
+
+    assert not comments(scheduler['drivera_mod#drivera'].routine)
+    for item in scheduler.items:
+        if item.role == 'kernel':
+            assert comments(item.routine) == [f'! processed {item.routine.name}']
+
+    # The item's trafo_data has been updated
+    item = scheduler['kernela_mod#kernela']
+    assert item.trafo_data['successors'] == ['compute_l1_mod#compute_l1', '#another_l1']
+    assert item.trafo_data['depth'] == 1
+
+    # Calls are linked to the updated routines
+    for item in scheduler.items:
+        successors = {child.routine.name.lower(): child.routine for child in scheduler.item_successors(item)}
+        for call in FindNodes(CallStatement).visit(item.routine.body):
+            if str(call.name).lower() in successors:
+                assert call.routine is successors[str(call.name).lower()]
+
+    # Source files are updated consistently
+    source = scheduler['kernela_mod#kernela'].source
+    assert source['kernela'] is scheduler['kernela_mod#kernela'].routine
+    assert '! processed kernela' in source.to_fortran().lower()
+
+
+class RecordOrder(Transformation):
+    """
+    Record the order in which items are processed
+    """
+    item_local = True
+
+    def __init__(self, label, log, reverse=False):
+        self.label = label
+        self.log = log
+        self.reverse_traversal = reverse
+
+    def transform_subroutine(self, routine, **kwargs):
+        self.log.append((self.label, kwargs['item'].name))
+
+
+@pytest.mark.parametrize('num_workers', [None, 2])
+def test_scheduler_process_pipeline(here, config, frontend, num_workers):
+    """
+    Test fusion of transformations with compatible traversal in
+    :meth:`Scheduler.process_pipeline`
+
+    projA: driverA -> kernelA -> compute_l1 -> compute_l2
+                           |
+                           | --> another_l1 -> another_l2
+    """
+    projA = here/'sources/projA'
+    config['routines'] = {'driverA': {'role': 'driver', 'expand': True}}
+
+    scheduler = Scheduler(
+        paths=projA, includes=projA/'include', config=config, frontend=frontend
+    )
+
+    log = []
+    not_local = RecordOrder('D', log)
+    not_local.item_local = False
+    transformations = [
+        RecordOrder('A', log), RecordOrder('B', log), RecordOrder('C', log, reverse=True),
+        not_local, RecordOrder('E', log)
+    ]
+    groups = scheduler._fuse_transformations(transformations)  # pylint: disable=protected-access
+    assert [[t.label for t in group] for group in groups] == [['A', 'B'], ['C'], ['D'], ['E']]
+
+    scheduler.process_pipeline(transformations)
+    items = [item.name for item in scheduler.items]
+    assert len(log) == 5 * len(items)
+
+    # Fused transformations are applied to each item in turn
+    assert log[:2*len(items)] == [(label, name) for name in items for label in 'AB']
+    assert log[2*len(items):3*len(items)] == [('C', name) for name in reversed(items)]
+
+    # Fused groups are applied in a single parallel traversal
+    if num_workers:
+        scheduler = Scheduler(
+            paths=projA, includes=projA/'include', config=config, frontend=frontend,
+            num_workers=num_workers
+        )
+        scheduler.process_pipeline([AppendComment(), SanitiseTransformation(), AppendComment()])
+        for item in scheduler.items:
+            if item.role == 'kernel':
+                text = f'! processed {item.routine.name}'
+                assert [c.text for c in FindNodes(Comment).visit(item.routine.body)].count(text) == 2
+
+
+def test_scheduler_process_incremental(config, frontend):
+    """
+    Test incremental re-processing of items with a :any:`ProcessingManifest`
+
+    driver -> kernel_a -> leaf
+           |
+           | --> kernel_b
+    """
+    fcode = {
+        'driver': 'subroutine driver\n  call kernel_a\n  call kernel_b\nend subroutine driver',
+        'kernel_a': 'subroutine kernel_a\n  call leaf\nend subroutine kernel_a',
+        'kernel_b': 'subroutine kernel_b\nend subroutine kernel_b',
+        'leaf': 'subroutine leaf\nend subroutine leaf',
+    }
+
+    workdir = gettempdir()/'test_scheduler_process_incremental'
+    workdir.mkdir(exist_ok=True)
+    for name, code in fcode.items():
+        (workdir/f'{name}.F90').write_text(code)
+    builddir = workdir/'build'
+    builddir.mkdir(exist_ok=True)
+    manifest_path = workdir/'manifest.pickle'
+    if manifest_path.exists():
+        manifest_path.unlink()
+
+    class RecordItems(Transformation):
+        """
+        Record the names of processed items
+        """
+        def __init__(self):
+            self.processed = set()
+
+        def transform_subroutine(self, routine, **kwargs):
+            self.processed.add(kwargs['item'].name)
+
+    class PassCallerCode(RecordItems):
+        """
+        Record the names of processed items and pass the code of each
+        routine to its successors via ``trafo_data``
+        """
+        def transform_subroutine(self, routine, **kwargs):
+            super().transform_subroutine(routine, **kwargs)
+            for child in kwargs['successors']:
+                child.trafo_data['caller'] = routine.to_fortran()
+
+    def run(signature='sig', transformation_cls=RecordItems):
+        scheduler = Scheduler(
+            paths=[workdir], config=config, frontend=frontend,
+            manifest=ProcessingManifest(manifest_path, signature=signature)
+        )
+        transformation = transformation_cls()
+        scheduler.process(transformation)
+        for path in builddir.glob('*'):
+            path.unlink()
+        scheduler.process(FileWriteTransformation(builddir=builddir))
+        scheduler.write_manifest()
+        written = {path.name for path in builddir.glob('*')}
+        return transformation.processed, written
+
+    config['routines'] = {'driver': {'role': 'driver'}}
+
+    # Initially, all items are processed
+    all_items = {'#driver', '#kernel_a', '#kernel_b', '#leaf'}
+    all_files = {'driver.loki.F90', 'kernel_a.loki.F90', 'kernel_b.loki.F90', 'leaf.loki.F90'}
+    assert run() == (all_items, all_files)
+    assert manifest_path.exists()
+
+    # Nothing changed: all items are skipped
+    assert run() == (set(), set())
+
+    # A changed item is re-processed and written together with its callers,
+    # their other callees are skipped as they receive the same trafo_data
+    (workdir/'leaf.F90').write_text(fcode['leaf'].replace('leaf\n', 'leaf\n  implicit none\n', 1))
+    assert run() == (
+        {'#driver', '#kernel_a', '#leaf'}, {'driver.loki.F90', 'kernel_a.loki.F90', 'leaf.loki.F90'}
+    )
+    assert run() == (set(), set())
+
+    (workdir/'kernel_b.F90').write_text(fcode['kernel_b'].replace('b\n', 'b\n  implicit none\n', 1))
+    assert run() == ({'#driver', '#kernel_b'}, {'driver.loki.F90', 'kernel_b.loki.F90'})
+
+    # Unrelated call trees are skipped entirely
+    (workdir/'other.F90').write_text('subroutine other\n  call kernel_b\nend subroutine other')
+    config['routines'] = {'driver': {'role': 'driver'}, 'other': {'role': 'driver'}}
+    assert run() == ({'#other'}, {'other.loki.F90'})
+
+    # A different signature triggers a full run
+    config['routines'] = {'driver': {'role': 'driver'}}
+    assert run(signature='other') == (all_items, all_files)
+
+    # A different transformation chain triggers a full run
+    scheduler = Scheduler(
+        paths=[workdir], config=config, seed_routines=['driver'], frontend=frontend,
+        manifest=ProcessingManifest(manifest_path, signature='other')
+    )
+    transformation = RecordItems()
+    scheduler.process(FileWriteTransformation(builddir=builddir))
+    scheduler.process(transformation)
+    assert transformation.processed == all_items
+    scheduler.write_manifest()
+
+    # A chain that differs after items have been skipped is an error
+    scheduler = Scheduler(
+        paths=[workdir], config=config, seed_routines=['driver'], frontend=frontend,
+        manifest=ProcessingManifest(manifest_path, signature='other')
+    )
+    scheduler.process(FileWriteTransformation(builddir=builddir))
+    with pytest.raises(RuntimeError):
+        scheduler.process(DependencyTransformation(suffix='_test'))
+    assert not manifest_path.exists()
+
+    # Callees are re-processed if the trafo_data they receive changes
+    assert run(transformation_cls=PassCallerCode) == (all_items, all_files)
+    assert run(transformation_cls=PassCallerCode) == (set(), set())
+
+    (workdir/'driver.F90').write_text(fcode['driver'].replace('driver\n', 'driver\n  implicit none\n', 1))
+    assert run(transformation_cls=PassCallerCode) == (
+        {'#driver', '#kernel_a', '#kernel_b'}, {'driver.loki.F90', 'kernel_a.loki.F90', 'kernel_b.loki.F90'}
+    )
+    assert run(transformation_cls=PassCallerCode) == (set(), set())
+
+    # The trafo_data of skipped items is restored from the manifest
+    scheduler = Scheduler(
+        paths=[workdir], config=config, frontend=frontend,
+        manifest=ProcessingManifest(manifest_path, signature='sig')
+    )
+    transformation = PassCallerCode()
+    scheduler.process(transformation)
+    assert not transformation.processed
+    assert scheduler['#kernel_b'].trafo_data['caller'] == scheduler['#driver'].routine.to_fortran()
+    assert scheduler['#leaf'].trafo_data['caller'] == scheduler['#kernel_a'].routine.to_fortran()
+
+    rmtree(workdir)
+
+
 @pytest.mark.skipif(not graphviz_present(), reason='Graphviz is not installed')
 def test_scheduler_process_filter(here, config, frontend):
     """
@@ -2115,11 +2623,29 @@ end subroutine caller
     # Function should be in the obj map already
     assert 'some_mod#some_function' in scheduler.obj_map
 
+    # Derived graph views are cached
+    file_graph = scheduler.file_graph
+    depths = scheduler.depths
+    assert scheduler.file_graph is file_graph
+    assert scheduler.depths is depths
+    assert scheduler.item_successors(scheduler['#caller']) == [
+        'some_mod#some_type%some_routine', 'some_mod#some_routine'
+    ]
+
     # Add inline call dependency
     scheduler.add_dependencies(
         {'#caller': ['some_mod#some_type%some_function']}
     )
 
+    # Derived graph views are updated
+    assert scheduler.file_graph is not file_graph
+    assert scheduler.depths is not depths
+    assert scheduler.depths['some_mod#some_function'] == 2
+    assert set(scheduler.item_successors(scheduler['#caller'])) == {
+        'some_mod#some_type%some_routine', 'some_mod#some_routine',
+        'some_mod#some_type%some_function', 'some_mod#some_function'
+    }
+
     # Scheduler should have automatically added further relevant dependencies
     expected_items += [
         'some_mod#some_type%some_function', 'some_mod#some_function'
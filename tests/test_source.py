@@ -171,6 +171,45 @@ def test_source_clone_lines(here):
         assert source_line.file == filepath
 
 
+def test_source_buffer(here):
+    """Test :any:`Source` objects that reference a span in a shared buffer"""
+    filepath = here/'sources/sourcefile.f90'
+    fcode = read_file(filepath)
+    lines = (1, fcode.count('\n') + 1)
+    source = Source(lines, fcode, filepath)
+
+    routine_b_match = re.search(r'(subroutine routine_b.*?end subroutine routine_b)', fcode, re.DOTALL)
+    buffer_source = Source(lines, file=filepath, buffer=fcode, span=(0, len(fcode)))
+    assert buffer_source == source
+    assert hash(buffer_source) == hash(source)
+
+    # Clones share the buffer and yield the same results
+    routine_b_source = buffer_source.clone_with_span(routine_b_match.span())
+    assert routine_b_source._buffer is fcode
+    assert routine_b_source == source.clone_with_span(routine_b_match.span())
+    assert buffer_source.clone_with_string('routine_b') == source.clone_with_string('routine_b')
+    assert buffer_source.clone_lines() == source.clone_lines()
+    assert routine_b_source.clone_lines() == source.clone_lines(routine_b_match.span())
+    assert routine_b_source.clone_lines((10, 50)) == source.clone_with_span(routine_b_match.span()).clone_lines((10, 50))
+    assert all(line._buffer is fcode for line in routine_b_source.clone_lines())
+
+    # Assigning a string detaches the object from the buffer
+    routine_b_source.string = 'subroutine routine_b\nend subroutine routine_b'
+    assert routine_b_source._buffer is None
+    assert routine_b_source.string == 'subroutine routine_b\nend subroutine routine_b'
+    assert routine_b_source.clone_lines()[1].string == 'end subroutine routine_b'
+
+    # Sources created by the reader share the reader's buffer
+    reader = FortranReader(fcode)
+    sub_reader = reader.reader_from_sanitized_span(
+        re.search(r'subroutine routine_b.*?end subroutine routine_b', reader.sanitized_string, re.DOTALL).span()
+    )
+    reader_source = sub_reader.to_source()
+    assert reader_source._buffer is reader._buffer
+    assert reader_source.string == '\n'.join(sub_reader.source_lines)
+    assert reader_source.string == routine_b_match.group(0)
+
+
 def test_source_to_lines():
     """Test the `source_to_lines` utility"""
     fcode = """
@@ -5,8 +5,12 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+from io import BytesIO
 from pathlib import Path
+from shutil import rmtree
 from subprocess import CalledProcessError
+import sys
+import xml.etree.ElementTree as ET
 import pytest
 import numpy as np
 
@@ -14,7 +18,8 @@ from conftest import jit_compile, clean_test, available_frontends
 from loki import (
     Sourcefile, OFP, OMNI, FP, REGEX, FindNodes, PreprocessorDirective,
     Intrinsic, Assignment, Import, fgen, ProcedureType, ProcedureSymbol,
-    StatementFunction, Comment, CommentBlock, RawSource, Scalar
+    StatementFunction, Comment, CommentBlock, RawSource, Scalar, HAVE_FP,
+    config_override, gettempdir, preprocess_cpp, Subroutine
 )
 
 
@@ -351,3 +356,339 @@ end subroutine myroutine
     assert '! Comment outside' in code
     assert '! Comment inside' in code
     assert '! Other comment outside' in code
+
+
+@pytest.mark.skipif(not HAVE_FP, reason='Fparser not available')
+def test_sourcefile_parse_cache(monkeypatch):
+    """
+    Test that parse results of the FP frontend are re-used from the parse cache
+    """
+    fcode_mod = """
+module some_mod
+    implicit none
+    type some_type
+        integer :: a
+    end type some_type
+end module some_mod
+    """.strip()
+
+    fcode = """
+subroutine some_routine(t)
+    use some_mod, only: some_type
+    implicit none
+    type(some_type), intent(inout) :: t
+    t%a = 1
+end subroutine some_routine
+    """.strip()
+
+    workdir = gettempdir()/'test_sourcefile_parse_cache'
+    workdir.mkdir(exist_ok=True)
+    filepath = workdir/'some_routine.F90'
+    filepath.write_text(fcode)
+
+    some_mod = Sourcefile.from_source(fcode_mod, frontend=FP)['some_mod']
+
+    with config_override({'parse-cache-dir': str(workdir/'cache')}):
+        source = Sourcefile.from_file(filepath, definitions=some_mod, frontend=FP)
+        assert len(list((workdir/'cache').glob('*.pickle'))) == 1
+
+        # Make sure the second parse is served from the cache
+        def _fail(*args, **kwargs):
+            raise RuntimeError('Source has been re-parsed')
+        monkeypatch.setattr('loki.sourcefile.parse_fparser_source', _fail)
+
+        cached = Sourcefile.from_file(filepath, definitions=some_mod, frontend=FP)
+        assert cached is not source
+        assert cached.to_fortran() == source.to_fortran()
+
+        # The cached IR is linked to the given definitions
+        routine = cached['some_routine']
+        assert routine.symbol_attrs['some_type'].module is some_mod
+        assert routine.variable_map['t'].type.dtype.typedef is some_mod['some_type']
+
+        # Lazy construction uses a separate cache entry
+        monkeypatch.undo()
+        lazy = Sourcefile.from_file(filepath, frontend=REGEX)
+        lazy.make_complete(frontend=FP, definitions=some_mod)
+        assert len(list((workdir/'cache').glob('*.pickle'))) == 2
+
+        monkeypatch.setattr('loki.sourcefile.parse_fparser_source', _fail)
+        lazy = Sourcefile.from_file(filepath, frontend=REGEX)
+        lazy.make_complete(frontend=FP, definitions=some_mod)
+        assert not lazy._incomplete
+        assert lazy['some_routine'].variable_map['t'].type.dtype.typedef is some_mod['some_type']
+
+        # An identical source file at a different path shares the cache entry
+        other_filepath = workdir/'other_routine.F90'
+        other_filepath.write_text(fcode)
+        other = Sourcefile.from_file(other_filepath, definitions=some_mod, frontend=FP)
+        assert other.path == other_filepath
+        assert other.source.file == other_filepath
+        assert len(list((workdir/'cache').glob('*.pickle'))) == 2
+
+        # A modified source file is parsed again
+        filepath.write_text(fcode.replace('t%a = 1', 't%a = 2'))
+        with pytest.raises(RuntimeError):
+            Sourcefile.from_file(filepath, definitions=some_mod, frontend=FP)
+
+        # A modified transitive dependency invalidates the cache entry
+        monkeypatch.undo()
+        fcode_base = """
+module base_mod
+    implicit none
+    integer, parameter :: n = 1
+end module base_mod
+        """.strip()
+        fcode_mod = fcode_mod.replace('implicit none', 'use base_mod, only: n\n    implicit none')
+        definitions = [Sourcefile.from_source(fcode_base, frontend=FP)['base_mod']]
+        definitions += [Sourcefile.from_source(fcode_mod, frontend=FP, definitions=definitions)['some_mod']]
+        Sourcefile.from_file(filepath, definitions=definitions, frontend=FP)
+
+        new_base_mod = Sourcefile.from_source(fcode_base.replace('n = 1', 'n = 2'), frontend=FP)['base_mod']
+        monkeypatch.setattr('loki.sourcefile.parse_fparser_source', _fail)
+        Sourcefile.from_file(filepath, definitions=definitions, frontend=FP)
+
+        definitions[0] = new_base_mod
+        with pytest.raises(RuntimeError):
+            Sourcefile.from_file(filepath, definitions=definitions, frontend=FP)
+
+    rmtree(workdir)
+
+
+def test_sourcefile_generate_omni_xmods(monkeypatch):
+    """
+    Test that sources are preprocessed with the given includes and defines
+    before generating ``.xmod`` files with the OMNI frontend
+    """
+    fcode = """
+module xmod_gen_mod
+  implicit none
+#include "xmod_gen_mod.h"
+#ifdef XMOD_FLAG
+  integer, parameter :: flag = 1
+#else
+  integer, parameter :: flag = 0
+#endif
+end module xmod_gen_mod
+    """.strip()
+
+    workdir = gettempdir()/'test_sourcefile_generate_omni_xmods'
+    workdir.mkdir(exist_ok=True)
+    filepath = workdir/'xmod_gen_mod.F90'
+    filepath.write_text(fcode)
+    (workdir/'xmod_gen_mod.h').write_text('integer, parameter :: from_header = 1\n')
+
+    generated = []
+    def _generate_omni_xmods(source, filepath=None, xmods=None):
+        generated.append((source, filepath, xmods))
+    monkeypatch.setattr('loki.sourcefile.generate_omni_xmods', _generate_omni_xmods)
+
+    Sourcefile.generate_omni_xmods(fcode, filepath=filepath, includes=workdir,
+                                   defines=['XMOD_FLAG'], xmods=workdir)
+    assert len(generated) == 1
+    source, path, xmods = generated[0]
+    assert path == filepath and xmods == workdir
+    assert 'from_header = 1' in source
+    assert 'flag = 1' in source and 'flag = 0' not in source
+    assert '#include' not in source
+
+    # OMNI-specific include paths replace the default include paths
+    (workdir/'omni').mkdir(exist_ok=True)
+    (workdir/'omni'/'xmod_gen_mod.h').write_text('integer, parameter :: from_omni_header = 1\n')
+    Sourcefile.generate_omni_xmods(fcode, filepath=filepath, includes=workdir,
+                                   omni_includes=[workdir/'omni'], xmods=workdir)
+    source = generated[-1][0]
+    assert 'from_omni_header = 1' in source and 'from_header' not in source
+    assert 'flag = 0' in source
+
+    rmtree(workdir)
+
+
+def test_sourcefile_cpp_cache(monkeypatch):
+    """
+    Test that header files are shared between preprocessor runs and that
+    preprocessed sources are re-used from the parse cache
+    """
+    fcode = """
+subroutine routine_cpp_cache(b)
+    integer, intent(out) :: b
+#include "routine_cpp_cache.h"
+end subroutine routine_cpp_cache
+    """.strip()
+
+    workdir = gettempdir()/'test_sourcefile_cpp_cache'
+    workdir.mkdir(exist_ok=True)
+    filepath = workdir/'routine_cpp_cache.F90'
+    filepath.write_text(fcode)
+    header = workdir/'routine_cpp_cache.h'
+    header.write_text('b = VALUE\n')
+
+    # The tokenised header is re-used with different definitions
+    source = preprocess_cpp(fcode, includes=workdir, defines='VALUE=2')
+    assert 'b = 2' in source
+    source = preprocess_cpp(fcode, includes=workdir, defines='VALUE=3')
+    assert 'b = 3' in source
+
+    with config_override({'parse-cache-dir': str(workdir/'cache')}):
+        source = Sourcefile.from_file(filepath, preprocess=True, includes=workdir,
+                                      defines='VALUE=4', frontend=REGEX)
+        assert 'b = 4' in source.to_fortran()
+        assert len(list((workdir/'cache').glob('*.pickle'))) == 1
+
+        # Make sure the second run is served from the cache
+        def _fail(*args, **kwargs):
+            raise RuntimeError('Source has been re-preprocessed')
+        monkeypatch.setattr('loki.frontend.preprocessing._LokiCPreprocessor.parse', _fail)
+
+        cached = Sourcefile.from_file(filepath, preprocess=True, includes=workdir,
+                                      defines='VALUE=4', frontend=REGEX)
+        assert 'b = 4' in cached.to_fortran()
+
+        # Different definitions or a modified header file are preprocessed again
+        with pytest.raises(RuntimeError):
+            Sourcefile.from_file(filepath, preprocess=True, includes=workdir,
+                                 defines='VALUE=5', frontend=REGEX)
+
+        header.write_text('b = VALUE + 1\n')
+        with pytest.raises(RuntimeError):
+            Sourcefile.from_file(filepath, preprocess=True, includes=workdir,
+                                 defines='VALUE=4', frontend=REGEX)
+
+        monkeypatch.undo()
+        source = Sourcefile.from_file(filepath, preprocess=True, includes=workdir,
+                                      defines='VALUE=4', frontend=REGEX)
+        assert 'b = 4 + 1' in source.to_fortran()
+
+    rmtree(workdir)
+
+
+@pytest.mark.skipif(OMNI not in available_frontends(), reason='OMNI not available')
+def test_sourcefile_omni_stream_xml(here):
+    """
+    Test that the incremental conversion of OMNI's XML output yields the
+    same IR without retaining the XML tree
+    """
+    filepath = here/'sources/sourcefile.f90'
+    source = Sourcefile.from_file(filepath, frontend=OMNI)
+
+    with config_override({'omni-stream-xml': True}):
+        streamed = Sourcefile.from_file(filepath, frontend=OMNI)
+
+    assert streamed.to_fortran() == source.to_fortran()
+    assert [r.name for r in streamed.all_subroutines] == [r.name for r in source.all_subroutines]
+    assert streamed._ast is None
+    assert all(r._ast is None for r in streamed.all_subroutines)
+    assert all(r._ast is not None for r in source.all_subroutines)
+
+
+OMNI_STREAM_XML = """
+<XcodeProgram source="omni_stream.f90" language="Fortran">
+  <typeTable>
+    <FfunctionType type="F0" return_type="Fvoid">
+      <params><name type="Fint">a</name></params>
+    </FfunctionType>
+  </typeTable>
+  <globalSymbols>
+    <id sclass="ffunc" type="F0"><name>routine_a</name></id>
+    <id sclass="ffunc" type="F0"><name>routine_b</name></id>
+  </globalSymbols>
+  <globalDeclarations>
+    <FfunctionDefinition lineno="1" file="omni_stream.f90">
+      <name type="F0">routine_a</name>
+      <symbols>
+        <id type="Fint" sclass="fparam"><name>a</name></id>
+      </symbols>
+      <declarations>
+        <varDecl lineno="2" file="omni_stream.f90"><name type="Fint">a</name></varDecl>
+      </declarations>
+      <body>
+        <FassignStatement lineno="3" file="omni_stream.f90">
+          <Var type="Fint" scope="local">a</Var>
+          <FintConstant type="Fint">1</FintConstant>
+        </FassignStatement>
+      </body>
+    </FfunctionDefinition>
+    <FfunctionDefinition lineno="5" file="omni_stream.f90">
+      <name type="F0">routine_b</name>
+      <symbols>
+        <id type="Fint" sclass="fparam"><name>a</name></id>
+      </symbols>
+      <declarations>
+        <varDecl lineno="6" file="omni_stream.f90"><name type="Fint">a</name></varDecl>
+      </declarations>
+      <body>
+        <FassignStatement lineno="7" file="omni_stream.f90">
+          <Var type="Fint" scope="local">a</Var>
+          <FintConstant type="Fint">2</FintConstant>
+        </FassignStatement>
+      </body>
+    </FfunctionDefinition>
+  </globalDeclarations>
+</XcodeProgram>
+""".strip()
+
+OMNI_STREAM_FCODE = """
+subroutine routine_a(a)
+  integer :: a
+  a = 1
+end subroutine routine_a
+subroutine routine_b(a)
+  integer :: a
+  a = 2
+end subroutine routine_b
+""".strip()
+
+
+def test_sourcefile_omni_stream_events():
+    """
+    Test the incremental conversion of a synthetic XcodeML document via
+    :any:`parse_omni_events` without running F_Front
+    """
+    from loki.frontend.omni import parse_omni_events  # pylint: disable=import-outside-toplevel
+
+    events = ET.iterparse(BytesIO(OMNI_STREAM_XML.encode()), events=('start', 'end'))
+    ir = parse_omni_events(events, raw_source=OMNI_STREAM_FCODE)
+    routines = [node for node in ir.body if isinstance(node, Subroutine)]
+    assert [r.name for r in routines] == ['routine_a', 'routine_b']
+    assert all(r._ast is None for r in routines)
+    assert [fgen(FindNodes(Assignment).visit(r.body)) for r in routines] == ['a = 1', 'a = 2']
+
+    source = Sourcefile._from_omni_events(
+        events=ET.iterparse(BytesIO(OMNI_STREAM_XML.encode()), events=('start', 'end')),
+        path='omni_stream.f90', raw_source=OMNI_STREAM_FCODE
+    )
+    assert source._ast is None
+    assert [r.name for r in source.subroutines] == ['routine_a', 'routine_b']
+    assert all(r._ast is None for r in source.subroutines)
+
+
+def test_sourcefile_omni_stream_command(monkeypatch):
+    """
+    Test that :any:`iterparse_omni_file` streams the output of the frontend
+    command and reports its failure, using a stand-in for F_Front
+    """
+    from loki.frontend import omni  # pylint: disable=import-outside-toplevel
+
+    workdir = gettempdir()/'test_sourcefile_omni_stream_command'
+    workdir.mkdir(exist_ok=True)
+    xml_path = workdir/'omni_stream.xml'
+    xml_path.write_text(OMNI_STREAM_XML)
+
+    monkeypatch.setattr(omni, 'HAVE_OMNI', True)
+    monkeypatch.setattr(omni, '_omni_command', lambda filepath, xmods=None: ['cat', str(xml_path)])
+    ir = omni.parse_omni_events(omni.iterparse_omni_file(workdir/'omni_stream.f90'), raw_source=OMNI_STREAM_FCODE)
+    assert [node.name for node in ir.body if isinstance(node, Subroutine)] == ['routine_a', 'routine_b']
+
+    # Stopping early drains the output of the command
+    events = omni.iterparse_omni_file(workdir/'omni_stream.f90')
+    assert next(events)[1].tag == 'XcodeProgram'
+    events.close()
+
+    # Incomplete output of a failed command raises the error of the command
+    script = "import sys; sys.stdout.write('<XcodeProgram>'); sys.stderr.write('F_Front failed'); sys.exit(1)"
+    monkeypatch.setattr(omni, '_omni_command', lambda filepath, xmods=None: [sys.executable, '-c', script])
+    with pytest.raises(CalledProcessError) as exc:
+        list(omni.iterparse_omni_file(workdir/'omni_stream.f90'))
+    assert exc.value.stderr == 'F_Front failed'
+
+    rmtree(workdir)
@@ -17,7 +17,7 @@ from loki import (
     SymbolAttributes, StringLiteral, fgen, fexprgen, VariableDeclaration,
     Transformer, FindTypedSymbols, ProcedureSymbol, ProcedureType,
     StatementFunction, normalize_range_indexing, DeferredTypeSymbol,
-    Assignment, Interface
+    Assignment, Interface, EnrichmentContext
 )
 
 
@@ -443,6 +443,58 @@ integer :: c
     )
 
 
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_routine_derived_map_caching(frontend):
+    """
+    Test that derived maps are cached and invalidated when the IR changes.
+    """
+    fcode = """
+subroutine routine_derived_map_caching(x, y)
+  use some_mod, only: a, b
+  integer, intent(in) :: x
+  real, intent(inout) :: y(x)
+  integer :: i
+end subroutine routine_derived_map_caching
+"""
+    routine = Subroutine.from_source(fcode, frontend=frontend)
+    variable_map = routine.variable_map
+    import_map = routine.import_map
+    assert routine.variable_map is variable_map
+    assert routine.import_map is import_map
+    assert routine.imported_symbol_map is routine.imported_symbol_map
+    assert set(variable_map.keys()) == {'x', 'y', 'i'}
+    assert set(import_map.keys()) == {'a', 'b'}
+
+    # The cached maps are read-only, but copies can be modified
+    with pytest.raises(TypeError):
+        variable_map['z'] = variable_map['x']
+    with pytest.raises(TypeError):
+        routine.imported_symbol_map['c'] = import_map['a']
+    assert 'X' in variable_map and variable_map.get('Y') is variable_map['y']
+    variable_map_copy = variable_map.copy()
+    variable_map_copy['z'] = variable_map['x']
+    assert 'Z' in variable_map_copy and 'z' not in routine.variable_map
+
+    # Updates via the variables setter invalidate the cache
+    routine.variables += (Scalar(name='j', type=SymbolAttributes(BasicType.INTEGER), scope=routine),)
+    assert routine.variable_map is not variable_map
+    assert 'j' in routine.variable_map and 'j' not in variable_map
+
+    # In-place updates of IR nodes invalidate the cache
+    imprt = routine.imports[0]
+    imprt._update(symbols=imprt.symbols[:1])
+    assert set(routine.import_map.keys()) == {'a'}
+    assert [s.name for s in routine.imported_symbols] == ['a']
+
+    # Replacing the spec invalidates the cache
+    variable_map = routine.variable_map
+    routine.spec = Transformer({imprt: None}).visit(routine.spec)
+    assert not routine.import_map
+    assert not routine.imported_symbol_map
+    assert routine.variable_map is not variable_map
+    assert set(routine.variable_map.keys()) == {'x', 'y', 'i', 'j'}
+
+
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_routine_variables_find(frontend):
     """
@@ -2056,6 +2108,52 @@ def test_enrich_explicit_interface(frontend):
     assert calls[0].routine is kernel
 
 
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_enrich_context(frontend):
+    """
+    Test enrich with a shared :any:`EnrichmentContext` for multiple routines.
+    """
+    fcode_module = """
+module enrich_context_mod
+    implicit none
+    integer, parameter :: n = 5
+contains
+    subroutine kernel(a)
+    integer, intent(inout) :: a
+    a = a + n
+    end subroutine kernel
+end module enrich_context_mod
+    """.strip()
+
+    fcode_driver = """
+subroutine driver_{idx}(a)
+    use enrich_context_mod, only: kernel
+    implicit none
+    integer, intent(inout) :: a
+    call kernel(a)
+end subroutine driver_{idx}
+    """.strip()
+
+    module = Module.from_source(fcode_module, frontend=frontend)
+    drivers = [
+        Subroutine.from_source(fcode_driver.format(idx=idx), frontend=frontend)
+        for idx in range(3)
+    ]
+
+    context = EnrichmentContext([module])
+    assert EnrichmentContext.create(context) is context
+    assert context.get('ENRICH_CONTEXT_MOD') is module
+    assert context.get('other_mod') is None
+    assert context.lookup(module, 'N') is module['n']
+    assert context.lookup(module, 'kernel') is module['kernel']
+
+    for driver in drivers:
+        driver.enrich(context)
+        calls = FindNodes(CallStatement).visit(driver.body)
+        assert calls[0].routine is module['kernel']
+        assert driver.symbol_attrs['kernel'].dtype.procedure is module['kernel']
+
+
 @pytest.mark.parametrize('frontend', available_frontends(
     xfail=[(OMNI, 'OMNI cannot handle external type defs without source')]
 ))
@@ -9,10 +9,13 @@
 Unit tests for utility functions and classes in loki.tools.
 """
 
+import os
 import sys
+import pickle
 import operator as op
 from contextlib import contextmanager
 from pathlib import Path
+from shutil import rmtree
 from subprocess import CalledProcessError
 from time import sleep, perf_counter
 import pytest
@@ -26,7 +29,7 @@ except ImportError:
 from conftest import stdchannel_is_captured, stdchannel_redirected
 from loki.tools import (
     JoinableStringList, truncate_string, binary_insertion_sort, is_subset,
-    optional, yaml_include_constructor, execute, timeout
+    optional, yaml_include_constructor, execute, timeout, ContentCache, gettempdir
 )
 
 
@@ -341,3 +344,44 @@ def test_timeout():
         stop = perf_counter()
         assert .9 < stop - start < 1.1
         assert "My message" in str(exc.value)
+
+
+def test_content_cache():
+    cache_dir = gettempdir()/'test_content_cache'
+    cache = ContentCache(cache_dir, max_size=None)
+
+    key = ContentCache.key('some', 'source', 1)
+    assert key == ContentCache.key('some', 'source', 1)
+    assert key != ContentCache.key('some', 'source', 2)
+    assert key != ContentCache.key('somesource', 1)
+
+    assert cache.get(key) is None
+    cache.put(key, {'a': (1, 2, 3)})
+    assert cache.get(key) == {'a': (1, 2, 3)}
+
+    # Corrupted entries are removed
+    (cache_dir/f'{key}{ContentCache.suffix}').write_text('not a pickle')
+    assert cache.get(key) is None
+    assert not (cache_dir/f'{key}{ContentCache.suffix}').exists()
+
+    # Least recently used entries are evicted first
+    entry_size = len(pickle.dumps('x' * 1000, protocol=pickle.HIGHEST_PROTOCOL))
+    cache = ContentCache(cache_dir, max_size=3*entry_size)
+    keys = [ContentCache.key(i) for i in range(4)]
+    for i, key in enumerate(keys[:3]):
+        cache.put(key, 'x' * 1000)
+        os.utime(cache_dir/f'{key}{ContentCache.suffix}', (i, i))
+    assert cache.get(keys[0]) == 'x' * 1000
+    cache.put(keys[3], 'x' * 1000)
+
+    assert cache.get(keys[1]) is None
+    assert all(cache.get(key) == 'x' * 1000 for key in (keys[0], keys[2], keys[3]))
+
+    # Overwriting an entry does not count its previous size
+    cache = ContentCache(cache_dir, max_size=10*entry_size)
+    for _ in range(5):
+        cache.put(keys[3], 'x' * 1000)
+    assert cache._size == 3*entry_size
+    assert all(cache.get(key) == 'x' * 1000 for key in (keys[0], keys[2], keys[3]))
+
+    rmtree(cache_dir)
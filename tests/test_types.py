@@ -13,7 +13,7 @@ from conftest import available_frontends
 from loki import (
     OFP, OMNI, Sourcefile, Module, Subroutine, BasicType,
     SymbolAttributes, DerivedType, TypeDef, FCodeMapper,
-    DataType, fgen, ProcedureType, FindNodes, ProcedureDeclaration
+    DataType, fgen, ProcedureType, FindNodes, ProcedureDeclaration, SymbolTable
 )
 from loki.expression import symbols as sym
 
@@ -78,6 +78,39 @@ def test_symbol_attributes():
     assert _type.foofoo is None
 
 
+def test_symbol_attributes_shared():
+    """
+    Test that :any:`SymbolAttributes` stored in a :any:`SymbolTable` are
+    shared by all look-ups and immutable
+    """
+    parent = SymbolTable()
+    table = SymbolTable(parent=parent)
+    _type = SymbolAttributes('integer', intent='in')
+    table['a'] = _type
+    parent['b'] = SymbolAttributes('real')
+
+    # Look-ups return the stored object without copying
+    assert table['a'] is _type
+    assert table.lookup('A') is _type
+    assert table.get('a') is _type
+    assert table.lookup('b') is parent['b']
+    assert table.clone()['a'] is _type
+
+    # Shared objects cannot be modified...
+    with pytest.raises(AttributeError):
+        _type.intent = 'out'
+    with pytest.raises(AttributeError):
+        delattr(_type, 'intent')
+    assert table['a'].intent == 'in'
+
+    # ...but clones can
+    new_type = table['a'].clone(intent='out')
+    new_type.shape = (1,)
+    table['a'] = new_type
+    assert table['a'].intent == 'out' and table['a'].shape == (1,)
+    assert _type.intent == 'in' and _type.shape is None
+
+
 def test_symbol_attributes_compare():
     """
     Test dedicated `type.compare` methods that allows certain
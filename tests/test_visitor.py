@@ -6,6 +6,7 @@
 # nor does it submit to any jurisdiction.
 
 import pytest
+from pydantic import ValidationError
 from pymbolic.primitives import Expression
 
 from conftest import available_frontends
@@ -13,13 +14,51 @@ from loki import (
     OMNI,
     Module, Subroutine, Section, Loop, Assignment, Conditional, Sum, Associate,
     Array, ArraySubscript, LoopRange, IntLiteral, FloatLiteral, LogicLiteral,
-    FindNodes, FindVariables, ExpressionFinder,
-    ExpressionCallbackMapper, ExpressionRetriever, Stringifier, Transformer,
+    FindNodes, FindVariables, FindInlineCalls, FindLiterals, ExpressionFinder, MultiExpressionFinder,
+    ExpressionCallbackMapper, ExpressionRetriever, Stringifier, Transformer, GenericVisitor,
     NestedTransformer, MaskedTransformer, NestedMaskedTransformer, SubstituteExpressions,
-    is_parent_of, is_child_of, fgen, FindScopes, Intrinsic
+    is_parent_of, is_child_of, fgen, FindScopes, Intrinsic, Comment, config_override, NodeIndex
 )
 
 
+def test_generic_visitor_dispatch():
+    """
+    Test the class-level handler tables and MRO-based dispatch of visitors.
+    """
+    class BaseVisitor(GenericVisitor):
+
+        def visit_Node(self, o, **kwargs):  # pylint: disable=unused-argument
+            return 'Node'
+
+        def visit_tuple(self, o, **kwargs):
+            return tuple(self.visit(c, **kwargs) for c in o)
+
+    class DerivedVisitor(BaseVisitor):
+
+        def visit_Loop(self, o, **kwargs):  # pylint: disable=unused-argument
+            return 'Loop'
+
+    comment = Comment(text='! comment')
+    loop = Loop(variable=Array('i'), bounds=LoopRange((IntLiteral(1), IntLiteral(2))), body=(comment,))
+
+    # Handler tables are built once per class
+    assert set(BaseVisitor._handlers) == {'Node', 'tuple', 'object'}
+    assert set(DerivedVisitor._handlers) == {'Node', 'Loop', 'tuple', 'object'}
+    assert BaseVisitor().visit((loop, comment, 1)) == ('Node', 'Node', None)
+    assert DerivedVisitor().visit((loop, comment, 1)) == ('Loop', 'Node', None)
+
+    # Handlers resolved via the MRO are cached per visitor class
+    assert BaseVisitor._dispatch_table[Loop] is BaseVisitor._handlers['Node']
+    assert DerivedVisitor._dispatch_table[Loop] is DerivedVisitor._handlers['Loop']
+    assert DerivedVisitor().lookup_method(comment)(comment) == 'Node'
+
+    # Invalid handler signatures are detected when defining the class
+    with pytest.raises(RuntimeError):
+        class InvalidVisitor(GenericVisitor):  # pylint: disable=unused-variable
+            def visit_Node(self):
+                pass
+
+
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_find_nodes_greedy(frontend):
     """
@@ -237,6 +276,48 @@ end subroutine routine_simple
     assert sorted([str(v) for v in stmts[1][1]]) == ['i', 'matrix(i, :)', 'vector(i)']
 
 
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_multi_expression_finder(frontend):
+    """
+    Test that the multi-query expression finder yields the same results as
+    the individual expression finders.
+    """
+    fcode = """
+subroutine routine_multi_finder (x, y, vector, matrix)
+  integer, intent(in) :: x, y
+  real(kind=8), intent(inout) :: vector(x), matrix(x, y)
+  integer :: i
+
+  do i=1, x
+     vector(i) = max(vector(i), 1.0)
+     matrix(i, :) = i * vector(i) + 2
+  end do
+end subroutine routine_multi_finder
+"""
+    routine = Subroutine.from_source(fcode, frontend=frontend)
+    queries = {
+        'variables': FindVariables, 'calls': FindInlineCalls, 'literals': FindLiterals,
+        'arrays': lambda e: isinstance(e, Array)
+    }
+
+    for kwargs in ({}, {'unique': False}):
+        results = MultiExpressionFinder(queries, **kwargs).visit(routine.body)
+        assert set(results) == set(queries)
+        for name in ('variables', 'calls', 'literals'):
+            expected = queries[name](**kwargs).visit(routine.body)
+            assert type(results[name]) is type(expected)
+            assert sorted(str(e) for e in results[name]) == sorted(str(e) for e in expected)
+        assert {str(e) for e in results['arrays']} == {'vector(i)', 'matrix(i, :)'}
+
+    results = MultiExpressionFinder(queries, with_ir_node=True).visit(routine.body)
+    for name in ('variables', 'calls', 'literals'):
+        expected = queries[name](with_ir_node=True).visit(routine.body)
+        assert [node for node, _ in results[name]] == [node for node, _ in expected]
+        assert [{str(e) for e in exprs} for _, exprs in results[name]] == \
+            [{str(e) for e in exprs} for _, exprs in expected]
+    assert [type(node) for node, _ in results['calls']] == [Assignment]
+
+
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_expression_callback_mapper(frontend):
     """
@@ -758,6 +839,109 @@ end subroutine routine_simple
     assert all(c in conds for c in conds_no_rebuild)
 
 
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_transformer_structural_sharing(frontend):
+    """
+    Test that the transformer retains nodes without changes in their subtree.
+    """
+    fcode = """
+subroutine routine_sharing (n, a, b)
+  integer, intent(in) :: n
+  real, intent(inout) :: a(n), b(n)
+  integer :: i
+
+  do i=1,n
+    a(i) = a(i) + 1.
+  end do
+
+  do i=1,n
+    if (b(i) > 0.) then
+      b(i) = b(i) + 1.
+    end if
+  end do
+end subroutine routine_sharing
+"""
+    routine = Subroutine.from_source(fcode, frontend=frontend)
+    loops = FindNodes(Loop).visit(routine.body)
+    cond = FindNodes(Conditional).visit(routine.body)[0]
+    stmt = FindNodes(Assignment).visit(cond.body)[0]
+    new_stmt = Assignment(lhs=stmt.lhs, rhs=FloatLiteral(2.))
+
+    transformer = Transformer({stmt: new_stmt})
+    body = transformer.visit(routine.body)
+    new_loops = FindNodes(Loop).visit(body)
+
+    # Only the nodes on the path to the replaced node are rebuilt
+    assert body is not routine.body
+    assert new_loops[0] is loops[0]
+    assert new_loops[0].body is loops[0].body
+    assert new_loops[1] is not loops[1]
+    assert set(transformer.rebuilt) == {routine.body, loops[1], cond, stmt}
+    assert transformer.rebuilt[loops[1]] is new_loops[1]
+    assert FindNodes(Assignment).visit(transformer.rebuilt[cond])[0].rhs == '2.'
+
+    # Nothing changes if the mapped node is not in the tree
+    transformer = Transformer({new_stmt: stmt})
+    assert transformer.visit(routine.body) is routine.body
+    assert not transformer.rebuilt
+
+    # Without mapper, or when requested, a full copy of the tree is created
+    for transformer in (Transformer(), Transformer({new_stmt: stmt}, rebuild_unchanged=True)):
+        body = transformer.visit(routine.body)
+        assert body is not routine.body
+        assert not any(l is loop for l, loop in zip(FindNodes(Loop).visit(body), loops))
+        assert fgen(body) == fgen(routine.body)
+
+
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_transformer_rebuild_without_validation(frontend):
+    """
+    Test that IR nodes can be created and rebuilt without validation.
+    """
+    fcode = """
+subroutine routine_simple (x, y, vector, matrix)
+  integer, intent(in) :: x, y
+  real, intent(inout) :: vector(x), matrix(x, y)
+  integer :: i, j
+
+  do i=1, x
+    vector(i) = vector(i) + 1.
+    do j=1, y
+      if (j > i) then
+        matrix(i, j) = real(i * j) + 1.
+      end if
+    end do
+  end do
+end subroutine routine_simple
+"""
+    routine = Subroutine.from_source(fcode, frontend=frontend)
+    ref_code = routine.to_fortran()
+
+    # Invalid arguments are rejected in validation mode
+    with pytest.raises(ValidationError):
+        Comment(text='! comment', label=('label',))
+
+    with config_override({'ir-validation': False}):
+        fast_routine = Subroutine.from_source(fcode, frontend=frontend)
+        assert fast_routine.to_fortran() == ref_code
+
+        # Rebuild the IR with a modified statement
+        stmt = FindNodes(Assignment).visit(fast_routine.body)[0]
+        mapper = {stmt: Assignment(lhs=stmt.lhs, rhs=FloatLiteral(2.))}
+        body = Transformer(mapper, inplace=False).visit(fast_routine.body)
+        assert fgen(body).count('vector(i) = 2.') == 1
+        assert len(FindNodes(Loop).visit(body)) == 2
+
+        # List arguments for bodies are normalized to tuples
+        assert Section(body=[stmt]).body == (stmt,)
+
+        # Arguments are stored as given
+        assert Comment(text='! comment', label=('label',)).label == ('label',)
+
+    with pytest.raises(ValidationError):
+        Comment(text='! comment', label=('label',))
+
+
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_transformer_multinode_keys(frontend):
     """
@@ -1155,6 +1339,69 @@ end subroutine test_is_child_of
         assert all(not is_child_of(node, a) for a in assignments)
 
 
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_node_index(frontend):
+    """
+    Test the :any:`NodeIndex` and its use for type queries in program units.
+    """
+    fcode = """
+subroutine test_node_index
+  implicit none
+  integer :: a, j, n=10
+
+  a = 0
+  do j=1,n
+    if (j > 3) then
+      a = a + 1
+    end if
+  end do
+end subroutine test_node_index
+    """.strip()
+    routine = Subroutine.from_source(fcode, frontend=frontend)
+    index = NodeIndex(routine.body)
+    assert index.is_valid(routine.body)
+
+    # Type queries yield the same result as FindNodes
+    for match in (Loop, Conditional, Assignment, (Loop, Assignment)):
+        assert index.find(match) == FindNodes(match).visit(routine.body)
+
+    loop = index.find(Loop)[0]
+    conditional = index.find(Conditional)[0]
+    assignments = index.find(Assignment)
+    assert index.find(Assignment, root=loop) == assignments[1:]
+    assert index.find(Loop, root=loop) == [loop]
+    assert index.parent(conditional) is loop
+    assert index.parent(loop) is routine.body
+    assert index.parent(routine.body) is None
+
+    # Relations match the traversal-based utilities
+    for node in [loop, conditional]:
+        for a in assignments:
+            assert index.is_child_of(a, node) == is_child_of(a, node)
+            assert index.is_parent_of(node, a) == is_parent_of(node, a)
+        assert not index.is_child_of(node, node)
+
+    # In-place updates invalidate the index
+    routine.body.append(Comment(text='! Some comment'))
+    assert not index.is_valid()
+    assert routine.body.body[-1] not in index
+
+    # The per-unit index is rebuilt on demand
+    assert routine.node_index is routine.node_index
+    assert routine.node_index.find(Comment, root=routine.body)[-1] is routine.body.body[-1]
+    assert len(routine.declarations) == 1
+    routine.spec = routine.spec.clone(body=routine.spec.body[:1])
+    assert routine.declarations == ()
+
+    # In-place updates of other program units do not invalidate the index
+    index = routine.node_index
+    other = Subroutine.from_source(fcode, frontend=frontend)
+    other.body.append(Comment(text='! Some other comment'))
+    assert routine.node_index is index
+    routine.body.append(Comment(text='! Another comment'))
+    assert routine.node_index is not index
+
+
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_attach_scopes_associates(frontend):
     fcode = """
@@ -39,6 +39,9 @@ class SCCBaseTransformation(Transformation):
         ``'openacc'`` or ``None``.
     """
 
+    # Kernels and drivers are sanitised only in the processed routine
+    item_local = True
+
     def __init__(self, horizontal, directive=None):
         self.horizontal = horizontal
 
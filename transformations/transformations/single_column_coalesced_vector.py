@@ -33,6 +33,9 @@ class SCCDevectorTransformation(Transformation):
         nodes that are not assignments involving vector parallel arrays.
     """
 
+    # Vector loops are stripped only in the processed routine
+    item_local = True
+
     def __init__(self, horizontal, trim_vector_sections=False):
         self.horizontal = horizontal
         self.trim_vector_sections = trim_vector_sections
@@ -247,6 +250,9 @@ class SCCRevectorTransformation(Transformation):
         to define the horizontal data dimension and iteration space.
     """
 
+    # Vector sections are wrapped only in the processed routine
+    item_local = True
+
     def __init__(self, horizontal):
         self.horizontal = horizontal
 
@@ -307,6 +313,9 @@ class SCCDemoteTransformation(Transformation):
         to define the horizontal data dimension and iteration space.
     """
 
+    # Local arrays are demoted only in the processed routine
+    item_local = True
+
     def __init__(self, horizontal, demote_local_arrays=True):
         self.horizontal = horizontal
 
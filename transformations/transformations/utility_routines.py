@@ -51,6 +51,9 @@ class DrHookTransformation(Transformation):
     mode : str
         Transformation mode to insert into DrHook labels
     """
+    # DrHook calls are modified only in the processed routine
+    item_local = True
+
     def __init__(self, remove=False, mode=None, **kwargs):
         self.remove = remove
         self.mode = mode